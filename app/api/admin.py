@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Request
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 import yaml
 
 from app.core.auth import require_admin
 from app.core.config import get_settings, load_app_config, reload_app_config
-from app.core.scheduler import start_scheduler
+from app.core.scheduler import reload_scheduler
 from app.core.telemetry import TelemetryStore
+from app.core.workers import ROLE_FOLLOWER, call_owner, worker_role
 
 router = APIRouter()
 
@@ -66,6 +69,12 @@ def _validate_hospital(hospital: dict) -> list[str]:
         if db_type == "mssql":
             if not str(db.get("host", "")).strip():
                 errors.append("db.host 필요")
+        for fetch_key in ("arraysize", "prefetchrows"):
+            fetch_value = db.get(fetch_key)
+            if fetch_value is not None and (
+                not isinstance(fetch_value, int) or fetch_value <= 0
+            ):
+                errors.append(f"db.{fetch_key} 양수 필요")
 
     api = hospital.get("api") or {}
     if connector_type == "pull_rest_api":
@@ -100,38 +109,190 @@ def _validate_hospital(hospital: dict) -> list[str]:
     return errors
 
 
+LOG_PAGE_SIZE = 50
+
+
+def _log_item(row: tuple) -> dict:
+    """로그 행을 딕셔너리로 변환
+
+    Args:
+        row: 로그 행
+
+    Returns:
+        로그 딕셔너리
+    """
+    return {
+        "timestamp": row[0],
+        "level": row[1],
+        "event": row[2],
+        "hospital_id": row[3],
+        "stage": row[4],
+        "error_code": row[5],
+        "message": row[6],
+        "duration_ms": row[7],
+        "record_count": row[8],
+        "log_id": row[9],
+    }
+
+
+def _log_page(
+    filters: dict, before: int | None, limit: int
+) -> tuple[list[dict], int | None]:
+    """필터 조건의 로그 한 페이지와 다음 페이지 커서를 조회
+
+    Args:
+        filters: 로그 필터
+        before: 이전 페이지의 마지막 `log_id`
+        limit: 페이지 크기
+
+    Returns:
+        로그 목록, 다음 페이지 커서(마지막 페이지면 None)
+    """
+    rows = TelemetryStore().query_log_page(filters, before, limit + 1)
+    logs = [_log_item(row) for row in rows[:limit]]
+    next_cursor = logs[-1]["log_id"] if len(rows) > limit else None
+    return logs, next_cursor
+
+
+def _filter_time(value: datetime | None) -> str | None:
+    """시각 필터를 UTC 기준 ISO 문자열로 변환
+
+    시간대가 없는 값(`datetime-local` 입력)은 UTC로 본다.
+
+    Args:
+        value: 시각 필터
+
+    Returns:
+        초 단위 ISO 8601 문자열 또는 None
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="seconds")
+
+
+def _log_filters(
+    level: str | None,
+    hospital_id: str | None,
+    event: str | None,
+    error_code: str | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> dict:
+    """비어 있지 않은 로그 필터만 모음
+
+    Returns:
+        로그 필터
+    """
+    filters = {
+        "level": level.upper() if level else None,
+        "hospital_id": hospital_id,
+        "event": event,
+        "error_code": error_code,
+        "start": _filter_time(start),
+        "end": _filter_time(end),
+    }
+    return {key: value for key, value in filters.items() if value}
+
+
 @router.get("/logs", response_class=HTMLResponse)
-def admin_logs(request: Request, admin: None = Depends(require_admin)) -> HTMLResponse:
+def admin_logs(
+    request: Request,
+    level: str | None = None,
+    hospital_id: str | None = None,
+    event: str | None = None,
+    error_code: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    before: int | None = None,
+    admin: None = Depends(require_admin),
+) -> HTMLResponse:
     """로그 페이지 렌더링
 
     Args:
         request: FastAPI 요청 객체
+        level: 로그 레벨 필터
+        hospital_id: 병원 식별자 필터
+        event: 이벤트 필터
+        error_code: 에러 코드 필터
+        start: 시작 시각(포함)
+        end: 종료 시각(미포함)
+        before: 이전 페이지의 마지막 `log_id`
         admin: 관리자 인증 의존성
 
     Returns:
         HTML 응답
     """
-    rows = TelemetryStore().query_logs("", [])
-    logs = [
-        {
-            "timestamp": row[0],
-            "level": row[1],
-            "event": row[2],
-            "hospital_id": row[3],
-            "stage": row[4],
-            "error_code": row[5],
-            "message": row[6],
-            "duration_ms": row[7],
-            "record_count": row[8],
-        }
-        for row in rows
-    ]
+    filters = _log_filters(level, hospital_id, event, error_code, start, end)
+    logs, next_cursor = _log_page(filters, before, LOG_PAGE_SIZE)
     return templates.TemplateResponse(
         "admin/logs.html",
-        {"request": request, "logs": logs},
+        {
+            "request": request,
+            "logs": logs,
+            "filters": filters,
+            "next_cursor": next_cursor,
+        },
     )
 
 
+@router.get("/api/logs")
+def admin_api_logs(
+    level: str | None = None,
+    hospital_id: str | None = None,
+    event: str | None = None,
+    error_code: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    before: int | None = None,
+    limit: int = Query(LOG_PAGE_SIZE, ge=1, le=500),
+    admin: None = Depends(require_admin),
+) -> dict:
+    """로그를 최신순 키셋 페이지로 조회하는 JSON API
+
+    Args:
+        level: 로그 레벨 필터
+        hospital_id: 병원 식별자 필터
+        event: 이벤트 필터
+        error_code: 에러 코드 필터
+        start: 시작 시각(포함)
+        end: 종료 시각(미포함)
+        before: 이전 페이지의 `next_cursor`
+        limit: 페이지 크기
+        admin: 관리자 인증 의존성
+
+    Returns:
+        items, next_cursor
+    """
+    filters = _log_filters(level, hospital_id, event, error_code, start, end)
+    logs, next_cursor = _log_page(filters, before, limit)
+    return {"items": logs, "next_cursor": next_cursor}
+
+
+@router.get("/api/rollups")
+def admin_api_rollups(
+    granularity: str = Query("hour", pattern="^(minute|hour)$"),
+    hours: int = Query(24, ge=1, le=24 * 90),
+    hospital_id: str | None = None,
+    admin: None = Depends(require_admin),
+) -> dict:
+    """병원/구간별 텔레메트리 롤업을 조회하는 JSON API
+
+    Args:
+        granularity: minute 또는 hour
+        hours: 조회할 최근 시간 범위
+        hospital_id: 병원 식별자 필터
+        admin: 관리자 인증 의존성
+
+    Returns:
+        items
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    items = TelemetryStore().query_rollups(granularity, since, hospital_id)
+    return {"items": items}
+
+
 @router.get("/status", response_class=HTMLResponse)
 def admin_status(
     request: Request, admin: None = Depends(require_admin)
@@ -200,7 +361,7 @@ async def save_config(
     config = load_app_config().model_dump()
     form_data = await request.form()
 
-    hospital = config.get("hospital", {})
+    hospital = config.get("hospital") or {}
     prefix = "hospital-"
     hospital_id = form_data.get(prefix + "hospital_id")
     connector_type = form_data.get(prefix + "connector_type")
@@ -321,6 +482,11 @@ async def save_config(
     config["hospital"] = hospital
 
     errors = _validate_hospital(config.get("hospital", {}))
+    if any(
+        other.get("hospital_id") == hospital.get("hospital_id")
+        for other in config.get("hospitals") or []
+    ):
+        errors.append("hospital_id 중복")
     if errors:
         return templates.TemplateResponse(
             "admin/config.html",
@@ -330,8 +496,11 @@ async def save_config(
     with open(settings.config_path, "w", encoding="utf-8") as handle:
         yaml.safe_dump(config, handle, allow_unicode=True, sort_keys=False)
 
-    if get_settings().scheduler_enabled:
-        start_scheduler(reload_app_config())
+    if worker_role() == ROLE_FOLLOWER:
+        reload_app_config()
+        call_owner("reload_scheduler")
+    else:
+        reload_scheduler()
 
     return templates.TemplateResponse(
         "admin/config.html",
@@ -364,26 +533,21 @@ def admin_dashboard(
         }
         for row in rows
     ]
-    log_rows = TelemetryStore().query_logs("", [])
-    recent_logs = [
-        {
-            "timestamp": row[0],
-            "level": row[1],
-            "event": row[2],
-            "hospital_id": row[3],
-            "stage": row[4],
-            "error_code": row[5],
-            "message": row[6],
-            "duration_ms": row[7],
-            "record_count": row[8],
-        }
-        for row in log_rows
-    ]
+    recent_logs, _ = _log_page({}, None, 5)
+    store = TelemetryStore()
+    now = datetime.now(timezone.utc)
+    today = store.query_rollup_summary(
+        now.replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+    last_day = store.query_rollup_summary(now - timedelta(hours=24))
+    runs = last_day["runs"]
     stats = {
-        "total_hospitals": 1 if load_app_config().hospital else 0,
-        "today_records": 0,
-        "success_rate": None,
-        "error_count": 0,
+        "total_hospitals": len(load_app_config().all_hospitals()),
+        "today_records": today["records"],
+        "success_rate": (
+            round((runs - last_day["failures"]) * 100 / runs, 1) if runs else None
+        ),
+        "error_count": last_day["errors"],
     }
     return templates.TemplateResponse(
         "admin/dashboard.html",
@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.core.config import get_settings
+from app.core.readiness import hospital_readiness
+from app.core.scheduler import scheduled_hospitals, scheduler_running
+from app.core.spool import spool_backlogs
+from app.core.workers import ROLE_FOLLOWER, call_owner, worker_role
 
 router = APIRouter()
 
@@ -7,3 +13,67 @@ router = APIRouter()
 def health_check() -> dict:
     """서비스 헬스 상태를 반환"""
     return {"status": "정상"}
+
+
+def readiness_report() -> tuple[bool, dict]:
+    """병원별 수집 지연과 대기열 상태로 준비 여부를 계산
+
+    DuckDB를 조회하지 않고 메모리 상태만 읽는다. 스풀을 쓰지 않거나 아직 열리지
+    않은 병원의 `backlog`는 None이다.
+
+    Returns:
+        (준비 여부, 응답 본문)
+    """
+    settings = get_settings()
+    running = scheduler_running()
+    backlogs = spool_backlogs()
+    hospitals = []
+    for hospital in scheduled_hospitals():
+        entry = hospital_readiness(
+            hospital.hospital_id,
+            settings.readiness_stale_factor * hospital.schedule_minutes * 60,
+        )
+        backlog = (
+            backlogs.get(hospital.hospital_id)
+            if (hospital.spool or {}).get("enabled")
+            else None
+        )
+        entry["backlog"] = backlog["depth"] if backlog else None
+        entry["oldest_pending_age_seconds"] = (
+            backlog["oldest_age_seconds"] if backlog else None
+        )
+        hospitals.append(entry)
+    ready = (running or not settings.scheduler_enabled) and not any(
+        entry["stale"] for entry in hospitals
+    )
+    return ready, {
+        "status": "준비" if ready else "지연",
+        "scheduler_running": running,
+        "hospitals": hospitals,
+    }
+
+
+@router.get("/health/ready")
+def readiness_check(response: Response) -> dict:
+    """병원별 수집 지연과 대기열 상태로 준비 여부를 반환
+
+    짧은 주기로 호출해도 된다. 스케줄러가 멈췄거나 마지막 성공 후
+    `schedule_minutes` x `READINESS_STALE_FACTOR`가 지난 병원이 있으면 503을
+    반환한다. 다중 워커 모드의 follower는 스케줄러를 가진 owner의 결과를 전달한다.
+
+    Args:
+        response: 상태 코드를 지정할 응답 객체
+
+    Returns:
+        status, scheduler_running, hospitals
+    """
+    if worker_role() == ROLE_FOLLOWER:
+        try:
+            ready, body = call_owner("readiness")
+        except (OSError, EOFError):
+            ready, body = False, {"status": "지연", "owner_reachable": False}
+    else:
+        ready, body = readiness_report()
+    if not ready:
+        response.status_code = 503
+    return body
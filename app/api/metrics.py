@@ -0,0 +1,48 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse, Response
+
+from app.core.metrics import (
+    CONTENT_TYPE,
+    merge_metric_deltas,
+    render_metrics,
+    take_metric_deltas,
+)
+from app.core.workers import ROLE_FOLLOWER, call_owner, worker_role
+
+router = APIRouter()
+
+
+def push_follower_metrics() -> None:
+    """follower에 쌓인 카운터와 히스토그램 증가분을 owner에 더함
+
+    보내지 못한 증가분은 로컬 지표에 되돌려 다음 전송(또는 owner 승격 후
+    렌더링)에 포함한다.
+
+    Raises:
+        OSError: owner에 연결할 수 없는 경우
+        EOFError: 응답 전에 owner와의 연결이 끊긴 경우
+        RuntimeError: owner에서 병합이 실패한 경우
+    """
+    deltas = take_metric_deltas()
+    try:
+        call_owner("merge_metrics", deltas)
+    except Exception:
+        merge_metric_deltas(deltas)
+        raise
+
+
+@router.get("/metrics")
+def metrics() -> Response:
+    """Prometheus 텍스트 형식으로 지표를 반환
+
+    다중 워커 모드의 follower는 자기 지표 증가분을 owner에 더한 뒤 owner의 지표를
+    전달한다. owner에 연결할 수 없으면(재시작 중 등) 503을 반환한다.
+    """
+    if worker_role() == ROLE_FOLLOWER:
+        try:
+            push_follower_metrics()
+            body = call_owner("metrics")
+        except (OSError, EOFError):
+            return PlainTextResponse("owner worker unreachable\n", status_code=503)
+        return Response(body, media_type=CONTENT_TYPE)
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
@@ -1,29 +1,38 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
-from app.clients.backend_api import send_payload
+from app.clients.backend_api import send_encoded
 from app.core.config import load_app_config
 from app.transforms.hospital_profiles.HOSP_A.inbound import to_canonical
 from app.core.postprocess import run_postprocess
-from app.transforms.hospital_profiles.HOSP_A.outbound import from_backend, to_backend
+from app.transforms.hospital_profiles.HOSP_A.outbound import (
+    encode_backend,
+    from_backend,
+)
 
 router = APIRouter()
 
 
 @router.post("/push")
-def push_vitals(payload: dict) -> dict:
+def push_vitals(payload: dict, hospital_id: str | None = None) -> dict:
     """병원 푸시 페이로드를 수신
 
     Args:
         payload: 병원 원본 페이로드
+        hospital_id: 병원 식별자(생략하면 첫 번째 병원)
 
     Returns:
         처리 결과
     """
     config = load_app_config()
-    hospital = config.hospital
+    if hospital_id is None:
+        hospitals = config.all_hospitals()
+        hospital = hospitals[0] if hospitals else None
+    else:
+        hospital = config.find_hospital(hospital_id)
+    if hospital is None:
+        raise HTTPException(status_code=404, detail="병원 설정 없음")
     canonical = to_canonical(payload)
-    backend_payload = to_backend(canonical)
-    response = send_payload(backend_payload)
+    response = send_encoded(encode_backend(canonical))
     postprocess_ok, postprocess_code = run_postprocess(hospital, canonical.model_dump())
     if not postprocess_ok:
         return {"status": "postprocess_failed", "error_code": postprocess_code}
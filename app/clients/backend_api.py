@@ -1,24 +1,306 @@
 from __future__ import annotations
 
+import importlib.util
+import json
+import logging
+import threading
+import time
+from typing import Iterator
+
 import httpx
 
 from app.core.config import get_settings
+from app.core.errors import PipelineError
+from app.core.metrics import current_hospital, observe_backend_status
+from app.core.readiness import record_backend_latency
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-def send_payload(payload: dict) -> dict:
-    """백엔드 API로 페이로드를 전송
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
-    Args:
-        payload: 백엔드 페이로드
+
+def _client_options() -> dict:
+    """동기/비동기 백엔드 클라이언트 공통 옵션을 구성
 
     Returns:
-        백엔드 응답 페이로드
+        httpx 클라이언트 생성 인자
     """
     settings = get_settings()
     headers = {}
     if settings.backend_api_key:
         headers["Authorization"] = f"Bearer {settings.backend_api_key}"
-    with httpx.Client(timeout=10.0) as client:
-        response = client.post(settings.backend_base_url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    http2 = settings.backend_http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logging.getLogger("vtc-link").warning(
+            "h2 패키지가 없어 HTTP/1.1로 연결", extra={"event": "backend_client"}
+        )
+        http2 = False
+    return {
+        "headers": headers,
+        "timeout": settings.backend_timeout_seconds,
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=settings.backend_max_connections,
+            max_keepalive_connections=settings.backend_max_keepalive_connections,
+            keepalive_expiry=settings.backend_keepalive_expiry_seconds,
+        ),
+    }
+
+
+def _mark_sent(request: httpx.Request) -> None:
+    """요청 전송 시각을 요청 확장 정보에 기록
+
+    Args:
+        request: 백엔드 요청
+    """
+    request.extensions["vtc_sent_at"] = time.perf_counter()
+
+
+async def _mark_sent_async(request: httpx.Request) -> None:
+    """비동기 클라이언트용 요청 전송 시각 기록 훅
+
+    Args:
+        request: 백엔드 요청
+    """
+    _mark_sent(request)
+
+
+def _record_status(response: httpx.Response) -> None:
+    """백엔드 응답 상태 코드와 왕복 지연을 기록
+
+    Args:
+        response: 백엔드 응답
+    """
+    observe_backend_status(response.status_code)
+    sent_at = response.request.extensions.get("vtc_sent_at")
+    if sent_at is not None:
+        record_backend_latency(
+            current_hospital(), (time.perf_counter() - sent_at) * 1000
+        )
+
+
+async def _record_status_async(response: httpx.Response) -> None:
+    """비동기 클라이언트용 응답 상태 코드/왕복 지연 기록 훅
+
+    Args:
+        response: 백엔드 응답
+    """
+    _record_status(response)
+
+
+def _build_client() -> httpx.Client:
+    """설정값으로 백엔드 HTTP 클라이언트를 생성
+
+    Returns:
+        httpx 클라이언트
+    """
+    return httpx.Client(
+        **_client_options(),
+        event_hooks={"request": [_mark_sent], "response": [_record_status]},
+    )
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """설정값으로 비동기 백엔드 HTTP 클라이언트를 생성
+
+    이벤트 루프에 묶이므로 호출한 루프 안에서만 사용하고 닫아야 한다.
+
+    Returns:
+        httpx 비동기 클라이언트
+    """
+    return httpx.AsyncClient(
+        **_client_options(),
+        event_hooks={
+            "request": [_mark_sent_async],
+            "response": [_record_status_async],
+        },
+    )
+
+
+def get_client() -> httpx.Client:
+    """프로세스 공용 백엔드 HTTP 클라이언트를 반환
+
+    최초 호출 시 생성하며 이후 연결(keep-alive)을 재사용한다.
+
+    Returns:
+        httpx 클라이언트
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+
+def close_client() -> None:
+    """공용 백엔드 HTTP 클라이언트를 닫음"""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def send_encoded(item: bytes) -> dict:
+    """직렬화된 페이로드 한 건을 백엔드로 전송
+
+    Args:
+        item: 직렬화된 백엔드 페이로드
+
+    Returns:
+        백엔드 응답 페이로드
+    """
+    response = get_client().post(
+        get_settings().backend_base_url, content=item, headers=_JSON_HEADERS
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def batch_url() -> str:
+    """백엔드 일괄 전송 엔드포인트 URL을 반환
+
+    `BACKEND_BATCH_URL`이 없으면 `BACKEND_BASE_URL` 뒤에 `/batch`를 붙인다.
+
+    Returns:
+        일괄 전송 URL
+    """
+    settings = get_settings()
+    if settings.backend_batch_url:
+        return settings.backend_batch_url
+    return settings.backend_base_url.rstrip("/") + "/batch"
+
+
+def encode_payload(payload: dict) -> bytes:
+    """백엔드 페이로드를 JSON 바이트로 직렬화
+
+    Args:
+        payload: 백엔드 페이로드
+
+    Returns:
+        JSON 바이트
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def iter_batches(
+    items: list[bytes], max_count: int, max_bytes: int
+) -> Iterator[list[bytes]]:
+    """직렬화된 페이로드를 건수와 바이트 크기 기준으로 묶음
+
+    단일 항목이 `max_bytes`보다 크면 그 항목만으로 배치를 만든다.
+
+    Args:
+        items: 직렬화된 페이로드 목록
+        max_count: 배치당 최대 건수
+        max_bytes: 배치당 최대 바이트(0이면 제한 없음)
+
+    Yields:
+        배치
+    """
+    batch: list[bytes] = []
+    batch_bytes = 0
+    for item in items:
+        item_bytes = len(item) + 1
+        if batch and (
+            len(batch) >= max_count
+            or (max_bytes and batch_bytes + item_bytes > max_bytes)
+        ):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += item_bytes
+    if batch:
+        yield batch
+
+
+def _batch_body(items: list[bytes]) -> bytes:
+    """직렬화된 페이로드 목록으로 일괄 요청 본문을 구성
+
+    Args:
+        items: 직렬화된 페이로드 목록
+
+    Returns:
+        요청 본문 바이트
+    """
+    return b'{"records":[' + b",".join(items) + b"]}"
+
+
+def _batch_results(response: httpx.Response, expected: int) -> list[dict]:
+    """일괄 응답에서 항목별 결과를 추출
+
+    Args:
+        response: 백엔드 응답
+        expected: 요청 항목 수
+
+    Returns:
+        항목별 백엔드 응답 목록
+
+    Raises:
+        PipelineError: 응답 건수가 요청과 다를 때
+    """
+    response.raise_for_status()
+    results = response.json().get("results", [])
+    if len(results) != expected:
+        raise PipelineError(
+            "API_RESP_001", f"배치 응답 건수 불일치: {len(results)}/{expected}"
+        )
+    return results
+
+
+def send_batch(items: list[bytes]) -> list[dict]:
+    """직렬화된 페이로드 묶음을 백엔드 일괄 엔드포인트로 전송
+
+    요청 본문은 `{"records": [...]}`, 응답은 같은 순서의 `{"results": [...]}`이며
+    실패한 항목은 `error` 키를 가진다.
+
+    Args:
+        items: 직렬화된 페이로드 목록
+
+    Returns:
+        항목별 백엔드 응답 목록
+
+    Raises:
+        PipelineError: 응답 건수가 요청과 다를 때
+    """
+    response = get_client().post(
+        batch_url(), content=_batch_body(items), headers=_JSON_HEADERS
+    )
+    return _batch_results(response, len(items))
+
+
+async def send_encoded_async(client: httpx.AsyncClient, item: bytes) -> dict:
+    """직렬화된 페이로드 한 건을 비동기로 전송
+
+    Args:
+        client: 비동기 클라이언트
+        item: 직렬화된 페이로드
+
+    Returns:
+        백엔드 응답 페이로드
+    """
+    response = await client.post(
+        get_settings().backend_base_url, content=item, headers=_JSON_HEADERS
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def send_batch_async(client: httpx.AsyncClient, items: list[bytes]) -> list[dict]:
+    """직렬화된 페이로드 묶음을 비동기로 일괄 전송
+
+    Args:
+        client: 비동기 클라이언트
+        items: 직렬화된 페이로드 목록
+
+    Returns:
+        항목별 백엔드 응답 목록
+    """
+    response = await client.post(
+        batch_url(), content=_batch_body(items), headers=_JSON_HEADERS
+    )
+    return _batch_results(response, len(items))
@@ -1,24 +1,67 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 from app.core.config import HospitalConfig
-from app.core.db import oracle_connection
+from app.core.db import incremental_query, oracle_connection
 
+DEFAULT_ARRAYSIZE = 500
 
-def fetch_records(config: HospitalConfig) -> list[dict]:
-    """Oracle 뷰에서 레코드를 조회
+
+def iter_records(
+    config: HospitalConfig, last_mark: object | None = None
+) -> Iterator[list[dict]]:
+    """Oracle 뷰에서 레코드를 청크 단위로 조회
+
+    `db.arraysize` 크기만큼 `fetchmany`로 읽어 청크를 순차 반환하므로
+    메모리 사용량은 뷰 전체가 아닌 청크 크기에 비례한다.
+    `db.watermark_column`이 설정되면 마지막 워터마크 이후 행만 정렬해 조회하고,
+    `db.watermark_key_column`이 있으면 (컬럼, 키) 쌍을 워터마크로 쓴다.
 
     Args:
         config: 병원 설정
+        last_mark: 마지막 워터마크 값(복합 워터마크면 (값, 키) 튜플)
 
-    Returns:
-        원본 레코드 목록
+    Yields:
+        원본 레코드 청크
     """
     if not config.db:
-        return []
+        return
     query = config.db.get("query") or f"SELECT * FROM {config.db.get('view_name')}"
+    params: list | dict = []
+    watermark_column = config.db.get("watermark_column")
+    if watermark_column:
+        query, params = incremental_query(
+            query,
+            watermark_column,
+            "oracle",
+            last_mark,
+            config.db.get("watermark_key_column"),
+        )
+    arraysize = int(config.db.get("arraysize") or DEFAULT_ARRAYSIZE)
+    prefetchrows = config.db.get("prefetchrows")
     with oracle_connection(config.db) as conn:
         cursor = conn.cursor()
-        cursor.execute(query)
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = (
+            int(prefetchrows) if prefetchrows is not None else arraysize + 1
+        )
+        cursor.execute(query, params)
         columns = [col[0] for col in cursor.description]
-        rows = cursor.fetchall()
-    return [dict(zip(columns, row)) for row in rows]
+        while True:
+            rows = cursor.fetchmany(arraysize)
+            if not rows:
+                break
+            yield [dict(zip(columns, row)) for row in rows]
+
+
+def fetch_records(config: HospitalConfig) -> list[dict]:
+    """Oracle 뷰에서 레코드를 조회
+
+    Args:
+        config: 병원 설정
+
+    Returns:
+        원본 레코드 목록
+    """
+    return [record for chunk in iter_records(config) for record in chunk]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+import httpx
+
+OVERLOAD_STATUS_CODES = {429, 502, 503, 504}
+
+
+def is_overload_error(exc: Exception) -> bool:
+    """백엔드 과부하 신호인 예외인지 판별
+
+    Args:
+        exc: 전송 예외
+
+    Returns:
+        429/5xx 응답 또는 타임아웃이면 True
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status in OVERLOAD_STATUS_CODES or status >= 500
+    return False
+
+
+def _percentile(sorted_values: list[float], ratio: float) -> float | None:
+    """정렬된 값 목록에서 백분위수를 계산
+
+    Args:
+        sorted_values: 오름차순 정렬된 값 목록
+        ratio: 0~1 사이 백분위 비율
+
+    Returns:
+        백분위수 또는 None
+    """
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 1)
+
+
+class AdaptiveLimiter:
+    """백엔드 지연과 과부하 응답에 따라 동시 요청 수와 배치 크기를 조절
+
+    AIMD 방식으로 목표 지연 이내의 성공 응답마다 한도를 조금씩 늘리고
+    429/5xx/타임아웃이나 목표 지연 초과 시 한도를 배수로 줄인다.
+    감소는 최근 지연 시간 동안 한 번만 적용해 같은 구간의 실패가 겹쳐도
+    한도가 한꺼번에 바닥까지 떨어지지 않도록 한다.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        initial_limit: int | None = None,
+        min_batch_size: int = 1,
+        max_batch_size: int = 1,
+        latency_target_ms: float = 500.0,
+        decrease_factor: float = 0.5,
+        window: int = 512,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.min_batch_size = max(1, min_batch_size)
+        self.max_batch_size = max(self.min_batch_size, max_batch_size)
+        self.latency_target_ms = latency_target_ms
+        self.decrease_factor = min(max(decrease_factor, 0.1), 0.9)
+        start = int(initial_limit) if initial_limit is not None else self.min_limit
+        self._limit = float(min(max(start, self.min_limit), self.max_limit))
+        self._batch_size = float(self.min_batch_size)
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._overloads = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """현재 허용 동시 요청 수"""
+        return int(self._limit)
+
+    @property
+    def batch_size(self) -> int:
+        """현재 배치 크기"""
+        return int(self._batch_size)
+
+    def on_success(self, latency_ms: float) -> None:
+        """성공 응답을 반영
+
+        Args:
+            latency_ms: 요청 지연(밀리초)
+        """
+        with self._lock:
+            self._latencies.append(latency_ms)
+            self._successes += 1
+            if latency_ms > self.latency_target_ms:
+                self._decrease_locked(latency_ms)
+                return
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._batch_size = min(
+                self.max_batch_size, self._batch_size + 1.0 / max(self._limit, 1.0)
+            )
+
+    def on_overload(self, latency_ms: float) -> None:
+        """과부하 신호(429/5xx/타임아웃)를 반영
+
+        Args:
+            latency_ms: 요청 지연(밀리초)
+        """
+        with self._lock:
+            self._latencies.append(latency_ms)
+            self._overloads += 1
+            self._decrease_locked(latency_ms)
+
+    def _decrease_locked(self, latency_ms: float) -> None:
+        """한도와 배치 크기를 배수로 감소(락 보유 상태에서 호출)
+
+        Args:
+            latency_ms: 요청 지연(밀리초)
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < max(latency_ms, 100.0) / 1000:
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        self._batch_size = max(
+            self.min_batch_size, self._batch_size * self.decrease_factor
+        )
+
+    def snapshot(self) -> dict:
+        """현재 한도와 지연 백분위수를 반환
+
+        Returns:
+            한도/배치 크기/지연 p50·p95·p99(밀리초)/성공·과부하 건수
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "limit": self.limit,
+                "batch_size": self.batch_size,
+                "latency_p50_ms": _percentile(latencies, 0.50),
+                "latency_p95_ms": _percentile(latencies, 0.95),
+                "latency_p99_ms": _percentile(latencies, 0.99),
+                "successes": self._successes,
+                "overloads": self._overloads,
+            }
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(hospital_id: str, dispatch: dict) -> AdaptiveLimiter:
+    """병원별 적응형 리미터를 조회하거나 생성
+
+    학습한 한도가 실행 사이에 유지되도록 프로세스 안에서 재사용하며,
+    설정 상한이 바뀌면 새로 만든다.
+
+    Args:
+        hospital_id: 병원 식별자
+        dispatch: 병원 dispatch 설정
+
+    Returns:
+        적응형 리미터
+    """
+    adaptive = dispatch.get("adaptive") or {}
+    max_limit = int(dispatch.get("concurrency", 1))
+    max_batch_size = int(dispatch.get("batch_size", 1))
+    with _limiters_lock:
+        limiter = _limiters.get(hospital_id)
+        if (
+            limiter is None
+            or limiter.max_limit != max(limiter.min_limit, max_limit)
+            or limiter.max_batch_size != max(limiter.min_batch_size, max_batch_size)
+        ):
+            limiter = AdaptiveLimiter(
+                min_limit=int(adaptive.get("min_concurrency", 1)),
+                max_limit=max_limit,
+                initial_limit=adaptive.get("initial_concurrency"),
+                min_batch_size=int(adaptive.get("min_batch_size", 1)),
+                max_batch_size=max_batch_size,
+                latency_target_ms=float(adaptive.get("latency_target_ms", 500)),
+                decrease_factor=float(adaptive.get("decrease_factor", 0.5)),
+            )
+            _limiters[hospital_id] = limiter
+        return limiter
+
+
+def limiter_snapshots() -> dict[str, dict]:
+    """모든 병원 리미터의 현재 상태를 반환
+
+    Returns:
+        병원 식별자별 리미터 상태
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {
+        hospital_id: limiter.snapshot() for hospital_id, limiter in limiters.items()
+    }
@@ -1,10 +1,41 @@
+import hashlib
+import json
 from functools import lru_cache
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+POOL_KEY_FIELDS = (
+    "type",
+    "dsn",
+    "host",
+    "port",
+    "service",
+    "database",
+    "driver",
+    "connection_string",
+    "username",
+    "password",
+)
+
+
+def db_pool_key(db: dict) -> str:
+    """DB 설정에서 커넥션 풀 식별 키를 생성
+
+    연결 정보가 같은 병원은 같은 풀을 공유한다.
+
+    Args:
+        db: DB 설정
+
+    Returns:
+        연결 정보 해시 키
+    """
+    identity = {field: db.get(field) for field in POOL_KEY_FIELDS}
+    encoded = json.dumps(identity, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
 
 class Settings(BaseSettings):
     """환경 변수에서 애플리케이션 설정을 로드"""
@@ -18,9 +49,37 @@ class Settings(BaseSettings):
     admin_password: str = "admin"
     backend_base_url: str = "http://localhost:9000"
     backend_api_key: str = ""
+    backend_timeout_seconds: float = 10.0
+    backend_max_connections: int = 20
+    backend_max_keepalive_connections: int = 10
+    backend_keepalive_expiry_seconds: float = 30.0
+    backend_http2: bool = False
+    backend_batch_url: str = ""
     config_path: str = "hospitals.yaml"
     duckdb_path: str = "data/telemetry.duckdb"
+    spool_dir: str = "data/spool"
+    dedup_dir: str = "data/dedup"
+    telemetry_queue_size: int = 10000
+    telemetry_batch_size: int = 500
+    telemetry_flush_interval_seconds: float = 1.0
+    telemetry_archive_dir: str = "data/telemetry_archive"
+    telemetry_hot_days: int = 7
+    telemetry_retention_days: int = 90
+    telemetry_maintenance_minutes: int = 60
     scheduler_enabled: bool = True
+    scheduler_max_workers: int = 10
+    transform_workers: int = 0
+    transform_min_records: int = 200
+    lease_backend: str = ""
+    lease_path: str = "data/leases.sqlite"
+    lease_ttl_seconds: float = 30.0
+    lease_renew_seconds: float = 10.0
+    replica_id: str = ""
+    multi_worker: bool = False
+    worker_lock_path: str = "data/worker.lock"
+    worker_socket_path: str = "data/worker.sock"
+    worker_heartbeat_seconds: float = 5.0
+    readiness_stale_factor: float = 3.0
 
 
 class HospitalConfig(BaseModel):
@@ -34,12 +93,168 @@ class HospitalConfig(BaseModel):
     postprocess: dict | None = None
     db: dict | None = None
     api: dict | None = None
+    dispatch: dict | None = None
+    spool: dict | None = None
+    dedup: dict | None = None
+    timing: dict | None = None
+    drain: dict | None = None
+
+    @model_validator(mode="after")
+    def _check_spool_source(self) -> "HospitalConfig":
+        """스풀을 쓰는 병원에 워터마크나 중복 제거가 있는지 검사
+
+        둘 다 없으면 스풀에 남아 있는 미확인 행도 매 실행 다시 조회되어 다시
+        쌓이므로 백로그가 끝없이 늘고 같은 행이 여러 번 전송된다.
+
+        Returns:
+            검증된 설정
+        """
+        if not (self.spool or {}).get("enabled"):
+            return self
+        if (self.db or {}).get("watermark_column") or (self.dedup or {}).get("enabled"):
+            return self
+        raise ValueError(
+            f"spool에는 db.watermark_column 또는 dedup.enabled가 필요함: {self.hospital_id}"
+        )
+
+    @model_validator(mode="after")
+    def _check_pool_size(self) -> "HospitalConfig":
+        """뷰 조회와 후처리를 함께 쓰는 병원의 커넥션 풀 크기를 검사
+
+        스트리밍 조회가 연결 하나를 쥔 채 청크마다 후처리가 연결을 하나 더 빌리므로
+        실행 한 번에 연결 두 개가 필요하다. 풀이 그보다 작으면 후처리가 조회 연결
+        반납을 기다리며 멈춘다.
+
+        Returns:
+            검증된 설정
+        """
+        if self.connector_type != "pull_db_view" or not self.db or not self.postprocess:
+            return self
+        pool = self.db.get("pool") or {}
+        if not pool.get("enabled", True):
+            return self
+        if int(pool.get("max_size", 4)) < 2:
+            raise ValueError(f"db.pool.max_size는 2 이상이어야 함: {self.hospital_id}")
+        return self
 
 
 class AppConfig(BaseModel):
-    """단일 병원 설정 래퍼"""
+    """병원 설정 래퍼
+
+    기존 단일 `hospital` 항목과 여러 병원을 담는 `hospitals` 목록을 함께 허용한다.
+    """
+
+    hospital: HospitalConfig | None = None
+    hospitals: list[HospitalConfig] = []
+
+    @model_validator(mode="after")
+    def _check_unique_ids(self) -> "AppConfig":
+        """병원 식별자 중복을 검사
+
+        Returns:
+            검증된 설정
+        """
+        seen: set[str] = set()
+        for hospital in self.all_hospitals():
+            if hospital.hospital_id in seen:
+                raise ValueError(f"hospital_id 중복: {hospital.hospital_id}")
+            seen.add(hospital.hospital_id)
+        return self
+
+    @model_validator(mode="after")
+    def _check_shared_pools(self) -> "AppConfig":
+        """같은 DB 연결(풀)을 공유하는 병원들의 풀 설정과 크기를 검사
+
+        풀은 연결 정보별로 하나라서 먼저 만든 병원의 설정이 모두에게 적용되므로,
+        공유하는 병원의 `db.pool` 설정은 같아야 한다. 실행 중인 병원은 각자 연결을
+        쥔 채 더 빌릴 수 있으므로 `max_size`는 병원별 필요 연결 수(조회와 후처리를
+        함께 쓰는 뷰 조회 병원 2, 나머지 1)의 합 이상이어야 한다.
+
+        Returns:
+            검증된 설정
+        """
+        groups: dict[str, list[HospitalConfig]] = {}
+        for hospital in self.all_hospitals():
+            if not hospital.enabled or not hospital.db:
+                continue
+            if not (hospital.db.get("pool") or {}).get("enabled", True):
+                continue
+            groups.setdefault(db_pool_key(hospital.db), []).append(hospital)
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            ids = ", ".join(member.hospital_id for member in members)
+            options = [
+                {
+                    key: value
+                    for key, value in (member.db.get("pool") or {}).items()
+                    if key != "enabled"
+                }
+                for member in members
+            ]
+            if any(option != options[0] for option in options[1:]):
+                raise ValueError(
+                    f"같은 DB 연결을 쓰는 병원의 db.pool 설정이 다름: {ids}"
+                )
+            required = sum(
+                (
+                    2
+                    if member.connector_type == "pull_db_view" and member.postprocess
+                    else 1
+                )
+                for member in members
+            )
+            if int(options[0].get("max_size", 4)) < required:
+                raise ValueError(
+                    f"같은 DB 연결을 쓰는 병원({ids})의 db.pool.max_size는 "
+                    f"{required} 이상이어야 함"
+                )
+        return self
+
+    @model_validator(mode="after")
+    def _check_lease_spool(self) -> "AppConfig":
+        """lease 분할(`LEASE_BACKEND`)과 스풀을 함께 쓰는 수집 병원을 거부
+
+        스풀은 복제본의 로컬 디스크에 남지만 공유 워터마크는 스풀에 넣는 즉시
+        전진하므로, 병원이 다른 복제본으로 넘어가면 아직 보내지 못한 레코드가 이전
+        복제본에 남아 다시 전송되지 않는다.
+
+        Returns:
+            검증된 설정
+        """
+        if not get_settings().lease_backend.strip():
+            return self
+        for hospital in self.all_hospitals():
+            if not hospital.enabled or not hospital.connector_type.startswith("pull_"):
+                continue
+            if (hospital.spool or {}).get("enabled"):
+                raise ValueError(
+                    f"LEASE_BACKEND 사용 시 수집 병원은 spool을 쓸 수 없음: "
+                    f"{hospital.hospital_id}"
+                )
+        return self
+
+    def all_hospitals(self) -> list[HospitalConfig]:
+        """단일 항목과 목록을 합친 전체 병원 설정
+
+        Returns:
+            병원 설정 목록(단일 `hospital` 항목이 먼저)
+        """
+        return ([self.hospital] if self.hospital else []) + list(self.hospitals)
+
+    def find_hospital(self, hospital_id: str) -> HospitalConfig | None:
+        """식별자로 병원 설정을 찾음
+
+        Args:
+            hospital_id: 병원 식별자
 
-    hospital: HospitalConfig
+        Returns:
+            병원 설정 또는 None
+        """
+        for hospital in self.all_hospitals():
+            if hospital.hospital_id == hospital_id:
+                return hospital
+        return None
 
 
 @lru_cache
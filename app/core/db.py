@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import re
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Callable, Iterator
 
 import oracledb
 import pyodbc
 
+from app.core.config import db_pool_key
+
 
 def _oracle_dsn(db: dict) -> str:
     """Oracle DSN 구성
@@ -58,16 +64,497 @@ def _mssql_conn_str(db: dict) -> str:
     return ";".join(parts)
 
 
+def _strip_order_by(query: str) -> str:
+    """기본 쿼리 끝의 최상위 ORDER BY 절을 제거
+
+    MSSQL은 TOP/OFFSET 없이 ORDER BY를 포함한 서브쿼리를 거부하므로, 정렬은
+    바깥 쿼리에서만 한다. 괄호 안(서브쿼리, 윈도 함수)의 ORDER BY는 유지한다.
+
+    Args:
+        query: 기본 조회 쿼리
+
+    Returns:
+        최상위 ORDER BY를 뺀 쿼리
+    """
+    position = -1
+    for match in re.finditer(r"\bORDER\s+BY\b", query, re.IGNORECASE):
+        prefix = query[: match.start()]
+        if prefix.count("(") == prefix.count(")"):
+            position = match.start()
+    if position < 0:
+        return query
+    return query[:position].rstrip()
+
+
+def incremental_query(
+    query: str,
+    column: str,
+    db_type: str,
+    last_mark: object | None,
+    key_column: str | None = None,
+) -> tuple[str, list | dict]:
+    """워터마크 컬럼 기준 증분 조회 쿼리 구성
+
+    기본 쿼리를 서브쿼리로 감싸 `column > last_mark` 조건과 정렬을 추가한다.
+    `key_column`이 있으면 워터마크는 (column, key_column) 값 쌍이며, 같은
+    column 값을 가진 행이 청크 경계에 걸려도 건너뛰지 않도록
+    `column > m OR (column = m AND key_column > k)` 조건을 쓴다.
+
+    Args:
+        query: 기본 조회 쿼리
+        column: 워터마크 컬럼명
+        db_type: DB 타입(oracle, mssql)
+        last_mark: 마지막 워터마크 값(복합이면 (값, 키) 튜플, 없으면 전체 조회)
+        key_column: 동률을 구분하는 고유 키 컬럼명
+
+    Returns:
+        쿼리 문자열, 바인드 파라미터
+    """
+    base = f"SELECT * FROM ({_strip_order_by(query)}) src"
+    order = f"ORDER BY src.{column}" + (f", src.{key_column}" if key_column else "")
+    if last_mark is None:
+        return f"{base} {order}", []
+    if key_column:
+        mark, key = last_mark
+        if db_type == "oracle":
+            return (
+                f"{base} WHERE src.{column} > :last_mark OR "
+                f"(src.{column} = :last_mark AND src.{key_column} > :last_key) {order}",
+                {"last_mark": mark, "last_key": key},
+            )
+        return (
+            f"{base} WHERE src.{column} > ? OR "
+            f"(src.{column} = ? AND src.{key_column} > ?) {order}",
+            [mark, mark, key],
+        )
+    if db_type == "oracle":
+        return (
+            f"{base} WHERE src.{column} > :last_mark {order}",
+            {"last_mark": last_mark},
+        )
+    return f"{base} WHERE src.{column} > ? {order}", [last_mark]
+
+
+def _close_quietly(conn: Any) -> None:
+    """연결 종료 중 발생한 예외를 무시하고 닫음
+
+    Args:
+        conn: DB 연결
+    """
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class PoolTimeoutError(RuntimeError):
+    """커넥션 풀에서 제한 시간 내 연결을 얻지 못한 경우 발생"""
+
+
+class ConnectionPool:
+    """드라이버 독립 커넥션 풀
+
+    유휴 연결을 재사용하고 최대 크기에 도달하면 반납을 기다린다.
+    오래 유휴 상태였던 연결은 대여 전에 헬스 핑으로 검증한다.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 60.0,
+        acquire_timeout: float = 30.0,
+        ping_query: str = "SELECT 1",
+    ) -> None:
+        self.label = label
+        self._connect = connect
+        self._min_size = max(0, min_size)
+        self._max_size = max(1, max_size, self._min_size)
+        self._idle_timeout = idle_timeout
+        self._ping_interval = ping_interval
+        self._acquire_timeout = acquire_timeout
+        self._ping_query = ping_query
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._cond = threading.Condition()
+        self._open = 0
+        self._in_use = 0
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_ms_total": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "discarded": 0,
+            "ping_failures": 0,
+        }
+
+    def acquire(self) -> Any:
+        """풀에서 연결을 대여
+
+        Returns:
+            DB 연결
+
+        Raises:
+            PoolTimeoutError: 대기 제한 시간 초과 시
+        """
+        started = time.monotonic()
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"커넥션 풀 종료됨: {self.label}")
+                self._evict_idle_locked()
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._open < self._max_size:
+                    conn, last_used = None, 0.0
+                    self._open += 1
+                    break
+                remaining = self._acquire_timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeoutError(f"커넥션 풀 대기 시간 초과: {self.label}")
+                waited = True
+                self._cond.wait(remaining)
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_ms_total"] += (time.monotonic() - started) * 1000
+        try:
+            if conn is None:
+                conn = self._create()
+            elif time.monotonic() - last_used >= self._ping_interval:
+                conn = self._ping_or_replace(conn)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """연결을 풀에 반납
+
+        Args:
+            conn: 반납할 연결
+            discard: True면 재사용하지 않고 닫음
+        """
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._open -= 1
+                self._stats["discarded"] += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            self._cond.notify()
+        if conn is not None:
+            _close_quietly(conn)
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫고 풀을 종료"""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            _close_quietly(conn)
+
+    def stats(self) -> dict:
+        """풀 사용 지표를 반환
+
+        Returns:
+            지표 딕셔너리
+        """
+        with self._cond:
+            return {
+                "pool": self.label,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "max_size": self._max_size,
+                **self._stats,
+            }
+
+    def _create(self) -> Any:
+        conn = self._connect()
+        with self._cond:
+            self._stats["created"] += 1
+        return conn
+
+    def _ping_or_replace(self, conn: Any) -> Any:
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self._ping_query)
+            cursor.fetchall()
+            return conn
+        except Exception:
+            _close_quietly(conn)
+            with self._cond:
+                self._stats["ping_failures"] += 1
+                self._stats["discarded"] += 1
+            return self._create()
+
+    def _evict_idle_locked(self) -> None:
+        now = time.monotonic()
+        while (
+            self._idle
+            and self._open > self._min_size
+            and now - self._idle[0][1] >= self._idle_timeout
+        ):
+            conn, _ = self._idle.popleft()
+            self._open -= 1
+            self._stats["discarded"] += 1
+            _close_quietly(conn)
+
+
+_ORACLE_POOL_TIMEOUT_CODES = frozenset(
+    {"DPY-4005", "ORA-24457", "ORA-24459", "ORA-24496"}
+)
+
+
+def _is_pool_timeout(exc: oracledb.Error) -> bool:
+    """oracledb 예외가 세션 풀 대기 시간 초과인지 확인
+
+    Args:
+        exc: oracledb 예외
+
+    Returns:
+        풀 대기 시간 초과 여부
+    """
+    error = exc.args[0] if exc.args else None
+    return getattr(error, "full_code", None) in _ORACLE_POOL_TIMEOUT_CODES
+
+
+class OraclePool(ConnectionPool):
+    """oracledb 세션 풀을 사용하는 Oracle 커넥션 풀
+
+    연결 생성, 유휴 정리, 헬스 핑은 드라이버 풀에 맡기고
+    대여/대기 지표만 공통 형식으로 집계한다.
+    """
+
+    def __init__(self, label: str, db: dict, options: dict) -> None:
+        super().__init__(
+            label,
+            connect=lambda: None,
+            min_size=int(options.get("min_size", 1)),
+            max_size=int(options.get("max_size", 4)),
+            acquire_timeout=float(options.get("acquire_timeout_seconds", 30)),
+        )
+        self._pool = oracledb.create_pool(
+            user=db.get("username"),
+            password=db.get("password"),
+            dsn=_oracle_dsn(db),
+            min=self._min_size,
+            max=self._max_size,
+            increment=1,
+            timeout=int(options.get("idle_timeout_seconds", 300)),
+            ping_interval=int(options.get("ping_interval_seconds", 60)),
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=int(self._acquire_timeout * 1000),
+        )
+
+    def acquire(self) -> oracledb.Connection:
+        started = time.monotonic()
+        waited = self._pool.busy >= self._pool.max
+        try:
+            conn = self._pool.acquire()
+        except oracledb.Error as exc:
+            if not _is_pool_timeout(exc):
+                raise
+            with self._cond:
+                self._stats["timeouts"] += 1
+            raise PoolTimeoutError(f"커넥션 풀 대기 시간 초과: {self.label}") from exc
+        with self._cond:
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_ms_total"] += (time.monotonic() - started) * 1000
+        return conn
+
+    def release(self, conn: oracledb.Connection, discard: bool = False) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._stats["discarded"] += 1
+        if discard:
+            self._pool.drop(conn)
+        else:
+            self._pool.release(conn)
+
+    def close(self) -> None:
+        self._pool.close(force=True)
+
+    def stats(self) -> dict:
+        data = super().stats()
+        data["open"] = self._pool.opened
+        data["idle"] = self._pool.opened - self._pool.busy
+        return data
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_label(db: dict) -> str:
+    """지표 표시용 풀 이름을 생성
+
+    Args:
+        db: DB 설정
+
+    Returns:
+        풀 이름
+    """
+    target = db.get("dsn") or db.get("host") or "-"
+    name = db.get("service") or db.get("database") or ""
+    return f"{db.get('type')}:{db.get('username', '')}@{target}/{name}"
+
+
+def _pool_options(db: dict) -> dict | None:
+    """풀 설정을 반환하고 비활성화 시 None 반환
+
+    Args:
+        db: DB 설정
+
+    Returns:
+        풀 설정 또는 None
+    """
+    options = db.get("pool") or {}
+    if not options.get("enabled", True):
+        return None
+    return options
+
+
+def _create_pool(db: dict, options: dict) -> ConnectionPool:
+    """DB 설정에 맞는 커넥션 풀을 생성
+
+    Args:
+        db: DB 설정
+        options: 풀 설정
+
+    Returns:
+        커넥션 풀
+    """
+    label = _pool_label(db)
+    if db.get("type") == "oracle":
+        return OraclePool(label, db, options)
+    conn_str = _mssql_conn_str(db)
+    return ConnectionPool(
+        label,
+        connect=lambda: pyodbc.connect(conn_str),
+        min_size=int(options.get("min_size", 1)),
+        max_size=int(options.get("max_size", 4)),
+        idle_timeout=float(options.get("idle_timeout_seconds", 300)),
+        ping_interval=float(options.get("ping_interval_seconds", 60)),
+        acquire_timeout=float(options.get("acquire_timeout_seconds", 30)),
+    )
+
+
+def _get_pool(db: dict, options: dict) -> ConnectionPool:
+    """DB 설정에 해당하는 풀을 조회하거나 생성
+
+    풀은 연결 정보별로 하나이며 같은 DB에 접속하는 병원끼리 공유한다. 공유하는
+    병원의 풀 설정과 필요한 연결 수는 `AppConfig`가 로드 시 검증한다.
+
+    Oracle 세션 풀은 생성 시 DB에 접속하므로 잠금 밖에서 만들고 등록만 잠금
+    안에서 한다. 동시에 만든 풀이 있으면 먼저 등록된 풀을 쓰고 나머지는 닫는다.
+
+    Args:
+        db: DB 설정
+        options: 풀 설정
+
+    Returns:
+        커넥션 풀
+    """
+    key = db_pool_key(db)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    created = _create_pool(db, options)
+    with _pools_lock:
+        pool = _pools.setdefault(key, created)
+    if pool is not created:
+        created.close()
+    return pool
+
+
+@contextmanager
+def _pooled(pool: ConnectionPool) -> Iterator[Any]:
+    """풀에서 연결을 대여하고 종료 시 반납
+
+    블록 안에서 예외가 발생하면 연결 상태를 신뢰할 수 없으므로 폐기한다.
+
+    Args:
+        pool: 커넥션 풀
+
+    Returns:
+        DB 연결
+    """
+    conn = pool.acquire()
+    discard = False
+    try:
+        yield conn
+    except GeneratorExit:
+        raise
+    except BaseException:
+        discard = True
+        raise
+    finally:
+        pool.release(conn, discard=discard)
+
+
+def pool_stats() -> list[dict]:
+    """모든 커넥션 풀의 지표를 반환
+
+    Returns:
+        풀별 지표 목록
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
+
+
+def close_pools() -> None:
+    """모든 커넥션 풀을 닫음"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
 @contextmanager
 def oracle_connection(db: dict) -> Iterator[oracledb.Connection]:
     """Oracle 연결 생성
 
+    `db.pool.enabled`가 False가 아니면 병원 DB 설정별 세션 풀에서 대여한다.
+
     Args:
         db: DB 설정
 
     Returns:
         Oracle 연결
     """
+    options = _pool_options(db)
+    if options is not None:
+        with _pooled(_get_pool(db, options)) as conn:
+            yield conn
+        return
     dsn = _oracle_dsn(db)
     conn = oracledb.connect(
         user=db.get("username"),
@@ -84,12 +571,19 @@ def oracle_connection(db: dict) -> Iterator[oracledb.Connection]:
 def mssql_connection(db: dict) -> Iterator[pyodbc.Connection]:
     """MSSQL 연결 생성
 
+    `db.pool.enabled`가 False가 아니면 병원 DB 설정별 커넥션 풀에서 대여한다.
+
     Args:
         db: DB 설정
 
     Returns:
         MSSQL 연결
     """
+    options = _pool_options(db)
+    if options is not None:
+        with _pooled(_get_pool(db, options)) as conn:
+            yield conn
+        return
     conn_str = _mssql_conn_str(db)
     conn = pyodbc.connect(conn_str)
     try:
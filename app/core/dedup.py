@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from app.core.config import get_settings
+
+DEFAULT_MAX_ENTRIES = 100000
+DEFAULT_TTL_SECONDS = 86400
+
+
+def content_hash(payload: bytes) -> str:
+    """직렬화된 백엔드 페이로드의 콘텐츠 해시
+
+    Args:
+        payload: 직렬화된 백엔드 페이로드
+
+    Returns:
+        16바이트 BLAKE2b 해시(hex)
+    """
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class DedupCache:
+    """병원별 전송 완료 페이로드 해시 인덱스
+
+    해시별 전송 시각을 삽입 순서대로 보관한다. 조회된 항목은 가장 최근으로
+    옮기고(LRU), `max_entries`를 넘으면 가장 오래 쓰이지 않은 항목부터 버린다.
+    전송 후 `ttl_seconds`가 지난 항목은 만료되어 다시 전송된다.
+
+    파일은 `[해시, 전송 시각]` 줄을 덧붙이는 JSON Lines 로그이며, 저장 시에는
+    새로 추가된 항목만 기록한다. 로그 줄 수가 살아 있는 항목 수의 두 배를 넘으면
+    살아 있는 항목만 새 파일로 다시 쓴다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._path = path
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._pending: list[tuple[str, float]] = []
+        self._log_lines = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, digest: str) -> bool:
+        """만료되지 않은 해시인지 확인
+
+        Args:
+            digest: 콘텐츠 해시
+
+        Returns:
+            이미 전송된 해시이면 True
+        """
+        with self._lock:
+            sent_at = self._entries.get(digest)
+            if sent_at is None:
+                return False
+            if time.time() - sent_at > self._ttl_seconds:
+                del self._entries[digest]
+                return False
+            self._entries.move_to_end(digest)
+            return True
+
+    def add(self, digest: str) -> None:
+        """전송 완료 해시를 기록
+
+        Args:
+            digest: 콘텐츠 해시
+        """
+        with self._lock:
+            sent_at = time.time()
+            self._entries[digest] = sent_at
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._pending.append((digest, sent_at))
+
+    def save(self) -> None:
+        """새로 추가된 항목을 로그 끝에 덧붙이고 필요하면 압축"""
+        with self._lock:
+            if not self._pending:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            log_lines = self._log_lines + len(self._pending)
+            limit = 2 * max(len(self._entries), 1024)
+            if log_lines > limit:
+                self._compact_locked()
+                return
+            with open(self._path, "a", encoding="utf-8") as handle:
+                handle.write(_log_text(self._pending))
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._log_lines += len(self._pending)
+            self._pending.clear()
+
+    def _compact_locked(self) -> None:
+        """살아 있는 항목만 임시 파일에 쓰고 원자적으로 교체"""
+        temp_path = self._path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            handle.write(_log_text(self._entries.items()))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self._path)
+        self._log_lines = len(self._entries)
+        self._pending.clear()
+
+    def _load(self) -> None:
+        """로그를 재생해 만료되지 않은 항목을 읽음
+
+        쓰는 도중 중단되어 잘린 마지막 줄은 무시한다.
+        """
+        entries: list[tuple[str, float]] = []
+        if self._path.exists():
+            with open(self._path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    self._log_lines += 1
+                    try:
+                        digest, sent_at = json.loads(line)
+                    except ValueError:
+                        continue
+                    entries.append((digest, sent_at))
+        cutoff = time.time() - self._ttl_seconds
+        for digest, sent_at in entries:
+            if sent_at >= cutoff:
+                self._entries[digest] = sent_at
+                self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _log_text(entries) -> str:
+    """해시 항목을 JSON Lines 텍스트로 변환
+
+    Args:
+        entries: (해시, 전송 시각) 목록
+
+    Returns:
+        JSON Lines 텍스트
+    """
+    return "".join(
+        json.dumps([digest, sent_at], separators=(",", ":")) + "\n"
+        for digest, sent_at in entries
+    )
+
+
+_caches: dict[str, DedupCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_dedup(hospital_id: str, options: dict | None = None) -> DedupCache:
+    """병원별 중복 제거 인덱스를 조회하거나 생성
+
+    Args:
+        hospital_id: 병원 식별자
+        options: 병원 `dedup` 설정
+
+    Returns:
+        중복 제거 인덱스
+    """
+    options = options or {}
+    with _caches_lock:
+        cache = _caches.get(hospital_id)
+        if cache is None:
+            cache = DedupCache(
+                Path(get_settings().dedup_dir) / f"{hospital_id}.jsonl",
+                max_entries=int(options.get("max_entries", DEFAULT_MAX_ENTRIES)),
+                ttl_seconds=float(options.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+            )
+            _caches[hospital_id] = cache
+        return cache
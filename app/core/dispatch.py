@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator
+
+import httpx
+
+from app.clients.backend_api import (
+    build_async_client,
+    iter_batches,
+    send_batch_async,
+    send_encoded_async,
+)
+from app.core.adaptive import AdaptiveLimiter, is_overload_error
+
+
+def _lane_of(key: str, lanes: int) -> int:
+    """환자 키를 전송 레인 번호로 매핑
+
+    같은 키는 항상 같은 레인으로 보내 환자별 전송 순서를 보존한다.
+
+    Args:
+        key: 환자 식별 키
+        lanes: 레인 수
+
+    Returns:
+        레인 번호
+    """
+    return zlib.crc32(key.encode("utf-8")) % lanes
+
+
+class _Gate:
+    """리미터의 현재 한도만큼만 요청이 동시에 진행되도록 제한"""
+
+    def __init__(self, limiter: AdaptiveLimiter | None) -> None:
+        self._limiter = limiter
+        self._cond = asyncio.Condition()
+        self._in_flight = 0
+
+    def _has_room(self) -> bool:
+        return self._limiter is None or self._in_flight < self._limiter.limit
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(self._has_room)
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+
+async def _send_with_retry(
+    client: httpx.AsyncClient,
+    batch: list[bytes],
+    use_batch: bool,
+    gate: _Gate,
+    limiter: AdaptiveLimiter | None,
+    max_retries: int,
+    retry_backoff: float,
+) -> list[dict]:
+    """요청 한 건을 보내고 결과를 리미터에 반영
+
+    적응형 모드에서 과부하 응답을 받으면 한도를 줄이고 잠시 뒤 재시도한다.
+
+    Args:
+        client: 비동기 클라이언트
+        batch: 직렬화된 페이로드 묶음
+        use_batch: 일괄 엔드포인트 사용 여부
+        gate: 동시 요청 제한
+        limiter: 적응형 리미터(없으면 고정 동시성)
+        max_retries: 과부하 시 최대 재시도 횟수
+        retry_backoff: 재시도 간 기본 대기(초)
+
+    Returns:
+        항목별 백엔드 응답 목록
+    """
+    attempt = 0
+    while True:
+        async with gate:
+            started = time.perf_counter()
+            try:
+                if use_batch:
+                    responses = await send_batch_async(client, batch)
+                else:
+                    responses = [await send_encoded_async(client, batch[0])]
+            except Exception as exc:
+                latency_ms = (time.perf_counter() - started) * 1000
+                if limiter is None or not is_overload_error(exc):
+                    raise
+                limiter.on_overload(latency_ms)
+                if attempt >= max_retries:
+                    raise
+            else:
+                if limiter is not None:
+                    limiter.on_success((time.perf_counter() - started) * 1000)
+                return responses
+        attempt += 1
+        await asyncio.sleep(retry_backoff * attempt)
+
+
+async def _run_lane(
+    client: httpx.AsyncClient,
+    indices: list[int],
+    items: list[bytes],
+    results: list[dict | Exception | None],
+    batch_size: int,
+    batch_max_bytes: int,
+    gate: _Gate,
+    limiter: AdaptiveLimiter | None,
+    max_retries: int,
+    retry_backoff: float,
+) -> None:
+    """레인에 배정된 항목을 순서대로 전송
+
+    배치 크기는 리미터가 있으면 매 요청마다 리미터의 현재 값을 따른다.
+    전송이 실패하면 같은 레인의 나머지 항목은 보내지 않고 같은 예외로 표시해
+    환자별 순서가 뒤바뀌지 않도록 한다.
+
+    Args:
+        client: 비동기 클라이언트
+        indices: 레인에 배정된 항목 인덱스(원래 순서)
+        items: 직렬화된 페이로드 전체 목록
+        results: 항목별 결과를 기록할 목록
+        batch_size: 배치당 최대 건수
+        batch_max_bytes: 배치당 최대 바이트
+        gate: 동시 요청 제한
+        limiter: 적응형 리미터
+        max_retries: 과부하 시 최대 재시도 횟수
+        retry_backoff: 재시도 간 기본 대기(초)
+    """
+    position = 0
+    while position < len(indices):
+        count = max(limiter.batch_size if limiter else batch_size, 1)
+        window = [items[index] for index in indices[position : position + count]]
+        batch = next(iter_batches(window, count, batch_max_bytes))
+        batch_indices = indices[position : position + len(batch)]
+        try:
+            responses = await _send_with_retry(
+                client,
+                batch,
+                batch_size > 1,
+                gate,
+                limiter,
+                max_retries,
+                retry_backoff,
+            )
+        except Exception as exc:
+            for index in indices[position:]:
+                results[index] = exc
+            return
+        position += len(batch)
+        for index, response in zip(batch_indices, responses):
+            results[index] = response
+
+
+class DispatchSession:
+    """병원 실행 한 번 동안 이벤트 루프와 비동기 클라이언트를 유지
+
+    청크마다 `asyncio.run`과 새 클라이언트를 쓰면 keep-alive 연결과 TLS 세션이
+    청크마다 버려지므로, 실행 동안 같은 루프에서 같은 클라이언트를 재사용한다.
+    """
+
+    def __init__(self) -> None:
+        self._runner = asyncio.Runner()
+        self._client: httpx.AsyncClient | None = None
+
+    def run(self, send: Callable[[httpx.AsyncClient], Awaitable[Any]]) -> Any:
+        """세션 루프에서 클라이언트를 받아 전송 코루틴을 실행
+
+        Args:
+            send: 클라이언트를 받아 코루틴을 돌려주는 함수
+
+        Returns:
+            코루틴 결과
+        """
+        return self._runner.run(self._with_client(send))
+
+    async def _with_client(
+        self, send: Callable[[httpx.AsyncClient], Awaitable[Any]]
+    ) -> Any:
+        if self._client is None:
+            self._client = build_async_client()
+        return await send(self._client)
+
+    def close(self) -> None:
+        """클라이언트와 이벤트 루프를 닫음"""
+        try:
+            if self._client is not None:
+                self._runner.run(self._client.aclose())
+        finally:
+            self._client = None
+            self._runner.close()
+
+
+_session: ContextVar[DispatchSession | None] = ContextVar(
+    "dispatch_session", default=None
+)
+
+
+@contextmanager
+def dispatch_session() -> Iterator[DispatchSession]:
+    """현재 컨텍스트에서 전송 세션을 시작하고 종료 시 닫음
+
+    Yields:
+        전송 세션
+    """
+    session = DispatchSession()
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+        session.close()
+
+
+async def _dispatch(
+    client: httpx.AsyncClient,
+    items: list[bytes],
+    keys: list[str],
+    concurrency: int,
+    batch_size: int,
+    batch_max_bytes: int,
+    limiter: AdaptiveLimiter | None,
+    max_retries: int,
+    retry_backoff: float,
+) -> list[dict | Exception | None]:
+    """레인별 전송 코루틴을 동시에 실행
+
+    Args:
+        client: 비동기 클라이언트
+        items: 직렬화된 페이로드 목록
+        keys: 항목별 환자 식별 키
+        concurrency: 레인 수
+        batch_size: 배치당 최대 건수
+        batch_max_bytes: 배치당 최대 바이트
+        limiter: 적응형 리미터
+        max_retries: 과부하 시 최대 재시도 횟수
+        retry_backoff: 재시도 간 기본 대기(초)
+
+    Returns:
+        항목별 결과 목록
+    """
+    lanes: dict[int, list[int]] = {}
+    for index, key in enumerate(keys):
+        lanes.setdefault(_lane_of(key, concurrency), []).append(index)
+    results: list[dict | Exception | None] = [None] * len(items)
+    gate = _Gate(limiter)
+    await asyncio.gather(
+        *(
+            _run_lane(
+                client,
+                indices,
+                items,
+                results,
+                batch_size,
+                batch_max_bytes,
+                gate,
+                limiter,
+                max_retries,
+                retry_backoff,
+            )
+            for indices in lanes.values()
+        )
+    )
+    return results
+
+
+def dispatch_records(
+    items: list[bytes],
+    keys: list[str],
+    concurrency: int,
+    batch_size: int = 1,
+    batch_max_bytes: int = 0,
+    limiter: AdaptiveLimiter | None = None,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> list[dict | Exception]:
+    """직렬화된 페이로드를 동시에 최대 N건 전송
+
+    항목은 환자 키 기준으로 N개 레인에 나뉘며 레인마다 한 번에 하나의 요청만
+    보내므로 동시 요청 수는 N 이하이고 같은 환자의 레코드는 순서대로 전송된다.
+    리미터를 주면 동시 요청 수와 배치 크기를 리미터의 현재 한도로 더 좁힌다.
+    `dispatch_session()` 안에서 호출하면 세션의 루프와 클라이언트를 재사용한다.
+
+    Args:
+        items: 직렬화된 페이로드 목록
+        keys: 항목별 환자 식별 키
+        concurrency: 동시 요청 상한(N)
+        batch_size: 배치당 최대 건수(1이면 건별 전송)
+        batch_max_bytes: 배치당 최대 바이트
+        limiter: 적응형 리미터(선택)
+        max_retries: 적응형 모드에서 과부하 시 최대 재시도 횟수
+        retry_backoff: 재시도 간 기본 대기(초)
+
+    Returns:
+        항목별 백엔드 응답 또는 전송 예외(입력 순서)
+    """
+    if not items:
+        return []
+
+    def _send(client: httpx.AsyncClient) -> Awaitable[list[dict | Exception | None]]:
+        return _dispatch(
+            client,
+            items,
+            keys,
+            max(concurrency, 1),
+            batch_size,
+            batch_max_bytes,
+            limiter,
+            max_retries,
+            retry_backoff,
+        )
+
+    session = _session.get()
+    if session is not None:
+        return session.run(_send)
+    with dispatch_session() as session:
+        return session.run(_send)
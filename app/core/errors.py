@@ -6,6 +6,26 @@ class PipelineError(Exception):
         self.code = code
         self.message = message
 
+    def __reduce__(self) -> tuple:
+        # 하위 클래스 생성자 인자가 달라도 프로세스 풀에서 전달될 수 있게 함
+        return (_restore_error, (type(self), self.code, self.message))
+
+
+def _restore_error(cls: type, code: str, message: str) -> PipelineError:
+    """피클에서 파이프라인 예외를 복원
+
+    Args:
+        cls: 예외 클래스
+        code: 에러 코드
+        message: 에러 메시지
+
+    Returns:
+        복원된 예외
+    """
+    error = Exception.__new__(cls)
+    PipelineError.__init__(error, code, message)
+    return error
+
 
 class ParseError(PipelineError):
     """파싱 또는 정규화 실패 시 발생"""
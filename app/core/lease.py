@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import math
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from app.core.config import Settings
+from app.core.telemetry import decode_mark, encode_mark
+
+MEMBER_PREFIX = "member:"
+HOSPITAL_PREFIX = "hospital:"
+
+
+class LeaseBackend:
+    """이름 단위 만료형 잠금(lease)을 보관하는 저장소 인터페이스
+
+    구현체는 여러 복제본이 같은 저장소를 공유해야 하며 `acquire`는 원자적이어야
+    한다. 만료 시각은 저장소에 기록된 epoch 초를 기준으로 비교한다. 병원
+    워터마크도 같은 저장소에 두어 lease가 넘어가도 새 소유자가 이어서 조회한다.
+    """
+
+    def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """lease를 획득하거나 이미 가진 lease를 갱신
+
+        Args:
+            name: lease 이름
+            owner: 소유자 식별자
+            ttl_seconds: 만료까지 시간(초)
+
+        Returns:
+            획득/갱신에 성공하면 True(다른 소유자의 lease가 살아 있으면 False)
+        """
+        raise NotImplementedError
+
+    def release(self, name: str, owner: str) -> None:
+        """소유한 lease를 반납
+
+        Args:
+            name: lease 이름
+            owner: 소유자 식별자
+        """
+        raise NotImplementedError
+
+    def holders(self, prefix: str) -> dict[str, str]:
+        """만료되지 않은 lease의 소유자를 조회
+
+        Args:
+            prefix: lease 이름 접두어
+
+        Returns:
+            lease 이름별 소유자
+        """
+        raise NotImplementedError
+
+    def get_mark(self, hospital_id: str) -> tuple[str, str, str] | None:
+        """공유 워터마크를 조회
+
+        Args:
+            hospital_id: 병원 식별자
+
+        Returns:
+            (워터마크 컬럼명, 직렬화 문자열, 타입 태그) 또는 None
+        """
+        raise NotImplementedError
+
+    def set_mark(
+        self, hospital_id: str, owner: str, column: str, text: str, kind: str
+    ) -> bool:
+        """병원 lease를 가진 소유자만 공유 워터마크를 저장
+
+        lease 확인과 저장은 원자적이어야 한다.
+
+        Args:
+            hospital_id: 병원 식별자
+            owner: 소유자 식별자
+            column: 워터마크 컬럼명
+            text: 직렬화 문자열
+            kind: 타입 태그
+
+        Returns:
+            저장했으면 True(lease가 없거나 만료됐으면 False)
+        """
+        raise NotImplementedError
+
+
+class SqliteLeaseBackend(LeaseBackend):
+    """SQLite 파일 하나를 공유하는 lease 저장소
+
+    같은 호스트(또는 잠금을 지원하는 공유 볼륨)의 복제본끼리 사용한다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetch_marks ("
+                "hospital_id TEXT PRIMARY KEY, watermark_column TEXT NOT NULL, "
+                "last_mark TEXT NOT NULL, mark_type TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """자동 커밋 모드 연결을 생성
+
+        Returns:
+            SQLite 연결
+        """
+        return sqlite3.connect(self._path, timeout=10, isolation_level=None)
+
+    def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT owner, expires_at FROM leases WHERE name = ?", (name,)
+                ).fetchone()
+                if row and row[0] != owner and row[1] > now:
+                    return False
+                conn.execute(
+                    "INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET "
+                    "owner = excluded.owner, expires_at = excluded.expires_at",
+                    (name, owner, now + ttl_seconds),
+                )
+                return True
+            finally:
+                conn.execute("COMMIT")
+
+    def release(self, name: str, owner: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner)
+            )
+
+    def holders(self, prefix: str) -> dict[str, str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT name, owner FROM leases "
+                "WHERE substr(name, 1, ?) = ? AND expires_at > ?",
+                (len(prefix), prefix, time.time()),
+            ).fetchall()
+        return {name: owner for name, owner in rows}
+
+    def get_mark(self, hospital_id: str) -> tuple[str, str, str] | None:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT watermark_column, last_mark, mark_type FROM fetch_marks "
+                "WHERE hospital_id = ?",
+                (hospital_id,),
+            ).fetchone()
+
+    def set_mark(
+        self, hospital_id: str, owner: str, column: str, text: str, kind: str
+    ) -> bool:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT 1 FROM leases "
+                    "WHERE name = ? AND owner = ? AND expires_at > ?",
+                    (HOSPITAL_PREFIX + hospital_id, owner, time.time()),
+                ).fetchone()
+                if row is None:
+                    return False
+                conn.execute(
+                    "INSERT INTO fetch_marks "
+                    "(hospital_id, watermark_column, last_mark, mark_type) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(hospital_id) DO UPDATE SET "
+                    "watermark_column = excluded.watermark_column, "
+                    "last_mark = excluded.last_mark, mark_type = excluded.mark_type",
+                    (hospital_id, column, text, kind),
+                )
+                return True
+            finally:
+                conn.execute("COMMIT")
+
+
+_BACKENDS = {"sqlite": SqliteLeaseBackend}
+
+
+def build_lease_backend(settings: Settings) -> LeaseBackend | None:
+    """설정에 맞는 lease 저장소를 생성
+
+    `LEASE_BACKEND`는 `sqlite` 또는 `패키지.모듈:클래스` 형식의 사용자 구현을
+    받는다. 클래스는 `LEASE_PATH` 하나를 인자로 받아 생성된다.
+
+    Args:
+        settings: 애플리케이션 설정
+
+    Returns:
+        lease 저장소 또는 None(비활성)
+    """
+    name = settings.lease_backend.strip()
+    if not name:
+        return None
+    factory = _BACKENDS.get(name)
+    if factory is None:
+        module_name, _, class_name = name.partition(":")
+        factory = getattr(importlib.import_module(module_name), class_name)
+    return factory(settings.lease_path)
+
+
+def default_replica_id() -> str:
+    """호스트 이름과 프로세스 번호로 복제본 식별자를 만듦
+
+    Returns:
+        복제본 식별자
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _rank(hospital_id: str, owner: str) -> str:
+    """병원-복제본 쌍의 선호 순위(rendezvous 해시)
+
+    Args:
+        hospital_id: 병원 식별자
+        owner: 복제본 식별자
+
+    Returns:
+        작을수록 선호하는 해시 문자열
+    """
+    return hashlib.sha1(f"{hospital_id}\0{owner}".encode()).hexdigest()
+
+
+class LeaseCoordinator:
+    """복제본끼리 병원 lease를 나눠 갖도록 조정
+
+    `rebalance`를 lease 만료 시간보다 짧은 주기로 호출하면 살아 있는 복제본 수로
+    병원을 고르게 나누고, 만료된(죽은) 복제본의 병원을 다음 호출에서 넘겨받는다.
+    복제본이 늘면 몫을 넘는 병원을 반납해 새 복제본이 가져가게 한다.
+
+    lease는 마지막 갱신 요청 시각부터 `ttl_seconds`까지만 가진 것으로 보므로,
+    갱신이 실패하면 저장소에서 만료되기 전에 `holds`가 먼저 False가 된다.
+    """
+
+    def __init__(self, backend: LeaseBackend, owner: str, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.owner = owner
+        self.ttl_seconds = ttl_seconds
+        self._held: set[str] = set()
+        self._renewed: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def held(self) -> set[str]:
+        """현재 소유한 병원 식별자
+
+        Returns:
+            병원 식별자 집합
+        """
+        with self._lock:
+            return set(self._held)
+
+    def holds(self, hospital_id: str) -> bool:
+        """병원 lease를 아직 확실히 가지고 있는지 확인(저장소 조회 없음)
+
+        Args:
+            hospital_id: 병원 식별자
+
+        Returns:
+            소유 중이고 마지막 갱신 후 만료 시간이 지나지 않았으면 True
+        """
+        with self._lock:
+            renewed = self._renewed.get(hospital_id)
+        return renewed is not None and time.monotonic() - renewed < self.ttl_seconds
+
+    def reset(self) -> None:
+        """저장소와 무관하게 소유 상태를 비움(갱신 실패 시 수집 중단용)"""
+        with self._lock:
+            self._held = set()
+            self._renewed = {}
+
+    def load_mark(self, hospital_id: str, column: str) -> object | None:
+        """공유 워터마크를 조회
+
+        저장된 컬럼과 요청 컬럼이 다르면 워터마크가 없는 것으로 본다.
+
+        Args:
+            hospital_id: 병원 식별자
+            column: 워터마크 컬럼명
+
+        Returns:
+            워터마크 값 또는 None
+        """
+        row = self.backend.get_mark(hospital_id)
+        if row is None or row[0] != column:
+            return None
+        return decode_mark(row[1], row[2])
+
+    def save_mark(self, hospital_id: str, column: str, value: object) -> bool:
+        """병원 lease를 가진 경우에만 공유 워터마크를 저장
+
+        Args:
+            hospital_id: 병원 식별자
+            column: 워터마크 컬럼명
+            value: 워터마크 값
+
+        Returns:
+            저장했으면 True(lease를 잃었으면 False)
+        """
+        text, kind = encode_mark(value)
+        return self.backend.set_mark(hospital_id, self.owner, column, text, kind)
+
+    def _acquire(self, hospital_id: str, renewed: dict[str, float]) -> bool:
+        """병원 lease를 획득하거나 갱신하고 요청 시각을 기록
+
+        Args:
+            hospital_id: 병원 식별자
+            renewed: 성공한 병원별 요청 시각을 기록할 사전
+
+        Returns:
+            성공 여부
+        """
+        requested_at = time.monotonic()
+        if not self.backend.acquire(
+            HOSPITAL_PREFIX + hospital_id, self.owner, self.ttl_seconds
+        ):
+            return False
+        renewed[hospital_id] = requested_at
+        return True
+
+    def rebalance(
+        self, hospital_ids: list[str], busy: set[str] | frozenset[str] = frozenset()
+    ) -> tuple[set[str], set[str]]:
+        """소유 lease를 갱신하고 몫에 맞게 병원을 획득/반납
+
+        실행 중인 병원은 몫을 넘어도 반납하지 않고 다음 호출로 미룬다. 반납할
+        병원은 저장소에서 풀기 전에 소유 목록에서 빼서 `holds`가 먼저 False가
+        되게 한다.
+
+        Args:
+            hospital_ids: lease 대상 병원 식별자 목록
+            busy: 수집이 진행 중인 병원 식별자
+
+        Returns:
+            (새로 획득한 병원, 잃거나 반납한 병원)
+        """
+        self.backend.acquire(MEMBER_PREFIX + self.owner, self.owner, self.ttl_seconds)
+        members = set(self.backend.holders(MEMBER_PREFIX).values()) | {self.owner}
+        share = math.ceil(len(hospital_ids) / len(members)) if hospital_ids else 0
+
+        def preference(hospital_id: str) -> tuple[bool, str]:
+            ranks = {member: _rank(hospital_id, member) for member in members}
+            return (min(ranks, key=ranks.get) != self.owner, ranks[self.owner])
+
+        with self._lock:
+            previous = set(self._held)
+        renewed: dict[str, float] = {}
+        held = {
+            hospital_id
+            for hospital_id in previous
+            if hospital_id in hospital_ids and self._acquire(hospital_id, renewed)
+        }
+        released: set[str] = set()
+        for hospital_id in sorted(held, key=preference, reverse=True):
+            if len(held) - len(released) <= share:
+                break
+            if hospital_id not in busy:
+                released.add(hospital_id)
+        held -= released
+        if len(held) < share:
+            owned_elsewhere = set(self.backend.holders(HOSPITAL_PREFIX))
+            for hospital_id in sorted(hospital_ids, key=preference):
+                if len(held) >= share:
+                    break
+                if hospital_id in held or hospital_id in released:
+                    continue
+                if HOSPITAL_PREFIX + hospital_id in owned_elsewhere:
+                    continue
+                if self._acquire(hospital_id, renewed):
+                    held.add(hospital_id)
+        with self._lock:
+            self._held = held
+            self._renewed = {hospital_id: renewed[hospital_id] for hospital_id in held}
+        for hospital_id in released | (previous - set(hospital_ids)):
+            self.backend.release(HOSPITAL_PREFIX + hospital_id, self.owner)
+        return held - previous, previous - held
+
+    def release_all(self) -> None:
+        """소유한 모든 lease를 반납(정상 종료 시 빠른 인계용)
+
+        `reset` 뒤에도 저장소에 남은 이 복제본의 lease를 모두 반납한다.
+        """
+        self.reset()
+        for name, owner in self.backend.holders(HOSPITAL_PREFIX).items():
+            if owner == self.owner:
+                self.backend.release(name, self.owner)
+        self.backend.release(MEMBER_PREFIX + self.owner, self.owner)
+
+
+_active: LeaseCoordinator | None = None
+
+
+def set_active_coordinator(coordinator: LeaseCoordinator | None) -> None:
+    """파이프라인이 확인할 lease 조정기를 지정
+
+    Args:
+        coordinator: lease 조정기 또는 None(lease 비활성)
+    """
+    global _active
+    _active = coordinator
+
+
+def active_coordinator() -> LeaseCoordinator | None:
+    """현재 lease 조정기
+
+    Returns:
+        lease 조정기 또는 None(lease 비활성)
+    """
+    return _active
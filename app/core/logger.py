@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 
-from app.core.telemetry import TelemetryStore
+from app.core.telemetry import get_telemetry_writer
 
 
 def log_event(
@@ -18,6 +18,8 @@ def log_event(
 ) -> None:
     """이벤트를 표준 로깅과 DuckDB에 기록
 
+    DuckDB 저장은 백그라운드 텔레메트리 기록기가 묶어서 처리한다.
+
     Args:
         event: 이벤트 이름
         level: 로깅 레벨 문자열
@@ -36,7 +38,7 @@ def log_event(
     }
     logger.log(getattr(logging, level.upper(), logging.INFO), message, extra=extra)
 
-    TelemetryStore().insert_log(
+    get_telemetry_writer().submit(
         {
             "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "level": level.upper(),
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.core.adaptive import limiter_snapshots
+from app.core.db import pool_stats
+from app.core.telemetry import telemetry_writer_stats
+from app.core.timing import STAGE_BOUNDS_MS, RunTimings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_hospital: ContextVar[str] = ContextVar("metrics_hospital", default="-")
+
+
+def _escape(value: str) -> str:
+    """Prometheus 레이블 값을 이스케이프
+
+    Args:
+        value: 레이블 값
+
+    Returns:
+        이스케이프된 값
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    """레이블 이름과 값으로 `{a="b"}` 형식 문자열을 만듦
+
+    Args:
+        names: 레이블 이름 목록
+        values: 레이블 값 목록
+        extra: 뒤에 붙일 추가 레이블(예: `le="0.5"`)
+
+    Returns:
+        레이블 문자열(레이블이 없으면 빈 문자열)
+    """
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """지표 값을 Prometheus 텍스트 형식으로 변환
+
+    Args:
+        value: 지표 값
+
+    Returns:
+        값 문자열
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블 조합별 값을 보관하는 지표의 공통 부분
+
+    갱신은 지표별 잠금 안에서 딕셔너리 한 항목만 바꾸므로 파이프라인에서는
+    청크나 실행 단위로 한 번씩만 호출해도 충분하다.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def render(self) -> list[str]:
+        """지표를 Prometheus 텍스트 형식 줄 목록으로 변환
+
+        Returns:
+            텍스트 줄 목록
+        """
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for labels, value in items:
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def inc(self, labels: tuple, amount: float = 1) -> None:
+        """레이블 조합의 값을 증가
+
+        Args:
+            labels: 레이블 값 목록
+            amount: 증가량
+        """
+        if amount <= 0:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def take(self) -> list[tuple[tuple, float]]:
+        """지금까지 더한 값을 꺼내고 비움
+
+        Returns:
+            (레이블 값 목록, 증가량) 목록
+        """
+        with self._lock:
+            values, self._values = self._values, {}
+        return list(values.items())
+
+    def merge(self, values: list[tuple[tuple, float]]) -> None:
+        """`take`로 꺼낸 증가량을 더함
+
+        Args:
+            values: (레이블 값 목록, 증가량) 목록
+        """
+        for labels, amount in values:
+            self.inc(tuple(labels), amount)
+
+
+class Gauge(_Metric):
+    """현재 값을 나타내는 게이지"""
+
+    kind = "gauge"
+
+    def set(self, labels: tuple, value: float) -> None:
+        """레이블 조합의 값을 설정
+
+        Args:
+            labels: 레이블 값 목록
+            value: 값
+        """
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """고정 구간 누적 히스토그램"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+        bounds: tuple[float, ...],
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.bounds = bounds
+        self._series: dict[tuple, list] = {}
+
+    def merge(
+        self, labels: tuple, buckets: list[int], total: float, count: int
+    ) -> None:
+        """구간별 건수와 합계를 한 번에 더함
+
+        Args:
+            labels: 레이블 값 목록
+            buckets: `bounds`와 같은 순서의 구간별(비누적) 건수
+            total: 관측값 합계
+            count: 관측 건수
+        """
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.bounds), 0.0, 0]
+            for index, value in enumerate(buckets):
+                series[0][index] += value
+            series[1] += total
+            series[2] += count
+
+    def take(self) -> list[tuple[tuple, list[int], float, int]]:
+        """지금까지 더한 관측값을 꺼내고 비움
+
+        Returns:
+            (레이블 값 목록, 구간별 건수, 합계, 건수) 목록
+        """
+        with self._lock:
+            series, self._series = self._series, {}
+        return [(labels, *values) for labels, values in series.items()]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(
+                (labels, (list(series[0]), series[1], series[2]))
+                for labels, series in self._series.items()
+            )
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (buckets, total, count) in items:
+            cumulative = 0
+            for bound, value in zip(self.bounds, buckets):
+                cumulative += value
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} "
+                    f"{cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+RECORDS = Counter(
+    "vtc_records_total",
+    "Records processed per pipeline stage",
+    ("hospital_id", "stage"),
+)
+STAGE_SECONDS = Histogram(
+    "vtc_stage_duration_seconds",
+    "Pipeline stage span duration",
+    ("hospital_id", "stage"),
+    tuple(bound / 1000 for bound in STAGE_BOUNDS_MS),
+)
+BACKEND_RESPONSES = Counter(
+    "vtc_backend_responses_total",
+    "Backend HTTP responses by status code",
+    ("hospital_id", "status"),
+)
+SCHEDULER_LAG = Gauge(
+    "vtc_scheduler_job_lag_seconds",
+    "Delay between a job's scheduled and actual start",
+    ("hospital_id", "job_id"),
+)
+_METRICS: tuple[_Metric, ...] = (
+    RECORDS,
+    STAGE_SECONDS,
+    BACKEND_RESPONSES,
+    SCHEDULER_LAG,
+)
+# follower 워커가 owner에 넘기는 누적 지표(게이지는 owner 값만 쓴다)
+_SHARED: tuple[Counter | Histogram, ...] = (RECORDS, STAGE_SECONDS, BACKEND_RESPONSES)
+
+
+@contextmanager
+def bind_hospital(hospital_id: str) -> Iterator[None]:
+    """현재 컨텍스트의 지표 레이블 병원을 지정
+
+    Args:
+        hospital_id: 병원 식별자
+    """
+    token = _hospital.set(hospital_id)
+    try:
+        yield
+    finally:
+        _hospital.reset(token)
+
+
+def current_hospital() -> str:
+    """현재 컨텍스트에 지정된 병원 식별자를 반환
+
+    Returns:
+        병원 식별자(지정되지 않았으면 "-")
+    """
+    return _hospital.get()
+
+
+def count_records(hospital_id: str, stage: str, count: int) -> None:
+    """단계별 처리 레코드 수를 더함
+
+    Args:
+        hospital_id: 병원 식별자
+        stage: fetched, transformed, sent, postprocessed
+        count: 레코드 수
+    """
+    RECORDS.inc((hospital_id, stage), count)
+
+
+def observe_backend_status(status_code: int) -> None:
+    """백엔드 응답 상태 코드를 현재 병원 레이블로 집계
+
+    Args:
+        status_code: HTTP 상태 코드
+    """
+    BACKEND_RESPONSES.inc((_hospital.get(), str(status_code)))
+
+
+def observe_stage_timings(hospital_id: str, timings: RunTimings) -> None:
+    """실행 한 번의 단계별 구간 히스토그램을 지표에 합침
+
+    Args:
+        hospital_id: 병원 식별자
+        timings: 단계 시간 수집기
+    """
+    for stage, stats in timings.stages.items():
+        STAGE_SECONDS.merge(
+            (hospital_id, stage), stats.buckets, stats.total_ms / 1000, stats.count
+        )
+
+
+def set_scheduler_lag(hospital_id: str, job_id: str, seconds: float) -> None:
+    """스케줄러 작업의 시작 지연을 기록
+
+    Args:
+        hospital_id: 병원 식별자
+        job_id: 작업 식별자
+        seconds: 예정 시각 대비 지연(초)
+    """
+    SCHEDULER_LAG.set((hospital_id, job_id), max(0.0, seconds))
+
+
+def take_metric_deltas() -> dict[str, list]:
+    """이 프로세스에 쌓인 카운터와 히스토그램 증가분을 꺼내고 비움
+
+    다중 워커 모드의 follower가 `/push` 처리 중 기록한 지표를 owner로 넘길 때
+    쓴다.
+
+    Returns:
+        지표 이름별 증가분
+    """
+    return {metric.name: metric.take() for metric in _SHARED}
+
+
+def merge_metric_deltas(deltas: dict[str, list]) -> None:
+    """다른 워커에서 꺼낸 카운터와 히스토그램 증가분을 더함
+
+    Args:
+        deltas: `take_metric_deltas` 결과
+    """
+    for metric in _SHARED:
+        values = deltas.get(metric.name) or []
+        if isinstance(metric, Histogram):
+            for labels, buckets, total, count in values:
+                metric.merge(tuple(labels), buckets, total, count)
+        else:
+            metric.merge(values)
+
+
+def _sample_lines(
+    name: str, kind: str, help_text: str, samples: list[tuple[str, float]]
+) -> list[str]:
+    """수집 시점에 계산한 값을 텍스트 줄로 변환
+
+    Args:
+        name: 지표 이름
+        kind: gauge 또는 counter
+        help_text: 설명
+        samples: (레이블 문자열, 값) 목록
+
+    Returns:
+        텍스트 줄 목록
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{labels} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+def render_metrics() -> str:
+    """모든 지표를 Prometheus 텍스트 형식으로 렌더링
+
+    커넥션 풀, 적응형 전송 리미터, 텔레메트리 큐는 수집 시점의 값을 읽는다.
+
+    Returns:
+        Prometheus 텍스트 노출 형식 문자열
+    """
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+
+    pools = pool_stats()
+    for field, help_text in (
+        ("in_use", "DB pool connections checked out"),
+        ("idle", "DB pool idle connections"),
+        ("max_size", "DB pool maximum size"),
+    ):
+        lines.extend(
+            _sample_lines(
+                f"vtc_db_pool_{field}",
+                "gauge",
+                help_text,
+                [
+                    (_format_labels(("pool",), (stats["pool"],)), stats[field])
+                    for stats in pools
+                ],
+            )
+        )
+    lines.extend(
+        _sample_lines(
+            "vtc_db_pool_wait_seconds_total",
+            "counter",
+            "Time spent waiting for a DB pool connection",
+            [
+                (
+                    _format_labels(("pool",), (stats["pool"],)),
+                    stats["wait_ms_total"] / 1000,
+                )
+                for stats in pools
+            ],
+        )
+    )
+
+    limiters = limiter_snapshots()
+    for field, help_text in (
+        ("limit", "Adaptive dispatch concurrency limit"),
+        ("batch_size", "Adaptive dispatch batch size"),
+    ):
+        lines.extend(
+            _sample_lines(
+                f"vtc_dispatch_{field}",
+                "gauge",
+                help_text,
+                [
+                    (_format_labels(("hospital_id",), (hospital_id,)), stats[field])
+                    for hospital_id, stats in limiters.items()
+                ],
+            )
+        )
+    lines.extend(
+        _sample_lines(
+            "vtc_dispatch_latency_p95_seconds",
+            "gauge",
+            "Adaptive dispatch p95 request latency over the recent window",
+            [
+                (
+                    _format_labels(("hospital_id",), (hospital_id,)),
+                    stats["latency_p95_ms"] / 1000,
+                )
+                for hospital_id, stats in limiters.items()
+                if stats["latency_p95_ms"] is not None
+            ],
+        )
+    )
+    lines.extend(
+        _sample_lines(
+            "vtc_dispatch_overloads_total",
+            "counter",
+            "Backend overload responses seen by the adaptive limiter",
+            [
+                (_format_labels(("hospital_id",), (hospital_id,)), stats["overloads"])
+                for hospital_id, stats in limiters.items()
+            ],
+        )
+    )
+
+    telemetry = telemetry_writer_stats()
+    lines.extend(
+        _sample_lines(
+            "vtc_telemetry_queue_depth",
+            "gauge",
+            "Telemetry events waiting to be written",
+            [("", telemetry["queued"])],
+        )
+    )
+    lines.extend(
+        _sample_lines(
+            "vtc_telemetry_dropped_total",
+            "counter",
+            "Telemetry events dropped because the queue was full",
+            [("", telemetry["dropped"])],
+        )
+    )
+    lines.extend(
+        _sample_lines(
+            "vtc_telemetry_failed_total",
+            "counter",
+            "Telemetry events lost because a batch write failed",
+            [("", telemetry["failed"])],
+        )
+    )
+    return "\n".join(lines) + "\n"
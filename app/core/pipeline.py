@@ -1,64 +1,873 @@
 from __future__ import annotations
 
+import threading
+from contextlib import closing
 from datetime import datetime, timezone
+from typing import Iterator
 
-from app.clients.backend_api import send_payload
-from app.connectors.mssql_view_fetch import fetch_records as fetch_mssql
-from app.connectors.oracle_view_fetch import fetch_records as fetch_oracle
+from app.clients.backend_api import (
+    iter_batches,
+    send_batch,
+    send_encoded,
+)
+from app.connectors.mssql_view_fetch import iter_records as iter_mssql
+from app.connectors.oracle_view_fetch import iter_records as iter_oracle
 from app.connectors.rest_pull_fetch import fetch_records as fetch_rest
+from app.core.adaptive import get_limiter
+from app.core.dedup import DedupCache, content_hash, get_dedup
+from app.core.dispatch import dispatch_records, dispatch_session
+from app.core.errors import PipelineError
+from app.core.lease import LeaseCoordinator, active_coordinator
 from app.core.logger import log_event
+from app.core.metrics import bind_hospital, count_records, observe_stage_timings
+from app.core.spool import Spool, get_spool
 from app.core.telemetry import TelemetryStore
+from app.core.timing import RunTimings, current_timings, run_timings, span
+from app.core.transform_pool import transform_in_pool
 from app.models.canonical import CanonicalPayload
-from app.transforms.hospital_profiles.HOSP_A.inbound import to_canonical
-from app.transforms.hospital_profiles.HOSP_A.outbound import from_backend, to_backend
-from app.core.postprocess import run_postprocess
+from app.transforms.hospital_profiles.HOSP_A.inbound import (
+    to_canonical,
+    to_canonical_batch,
+)
+from app.transforms.hospital_profiles.HOSP_A.outbound import (
+    encode_backend,
+    from_backend,
+)
+from app.core.postprocess import run_postprocess_batch
+from app.core.readiness import mark_run_finished, mark_run_started
 
 
-def run_pull_pipeline(hospital) -> None:
+def _iter_raw_chunks(hospital, last_mark: object | None = None) -> Iterator[list[dict]]:
+    """커넥터 유형에 맞춰 원본 레코드를 청크 단위로 조회
+
+    Args:
+        hospital: 병원 설정 객체
+        last_mark: 마지막 워터마크 값(DB 뷰 커넥터 전용)
+
+    Yields:
+        원본 레코드 청크
+    """
+    if hospital.connector_type == "pull_db_view" and hospital.db:
+        if hospital.db.get("type") == "oracle":
+            yield from iter_oracle(hospital, last_mark)
+        elif hospital.db.get("type") == "mssql":
+            yield from iter_mssql(hospital, last_mark)
+    elif hospital.connector_type == "pull_rest_api":
+        raw_records = fetch_rest(hospital)
+        if raw_records:
+            yield raw_records
+
+
+def _timed_chunks(chunks: Iterator[list[dict]]) -> Iterator[list[dict]]:
+    """원본 청크 조회 시간을 fetch 구간으로 기록하며 청크를 전달
+
+    Args:
+        chunks: 원본 레코드 청크 이터레이터
+
+    Yields:
+        원본 레코드 청크
+    """
+    while True:
+        with span("fetch"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _transform_chunk(
+    raw_chunk: list[dict], per_record: bool
+) -> tuple[list[dict], list[bytes], list[Exception | None]]:
+    """원본 레코드 청크를 캐노니컬 레코드와 백엔드 페이로드로 변환
+
+    청크는 열 단위로 변환하고 레코드마다 모델 검증은 한 번만 하며, 같은 모델에서
+    후처리용 딕셔너리와 백엔드 JSON 바이트를 만든다. 변환 프로세스 풀이 켜져
+    있으면 큰 청크는 풀에서 변환한다. 레코드별 구간을 기록할 때는 호출한
+    스레드에서 한 건씩 변환한다. 변환에 실패한 행은 결과에서 빼고 에러 마스크에
+    남긴다.
+
+    Args:
+        raw_chunk: 원본 레코드 청크
+        per_record: 레코드마다 transform 구간을 기록할지 여부
+
+    Returns:
+        (변환된 캐노니컬 레코드 목록, 레코드별 직렬화된 백엔드 페이로드,
+        원본 행별 예외 또는 None)
+    """
+    timings = current_timings() if per_record else None
+    if timings is None:
+        with span("transform"):
+            transformed = transform_in_pool(raw_chunk)
+            if transformed is not None:
+                return transformed
+            results, errors = to_canonical_batch(raw_chunk)
+            payloads = [payload for payload in results if payload is not None]
+            canonical_records = [payload.model_dump() for payload in payloads]
+    else:
+        payloads = []
+        canonical_records = []
+        errors = []
+        for raw in raw_chunk:
+            with timings.span("transform"):
+                try:
+                    payload = to_canonical(raw)
+                except Exception as exc:
+                    errors.append(exc)
+                    continue
+                canonical_records.append(payload.model_dump())
+            payloads.append(payload)
+            errors.append(None)
+    return canonical_records, _encode_records(payloads), errors
+
+
+def _log_transform_failures(hospital, errors: list[Exception | None]) -> None:
+    """변환에 실패해 건너뛴 행을 청크마다 한 번 기록
+
+    실패한 행은 전송하지 않고 나머지 행만 진행한다. 메시지에는 첫 번째 실패
+    행의 위치와 예외를 남긴다.
+
+    Args:
+        hospital: 병원 설정 객체
+        errors: 원본 행별 변환 예외 또는 None
+    """
+    failed = [(index, error) for index, error in enumerate(errors) if error]
+    if not failed:
+        return
+    index, error = failed[0]
+    log_event(
+        "transform_failed",
+        "ERROR",
+        hospital.hospital_id,
+        "transform",
+        f"변환 실패 행 {len(failed)}건 건너뜀(첫 행 {index}: {error})",
+        error_code=error.code if isinstance(error, PipelineError) else "TX_PARSE_001",
+        record_count=len(failed),
+    )
+
+
+def _watermark_value(record: dict, column: str) -> object | None:
+    """원본 레코드에서 워터마크 컬럼 값을 조회
+
+    DB 드라이버가 컬럼명을 대문자로 돌려주는 경우를 위해 대소문자를 무시한다.
+
+    Args:
+        record: 원본 레코드
+        column: 워터마크 컬럼명
+
+    Returns:
+        워터마크 값 또는 None
+    """
+    if column in record:
+        return record[column]
+    lowered = column.lower()
+    for key, value in record.items():
+        if str(key).lower() == lowered:
+            return value
+    return None
+
+
+def _chunk_marks(
+    raw_chunk: list[dict],
+    column: str,
+    key_column: str | None,
+    previous_tail: object | None,
+) -> tuple[object | None, object | None]:
+    """처리를 마친 청크에서 저장할 워터마크와 청크 끝 값을 계산
+
+    키 컬럼이 있으면 마지막 행의 (값, 키) 쌍이 곧 안전한 워터마크다. 키가 없으면
+    다음 청크에 같은 값의 행이 더 있을 수 있으므로 마지막 값보다 작은 값 중
+    가장 큰 값까지만 저장하고, 마지막 값은 조회가 끝까지 진행됐을 때 저장한다.
+
+    Args:
+        raw_chunk: 원본 레코드 청크(워터마크 순으로 정렬됨)
+        column: 워터마크 컬럼명
+        key_column: 동률을 구분하는 고유 키 컬럼명
+        previous_tail: 이전 청크의 끝 값
+
+    Returns:
+        (지금 저장할 워터마크 또는 None, 청크 끝 값)
+    """
+    tail = _watermark_value(raw_chunk[-1], column)
+    if tail is None:
+        return None, previous_tail
+    if key_column:
+        tail = (tail, _watermark_value(raw_chunk[-1], key_column))
+        return tail, tail
+    for record in reversed(raw_chunk):
+        value = _watermark_value(record, column)
+        if value is not None and value < tail:
+            return value, tail
+    if previous_tail is not None and previous_tail < tail:
+        return previous_tail, tail
+    return None, tail
+
+
+def _encode_records(payloads: list[CanonicalPayload]) -> list[bytes]:
+    """검증된 캐노니컬 모델을 백엔드 JSON 바이트로 직렬화
+
+    Args:
+        payloads: 캐노니컬 모델 목록
+
+    Returns:
+        레코드별 직렬화된 백엔드 페이로드
+    """
+    with span("encode"):
+        return [encode_backend(payload) for payload in payloads]
+
+
+def _send_records(
+    hospital, canonical_records: list[dict], encoded: list[bytes]
+) -> tuple[bool, str | None]:
+    """캐노니컬 레코드를 백엔드로 전송하고 후처리
+
+    전송 시간은 send 구간, 후처리 시간은 postprocess 구간으로 따로 기록한다.
+
+    Args:
+        hospital: 병원 설정 객체
+        canonical_records: 캐노니컬 레코드 목록
+        encoded: 레코드별 직렬화된 백엔드 페이로드
+
+    Returns:
+        후처리 성공 여부, 에러 코드
+    """
+    with span("send"):
+        return _dispatch_records(hospital, canonical_records, encoded)
+
+
+def _dispatch_records(
+    hospital, canonical_records: list[dict], encoded: list[bytes]
+) -> tuple[bool, str | None]:
+    """직렬화된 레코드를 전송 설정에 맞는 방식으로 전송하고 후처리
+
+    `dispatch.concurrency`가 1보다 크거나 `dispatch.adaptive`가 켜져 있으면
+    비동기로 동시에 전송하고, `dispatch.batch_size`가 1보다 크면 일괄
+    엔드포인트로 묶어 전송한다. 전송을 마친 레코드는 한 번에 후처리한다.
+
+    Args:
+        hospital: 병원 설정 객체
+        canonical_records: 캐노니컬 레코드 목록
+        encoded: 레코드별 직렬화된 백엔드 페이로드
+
+    Returns:
+        후처리 성공 여부, 에러 코드
+    """
+    dispatch = hospital.dispatch or {}
+    concurrency = int(dispatch.get("concurrency", 1))
+    batch_size = int(dispatch.get("batch_size", 1))
+    batch_max_bytes = int(dispatch.get("batch_max_bytes", 0))
+    adaptive = dispatch.get("adaptive") or {}
+    limiter = (
+        get_limiter(hospital.hospital_id, dispatch) if adaptive.get("enabled") else None
+    )
+    if concurrency > 1 or limiter is not None:
+        keys = [
+            str((record.get("patient") or {}).get("patient_id", ""))
+            for record in canonical_records
+        ]
+        results = dispatch_records(
+            encoded,
+            keys,
+            concurrency,
+            batch_size,
+            batch_max_bytes,
+            limiter=limiter,
+            max_retries=int(adaptive.get("max_retries", 3)),
+            retry_backoff=float(adaptive.get("retry_backoff_ms", 500)) / 1000,
+        )
+        return _postprocess_results(hospital, canonical_records, encoded, results)
+    if batch_size > 1:
+        return _send_batched(
+            hospital, canonical_records, encoded, batch_size, batch_max_bytes
+        )
+    dedup = _dedup_for(hospital)
+    sent: list[dict] = []
+    try:
+        for record, item in zip(canonical_records, encoded):
+            response = send_encoded(item)
+            _ = from_backend(response)
+            if dedup is not None:
+                dedup.add(content_hash(item))
+            sent.append(record)
+    except Exception:
+        _postprocess_sent(hospital, sent)
+        raise
+    return _postprocess_sent(hospital, sent)
+
+
+def _send_batched(
+    hospital,
+    canonical_records: list[dict],
+    encoded: list[bytes],
+    batch_size: int,
+    batch_max_bytes: int,
+) -> tuple[bool, str | None]:
+    """캐노니컬 레코드를 배치로 순차 전송하고 항목별로 후처리
+
+    Args:
+        hospital: 병원 설정 객체
+        canonical_records: 캐노니컬 레코드 목록
+        encoded: 레코드별 직렬화된 백엔드 페이로드
+        batch_size: 배치당 최대 건수
+        batch_max_bytes: 배치당 최대 바이트
+
+    Returns:
+        후처리 성공 여부, 에러 코드
+    """
+    offset = 0
+    for batch in iter_batches(encoded, batch_size, batch_max_bytes):
+        records = canonical_records[offset : offset + len(batch)]
+        offset += len(batch)
+        postprocess_ok, postprocess_code = _postprocess_results(
+            hospital, records, batch, send_batch(batch)
+        )
+        if not postprocess_ok:
+            return False, postprocess_code
+    return True, None
+
+
+def _postprocess_results(
+    hospital,
+    canonical_records: list[dict],
+    encoded: list[bytes],
+    results: list[dict | Exception],
+) -> tuple[bool, str | None]:
+    """항목별 전송 결과를 백엔드 응답으로 변환하고 후처리
+
+    실패 항목은 후처리하지 않으며, 나머지 항목을 일괄 후처리한 뒤 예외로 알린다.
+
+    Args:
+        hospital: 병원 설정 객체
+        canonical_records: 캐노니컬 레코드 목록
+        encoded: 레코드별 직렬화된 백엔드 페이로드
+        results: 항목별 백엔드 응답 또는 전송 예외
+
+    Returns:
+        후처리 성공 여부, 에러 코드
+
+    Raises:
+        Exception: 전송에 실패한 항목이 있을 때 첫 전송 예외
+        PipelineError: 백엔드가 일부 항목을 거부했을 때
+    """
+    dedup = _dedup_for(hospital)
+    sent: list[dict] = []
+    first_error: Exception | None = None
+    rejected = 0
+    for record, item, result in zip(canonical_records, encoded, results):
+        if isinstance(result, Exception):
+            first_error = first_error or result
+            continue
+        if result.get("error"):
+            rejected += 1
+            continue
+        _ = from_backend(result)
+        if dedup is not None:
+            dedup.add(content_hash(item))
+        sent.append(record)
+    postprocess_ok, postprocess_code = _postprocess_sent(hospital, sent)
+    if not postprocess_ok:
+        return False, postprocess_code
+    if first_error is not None:
+        raise first_error
+    if rejected:
+        raise PipelineError(
+            "API_RESP_002", f"백엔드 항목 거부: {rejected}/{len(canonical_records)}"
+        )
+    return True, None
+
+
+def _postprocess_sent(hospital, records: list[dict]) -> tuple[bool, str | None]:
+    """전송을 마친 레코드를 일괄 후처리
+
+    Args:
+        hospital: 병원 설정 객체
+        records: 전송을 마친 캐노니컬 레코드 목록
+
+    Returns:
+        후처리 성공 여부, 첫 번째 에러 코드
+    """
+    count_records(hospital.hospital_id, "sent", len(records))
+    with span("postprocess"):
+        codes = [code for code in run_postprocess_batch(hospital, records) if code]
+    if hospital.postprocess:
+        count_records(hospital.hospital_id, "postprocessed", len(records) - len(codes))
+    if codes:
+        return False, codes[0]
+    return True, None
+
+
+def _dedup_for(hospital) -> DedupCache | None:
+    """병원 중복 제거가 활성화되어 있으면 인덱스를 반환
+
+    Args:
+        hospital: 병원 설정 객체
+
+    Returns:
+        중복 제거 인덱스 또는 None
+    """
+    if not (hospital.dedup or {}).get("enabled"):
+        return None
+    return get_dedup(hospital.hospital_id, hospital.dedup)
+
+
+def _skip_duplicates(
+    dedup: DedupCache, canonical_records: list[dict], encoded: list[bytes]
+) -> tuple[list[dict], list[bytes], list[dict]]:
+    """이미 전송된 페이로드와 내용이 같은 레코드를 제외
+
+    Args:
+        dedup: 중복 제거 인덱스
+        canonical_records: 캐노니컬 레코드 목록
+        encoded: 레코드별 직렬화된 백엔드 페이로드
+
+    Returns:
+        전송할 캐노니컬 레코드, 직렬화된 백엔드 페이로드, 제외한 캐노니컬 레코드
+    """
+    with span("dedup"):
+        duplicate = [dedup.contains(content_hash(item)) for item in encoded]
+    kept = [index for index, skip in enumerate(duplicate) if not skip]
+    return (
+        [canonical_records[index] for index in kept],
+        [encoded[index] for index in kept],
+        [record for record, skip in zip(canonical_records, duplicate) if skip],
+    )
+
+
+def _postprocess_duplicates(hospital, records: list[dict]) -> tuple[bool, str | None]:
+    """전송을 생략한 중복 레코드의 원본 행을 처리 완료로 표시
+
+    `update_flag` 후처리는 원본 행이 다시 조회되지 않게 하므로, 같은 내용이 이미
+    전송된 행도 표시하지 않으면 매 실행 다시 조회되고 중복 인덱스 TTL이 지나면
+    다시 전송된다. `insert_log`는 전송 기록이므로 전송하지 않은 레코드에는
+    실행하지 않는다.
+
+    Args:
+        hospital: 병원 설정 객체
+        records: 전송을 생략한 캐노니컬 레코드 목록
+
+    Returns:
+        후처리 성공 여부, 첫 번째 에러 코드
+    """
+    if not records or (hospital.postprocess or {}).get("mode") != "update_flag":
+        return True, None
+    with span("postprocess"):
+        codes = [code for code in run_postprocess_batch(hospital, records) if code]
+    count_records(hospital.hospital_id, "postprocessed", len(records) - len(codes))
+    if codes:
+        return False, codes[0]
+    return True, None
+
+
+def _spool_for(hospital) -> Spool | None:
+    """병원 스풀이 활성화되어 있으면 스풀을 반환
+
+    Args:
+        hospital: 병원 설정 객체
+
+    Returns:
+        스풀 또는 None
+    """
+    if not (hospital.spool or {}).get("enabled"):
+        return None
+    return get_spool(hospital.hospital_id)
+
+
+def _drain_spool(hospital, spool: Spool) -> tuple[bool, str | None, Exception | None]:
+    """스풀에 쌓인 항목을 오래된 순으로 전송하고 확인(ack)
+
+    청크 단위로 전송/후처리가 모두 끝난 뒤에만 ack하므로 실패한 청크는
+    다음 드레인에서 다시 전송된다.
+
+    Args:
+        hospital: 병원 설정 객체
+        spool: 병원 스풀
+
+    Returns:
+        후처리 성공 여부, 에러 코드, 전송 예외(없으면 None)
+    """
+    chunk_size = int((hospital.spool or {}).get("drain_chunk_size", 500))
+    while True:
+        items = spool.peek(chunk_size)
+        if not items:
+            return True, None, None
+        try:
+            postprocess_ok, postprocess_code = _send_records(
+                hospital,
+                [item.record for item in items],
+                [item.payload for item in items],
+            )
+        except Exception as exc:
+            return True, None, exc
+        if not postprocess_ok:
+            return False, postprocess_code, None
+        spool.ack(items)
+
+
+def _log_postprocess_failed(hospital, postprocess_code: str | None) -> None:
+    """후처리 실패 이벤트를 기록
+
+    Args:
+        hospital: 병원 설정 객체
+        postprocess_code: 후처리 에러 코드
+    """
+    log_event(
+        "postprocess_failed",
+        "ERROR",
+        hospital.hospital_id,
+        "postprocess",
+        "후처리 실패",
+        error_code=postprocess_code,
+        record_count=1,
+    )
+
+
+def _log_spool_stats(hospital, spool: Spool) -> None:
+    """스풀 깊이와 가장 오래된 항목의 대기 시간을 기록
+
+    Args:
+        hospital: 병원 설정 객체
+        spool: 병원 스풀
+    """
+    stats = spool.stats()
+    log_event(
+        "spool_status",
+        "INFO",
+        hospital.hospital_id,
+        "send",
+        f"depth={stats['depth']} oldest_age_seconds={stats['oldest_age_seconds']}",
+        record_count=stats["depth"],
+    )
+
+
+def _log_dispatch_stats(hospital) -> None:
+    """적응형 전송 리미터의 현재 한도와 지연 백분위수를 기록
+
+    Args:
+        hospital: 병원 설정 객체
+    """
+    dispatch = hospital.dispatch or {}
+    if not (dispatch.get("adaptive") or {}).get("enabled"):
+        return
+    stats = get_limiter(hospital.hospital_id, dispatch).snapshot()
+    p95 = stats["latency_p95_ms"]
+    log_event(
+        "dispatch_stats",
+        "INFO",
+        hospital.hospital_id,
+        "send",
+        (
+            f"limit={stats['limit']} batch_size={stats['batch_size']} "
+            f"p50={stats['latency_p50_ms']} p95={p95} p99={stats['latency_p99_ms']} "
+            f"overloads={stats['overloads']}"
+        ),
+        duration_ms=int(p95) if p95 is not None else None,
+    )
+
+
+def _log_stage_timings(hospital, timings: RunTimings) -> None:
+    """실행 한 번의 단계별 소요 시간 요약을 기록
+
+    Args:
+        hospital: 병원 설정 객체
+        timings: 단계 시간 수집기
+    """
+    for stage, stats in timings.summary().items():
+        log_event(
+            "stage_timing",
+            "INFO",
+            hospital.hospital_id,
+            stage,
+            (
+                f"count={stats['count']} total_ms={stats['total_ms']} "
+                f"p50={stats['p50_ms']} p95={stats['p95_ms']} max={stats['max_ms']}"
+            ),
+            duration_ms=int(stats["total_ms"]),
+            record_count=stats["count"],
+        )
+
+
+def _load_watermark(
+    hospital, mark_name: str, coordinator: LeaseCoordinator | None
+) -> object | None:
+    """병원의 마지막 워터마크를 조회
+
+    lease 조정이 켜져 있으면 복제본끼리 공유하는 lease 저장소의 값을 우선하고,
+    아직 없으면(lease 도입 전 상태) 이 복제본의 텔레메트리 DB 값을 사용한다.
+
+    Args:
+        hospital: 병원 설정 객체
+        mark_name: 워터마크 컬럼명
+        coordinator: 실행 시작 시점의 lease 조정기 또는 None
+
+    Returns:
+        워터마크 값 또는 None
+    """
+    if coordinator is not None:
+        mark = coordinator.load_mark(hospital.hospital_id, mark_name)
+        if mark is not None:
+            return mark
+    return TelemetryStore().get_watermark(hospital.hospital_id, mark_name)
+
+
+def _save_watermark(
+    hospital, mark_name: str, mark: object, coordinator: LeaseCoordinator | None
+) -> bool:
+    """병원 워터마크를 저장
+
+    lease 조정이 켜져 있으면 lease를 가진 경우에만 공유 저장소에 기록한다.
+
+    Args:
+        hospital: 병원 설정 객체
+        mark_name: 워터마크 컬럼명
+        mark: 워터마크 값
+        coordinator: 실행 시작 시점의 lease 조정기 또는 None
+
+    Returns:
+        저장했으면 True(lease를 잃어 공유 저장소에 쓰지 못했으면 False)
+    """
+    if coordinator is not None and not coordinator.save_mark(
+        hospital.hospital_id, mark_name, mark
+    ):
+        return False
+    TelemetryStore().set_watermark(hospital.hospital_id, mark_name, mark)
+    return True
+
+
+def _lease_lost(hospital, coordinator: LeaseCoordinator | None) -> bool:
+    """병원 lease를 잃었는지 확인하고 잃었으면 경고를 남김
+
+    Args:
+        hospital: 병원 설정 객체
+        coordinator: 실행 시작 시점의 lease 조정기 또는 None(lease 비활성)
+
+    Returns:
+        lease를 잃어 수집을 멈춰야 하면 True
+    """
+    if coordinator is None or coordinator.holds(hospital.hospital_id):
+        return False
+    _log_lease_lost(hospital)
+    return True
+
+
+def _log_lease_lost(hospital) -> None:
+    """lease를 잃어 수집을 멈춘 사실을 기록
+
+    Args:
+        hospital: 병원 설정 객체
+    """
+    log_event(
+        "lease_lost",
+        "WARNING",
+        hospital.hospital_id,
+        "pipeline",
+        "병원 lease를 잃어 수집 중단",
+    )
+
+
+_run_locks: dict[str, threading.Lock] = {}
+_run_locks_lock = threading.Lock()
+
+
+def _run_lock(hospital) -> threading.Lock:
+    """병원별 실행 잠금을 조회하거나 생성
+
+    스케줄러의 `max_instances`와 별도로 드레인 재실행이나 수동 실행까지 포함해
+    같은 병원은 한 번에 하나만 실행한다. 겹친 실행은 같은 워터마크와 스풀
+    항목을 읽어 같은 행을 두 번 보내고 워터마크와 스풀 커서를 뒤로 돌릴 수
+    있다.
+
+    Args:
+        hospital: 병원 설정 객체
+
+    Returns:
+        병원별 잠금
+    """
+    with _run_locks_lock:
+        lock = _run_locks.get(hospital.hospital_id)
+        if lock is None:
+            lock = _run_locks[hospital.hospital_id] = threading.Lock()
+        return lock
+
+
+def running_hospitals() -> set[str]:
+    """수집이 진행 중인 병원 식별자
+
+    Returns:
+        병원 식별자 집합
+    """
+    with _run_locks_lock:
+        return {
+            hospital_id for hospital_id, lock in _run_locks.items() if lock.locked()
+        }
+
+
+def run_pull_pipeline(hospital) -> bool:
+    """풀 방식 병원의 파이프라인을 실행하고 단계별 소요 시간을 기록
+
+    같은 병원의 실행이 이미 진행 중이면 건너뛴다.
+
+    Args:
+        hospital: 병원 설정 객체
+
+    Returns:
+        `drain.max_records`만큼 가져와 남은 백로그가 있을 수 있으면 True
+    """
+    lock = _run_lock(hospital)
+    if not lock.acquire(blocking=False):
+        log_event(
+            "pipeline_skipped",
+            "WARNING",
+            hospital.hospital_id,
+            "pipeline",
+            "이전 실행이 끝나지 않아 건너뜀",
+        )
+        return False
+    try:
+        mark_run_started(hospital.hospital_id)
+        success, full = False, False
+        try:
+            with (
+                run_timings() as timings,
+                bind_hospital(hospital.hospital_id),
+                dispatch_session(),
+            ):
+                success, full = _run_pull_pipeline(hospital)
+        finally:
+            mark_run_finished(hospital.hospital_id, success)
+        observe_stage_timings(hospital.hospital_id, timings)
+        _log_stage_timings(hospital, timings)
+        return success and full
+    finally:
+        lock.release()
+
+
+def _run_pull_pipeline(hospital) -> tuple[bool, bool]:
     """풀 방식 병원의 파이프라인을 실행
 
+    `drain.max_records`가 설정되면 가져온 건수가 그 값에 도달한 청크까지만
+    처리한다. 워터마크는 청크마다 저장되므로 다음 실행이 이어서 조회한다.
+    키 컬럼 없이 중간에 멈추면 마지막 값과 같은 행은 다음 실행에서 다시 읽는다.
+    lease 조정이 켜져 있으면 청크를 보내기 전마다 lease를 확인하고, 잃었으면
+    그 청크부터 보내지 않고 멈춘다.
+
     Args:
         hospital: 병원 설정 객체
+
+    Returns:
+        (성공 여부, 실행 한도까지 가져왔는지 여부)
     """
     start = datetime.now(timezone.utc)
     log_event("pipeline_start", "INFO", hospital.hospital_id, "fetch", "수집 시작")
     try:
-        if hospital.connector_type == "pull_db_view" and hospital.db:
-            if hospital.db.get("type") == "oracle":
-                raw_records = fetch_oracle(hospital)
-            elif hospital.db.get("type") == "mssql":
-                raw_records = fetch_mssql(hospital)
-            else:
-                raw_records = []
-        elif hospital.connector_type == "pull_rest_api":
-            raw_records = fetch_rest(hospital)
-        else:
-            raw_records = []
-        canonical_records = [to_canonical(raw).model_dump() for raw in raw_records]
+        record_count = 0
         postprocess_ok = True
-        for record in canonical_records:
-            backend_payload = to_backend(CanonicalPayload(**record))
-            response = send_payload(backend_payload)
-            _ = from_backend(response)
-            postprocess_ok, postprocess_code = run_postprocess(hospital, record)
-            if not postprocess_ok:
-                log_event(
-                    "postprocess_failed",
-                    "ERROR",
-                    hospital.hospital_id,
-                    "postprocess",
-                    "후처리 실패",
-                    error_code=postprocess_code,
-                    record_count=1,
+        postprocess_code: str | None = None
+        send_error: Exception | None = None
+        watermark_column = (hospital.db or {}).get("watermark_column")
+        key_column = (hospital.db or {}).get("watermark_key_column")
+        mark_name = (
+            f"{watermark_column},{key_column}" if key_column else watermark_column
+        )
+        coordinator = active_coordinator()
+        last_mark = (
+            _load_watermark(hospital, mark_name, coordinator)
+            if watermark_column
+            else None
+        )
+        tail_mark: object | None = None
+        saved_mark = last_mark
+        skipped_count = 0
+        fetched_count = 0
+        full = False
+        max_records = int((hospital.drain or {}).get("max_records", 0))
+        dedup = _dedup_for(hospital)
+        spool = _spool_for(hospital)
+        if spool is not None and not _lease_lost(hospital, coordinator):
+            postprocess_ok, postprocess_code, send_error = _drain_spool(hospital, spool)
+        per_record = bool((hospital.timing or {}).get("per_record"))
+        with closing(_iter_raw_chunks(hospital, last_mark)) as chunks:
+            for raw_chunk in _timed_chunks(chunks):
+                if _lease_lost(hospital, coordinator):
+                    break
+                fetched_count += len(raw_chunk)
+                count_records(hospital.hospital_id, "fetched", len(raw_chunk))
+                canonical_records, encoded, errors = _transform_chunk(
+                    raw_chunk, per_record
                 )
-                break
+                _log_transform_failures(hospital, errors)
+                count_records(
+                    hospital.hospital_id, "transformed", len(canonical_records)
+                )
+                record_count += len(canonical_records)
+                if dedup is not None:
+                    canonical_records, encoded, duplicates = _skip_duplicates(
+                        dedup, canonical_records, encoded
+                    )
+                    skipped_count += len(duplicates)
+                    duplicates_ok, duplicates_code = _postprocess_duplicates(
+                        hospital, duplicates
+                    )
+                    if not duplicates_ok:
+                        postprocess_ok, postprocess_code = False, duplicates_code
+                        if spool is None:
+                            _log_postprocess_failed(hospital, postprocess_code)
+                        break
+                if spool is not None:
+                    with span("spool"):
+                        spool.enqueue(canonical_records, encoded)
+                    if dedup is not None:
+                        for item in encoded:
+                            dedup.add(content_hash(item))
+                    if postprocess_ok and send_error is None:
+                        postprocess_ok, postprocess_code, send_error = _drain_spool(
+                            hospital, spool
+                        )
+                elif canonical_records:
+                    postprocess_ok, postprocess_code = _send_records(
+                        hospital, canonical_records, encoded
+                    )
+                    if not postprocess_ok:
+                        _log_postprocess_failed(hospital, postprocess_code)
+                        break
+                if watermark_column:
+                    chunk_mark, tail_mark = _chunk_marks(
+                        raw_chunk, watermark_column, key_column, tail_mark
+                    )
+                    if chunk_mark is not None and chunk_mark != saved_mark:
+                        if not _save_watermark(
+                            hospital, mark_name, chunk_mark, coordinator
+                        ):
+                            _log_lease_lost(hospital)
+                            break
+                        saved_mark = chunk_mark
+                if max_records and fetched_count >= max_records:
+                    full = True
+                    break
+            else:
+                if tail_mark is not None and tail_mark != saved_mark:
+                    _save_watermark(hospital, mark_name, tail_mark, coordinator)
+        if skipped_count:
+            log_event(
+                "dedup_skipped",
+                "INFO",
+                hospital.hospital_id,
+                "send",
+                "내용이 같은 레코드 전송 생략",
+                record_count=skipped_count,
+            )
+        if spool is not None:
+            if not postprocess_ok:
+                _log_postprocess_failed(hospital, postprocess_code)
+            _log_spool_stats(hospital, spool)
+            if send_error is not None:
+                raise send_error
+        _log_dispatch_stats(hospital)
         log_event(
             "pipeline_complete",
             "INFO",
             hospital.hospital_id,
             "postprocess",
             "파이프라인 완료",
-            record_count=len(canonical_records),
+            record_count=record_count,
             duration_ms=int(
                 (datetime.now(timezone.utc) - start).total_seconds() * 1000
             ),
@@ -77,13 +886,16 @@ def run_pull_pipeline(hospital) -> None:
                 "postprocess_fail_count": 0 if postprocess_ok else 1,
             }
         )
+        return True, full
     except Exception as exc:
+        error_code = exc.code if isinstance(exc, PipelineError) else "PIPE_STAGE_001"
         log_event(
             "pipeline_failed",
             "ERROR",
             hospital.hospital_id,
             "pipeline",
             str(exc),
+            error_code=error_code,
         )
         TelemetryStore().update_status(
             {
@@ -93,7 +905,12 @@ def run_pull_pipeline(hospital) -> None:
                 .replace("+00:00", "Z"),
                 "last_success_at": None,
                 "last_status": "실패",
-                "last_error_code": "PIPE_STAGE_001",
+                "last_error_code": error_code,
                 "postprocess_fail_count": 1,
             }
         )
+        return False, False
+    finally:
+        dedup = _dedup_for(hospital)
+        if dedup is not None:
+            dedup.save()
@@ -155,3 +155,175 @@ def _insert_log(
             conn.commit()
         return True, None
     return False, "POSTPROCESS_DB_UNSUPPORTED"
+
+
+def run_postprocess_batch(
+    hospital: HospitalConfig, records: list[dict]
+) -> list[str | None]:
+    """여러 레코드의 후처리를 한 커넥션과 한 번의 커밋으로 실행
+
+    Oracle은 `batcherrors` 배열 DML로, MSSQL은 `fast_executemany`로 실행한다.
+    실패한 행만 `retry` 횟수까지 다시 실행한다.
+
+    Args:
+        hospital: 병원 설정 객체
+        records: 레코드 데이터 목록
+
+    Returns:
+        레코드별 에러 코드(성공이면 None)
+    """
+    if hospital.postprocess is None or not records:
+        return [None] * len(records)
+    db_type = (hospital.db or {}).get("type")
+    mode = hospital.postprocess.get("mode")
+    if mode == "update_flag":
+        query, codes, rows = _update_flag_rows(hospital, records, db_type)
+    elif mode == "insert_log":
+        query, codes, rows = _insert_log_rows(hospital, records, db_type)
+    else:
+        return ["POSTPROCESS_UNSUPPORTED"] * len(records)
+    if query is None or not rows:
+        return codes
+    if db_type not in {"oracle", "mssql"}:
+        for index, _ in rows:
+            codes[index] = "POSTPROCESS_DB_UNSUPPORTED"
+        return codes
+
+    pending = rows
+    for _ in range(int(hospital.postprocess.get("retry", 3))):
+        failed = _execute_batch(
+            hospital.db, db_type, query, [values for _, values in pending]
+        )
+        pending = [row for position, row in enumerate(pending) if position in failed]
+        if not pending:
+            break
+    for index, _ in pending:
+        codes[index] = "POSTPROCESS_FAILED"
+    return codes
+
+
+def _placeholders(db_type: str | None, count: int) -> list[str]:
+    """DB 종류별 위치 바인드 변수
+
+    Args:
+        db_type: DB 종류
+        count: 바인드 변수 수
+
+    Returns:
+        바인드 변수 목록
+    """
+    if db_type == "oracle":
+        return [f":{position}" for position in range(1, count + 1)]
+    return ["?"] * count
+
+
+def _update_flag_rows(
+    hospital: HospitalConfig, records: list[dict], db_type: str | None
+) -> tuple[str | None, list[str | None], list[tuple[int, list]]]:
+    """플래그 업데이트 SQL과 레코드별 바인드 값을 생성
+
+    Args:
+        hospital: 병원 설정 객체
+        records: 레코드 데이터 목록
+        db_type: DB 종류
+
+    Returns:
+        SQL(설정 누락 시 None), 레코드별 에러 코드, (레코드 위치, 바인드 값) 목록
+    """
+    if not hospital.db or not hospital.postprocess:
+        return None, ["POSTPROCESS_CONFIG_MISSING"] * len(records), []
+    table = hospital.postprocess.get("table")
+    key_column = hospital.postprocess.get("key_column")
+    flag_column = hospital.postprocess.get("flag_column")
+    flag_value = hospital.postprocess.get("flag_value")
+    if not all([table, key_column, flag_column]):
+        return None, ["POSTPROCESS_CONFIG_MISSING"] * len(records), []
+    flag_bind, key_bind = _placeholders(db_type, 2)
+    query = f"UPDATE {table} SET {flag_column} = {flag_bind} WHERE {key_column} = {key_bind}"
+    codes: list[str | None] = [None] * len(records)
+    rows: list[tuple[int, list]] = []
+    for index, record in enumerate(records):
+        key_value = _resolve_value(
+            hospital.postprocess.get("key_value_source"),
+            record,
+            hospital.postprocess.get("key_value"),
+        )
+        if key_value is None:
+            codes[index] = "POSTPROCESS_KEY_MISSING"
+            continue
+        rows.append((index, [flag_value, key_value]))
+    return query, codes, rows
+
+
+def _insert_log_rows(
+    hospital: HospitalConfig, records: list[dict], db_type: str | None
+) -> tuple[str | None, list[str | None], list[tuple[int, list]]]:
+    """로그 삽입 SQL과 레코드별 바인드 값을 생성
+
+    Args:
+        hospital: 병원 설정 객체
+        records: 레코드 데이터 목록
+        db_type: DB 종류
+
+    Returns:
+        SQL(설정 누락 시 None), 레코드별 에러 코드, (레코드 위치, 바인드 값) 목록
+    """
+    if not hospital.db or not hospital.postprocess:
+        return None, ["POSTPROCESS_CONFIG_MISSING"] * len(records), []
+    table = hospital.postprocess.get("table")
+    columns = hospital.postprocess.get("columns", [])
+    values_map = hospital.postprocess.get("values", {})
+    sources_map = hospital.postprocess.get("sources", {})
+    if not table or not columns:
+        return None, ["POSTPROCESS_CONFIG_MISSING"] * len(records), []
+    placeholders = ", ".join(_placeholders(db_type, len(columns)))
+    column_sql = ", ".join(columns)
+    query = f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})"
+    codes: list[str | None] = [None] * len(records)
+    rows: list[tuple[int, list]] = []
+    for index, record in enumerate(records):
+        values = [
+            _resolve_value(sources_map.get(col), record, values_map.get(col))
+            for col in columns
+        ]
+        if any(value is None for value in values):
+            codes[index] = "POSTPROCESS_VALUE_MISSING"
+            continue
+        rows.append((index, values))
+    return query, codes, rows
+
+
+def _execute_batch(db: dict, db_type: str, query: str, rows: list[list]) -> set[int]:
+    """한 커넥션에서 여러 행을 실행하고 한 번 커밋
+
+    Args:
+        db: DB 설정
+        db_type: DB 종류
+        query: SQL
+        rows: 행별 바인드 값
+
+    Returns:
+        실패한 행의 위치
+    """
+    if db_type == "oracle":
+        with oracle_connection(db) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, rows, batcherrors=True)
+            failed = {error.offset for error in cursor.getbatcherrors()}
+            conn.commit()
+        return failed
+    with mssql_connection(db) as conn:
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+        failed = set()
+        try:
+            cursor.executemany(query, rows)
+        except Exception:
+            conn.rollback()
+            for position, values in enumerate(rows):
+                try:
+                    cursor.execute(query, values)
+                except Exception:
+                    failed.add(position)
+        conn.commit()
+    return failed
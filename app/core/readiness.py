@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+import time
+
+_STARTED_AT = time.time()
+
+
+class _HospitalState:
+    """병원 하나의 실행/백엔드 응답 상태"""
+
+    __slots__ = (
+        "run_started_at",
+        "in_progress",
+        "last_finished_at",
+        "last_success_at",
+        "last_failed",
+        "backend_latency_ms",
+        "backend_seen_at",
+    )
+
+    def __init__(self) -> None:
+        self.run_started_at: float | None = None
+        self.in_progress = False
+        self.last_finished_at: float | None = None
+        self.last_success_at: float | None = None
+        self.last_failed = False
+        self.backend_latency_ms: float | None = None
+        self.backend_seen_at: float | None = None
+
+
+_states: dict[str, _HospitalState] = {}
+_lock = threading.Lock()
+
+
+def _state(hospital_id: str) -> _HospitalState:
+    """병원 상태를 조회하거나 생성(잠금 안에서 호출)
+
+    Args:
+        hospital_id: 병원 식별자
+
+    Returns:
+        병원 상태
+    """
+    state = _states.get(hospital_id)
+    if state is None:
+        state = _states[hospital_id] = _HospitalState()
+    return state
+
+
+def mark_run_started(hospital_id: str) -> None:
+    """파이프라인 실행 시작을 기록
+
+    Args:
+        hospital_id: 병원 식별자
+    """
+    with _lock:
+        state = _state(hospital_id)
+        state.in_progress = True
+        state.run_started_at = time.time()
+
+
+def mark_run_finished(hospital_id: str, success: bool) -> None:
+    """파이프라인 실행 종료를 기록
+
+    Args:
+        hospital_id: 병원 식별자
+        success: 실행 성공 여부
+    """
+    now = time.time()
+    with _lock:
+        state = _state(hospital_id)
+        state.in_progress = False
+        state.last_finished_at = now
+        state.last_failed = not success
+        if success:
+            state.last_success_at = now
+
+
+def record_backend_latency(hospital_id: str, latency_ms: float) -> None:
+    """마지막 백엔드 왕복 지연을 기록
+
+    Args:
+        hospital_id: 병원 식별자
+        latency_ms: 요청부터 응답 헤더 수신까지의 시간(밀리초)
+    """
+    with _lock:
+        state = _state(hospital_id)
+        state.backend_latency_ms = latency_ms
+        state.backend_seen_at = time.time()
+
+
+def _age(timestamp: float | None, now: float) -> float | None:
+    """기록 시각부터 지난 시간(초)
+
+    Args:
+        timestamp: 기록 시각(epoch 초)
+        now: 현재 시각(epoch 초)
+
+    Returns:
+        경과 시간 또는 None
+    """
+    return round(now - timestamp, 1) if timestamp is not None else None
+
+
+def hospital_readiness(hospital_id: str, stale_after_seconds: float) -> dict:
+    """병원의 준비 상태를 메모리 값만으로 계산
+
+    성공한 실행이 없으면 프로세스 시작 시각부터 경과 시간을 센다.
+
+    Args:
+        hospital_id: 병원 식별자
+        stale_after_seconds: 마지막 성공 후 이 시간이 지나면 stale로 판단
+
+    Returns:
+        hospital_id, in_progress, run_elapsed_seconds, seconds_since_success,
+        last_run_failed, backend_latency_ms, backend_latency_age_seconds, stale
+    """
+    now = time.time()
+    with _lock:
+        state = _states.get(hospital_id) or _HospitalState()
+        since_success = now - (state.last_success_at or _STARTED_AT)
+        return {
+            "hospital_id": hospital_id,
+            "in_progress": state.in_progress,
+            "run_elapsed_seconds": (
+                _age(state.run_started_at, now) if state.in_progress else None
+            ),
+            "seconds_since_success": _age(state.last_success_at, now),
+            "last_run_failed": state.last_failed,
+            "backend_latency_ms": (
+                round(state.backend_latency_ms, 1)
+                if state.backend_latency_ms is not None
+                else None
+            ),
+            "backend_latency_age_seconds": _age(state.backend_seen_at, now),
+            "stale": since_success > stale_after_seconds,
+        }
@@ -1,39 +1,320 @@
 from __future__ import annotations
 
+import logging
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+from apscheduler.events import (
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_SUBMITTED,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from app.core.config import AppConfig
-from app.core.pipeline import run_pull_pipeline
+from app.core.config import AppConfig, HospitalConfig, get_settings, reload_app_config
+from app.core.lease import (
+    LeaseCoordinator,
+    build_lease_backend,
+    default_replica_id,
+    set_active_coordinator,
+)
+from app.core.metrics import set_scheduler_lag
+from app.core.pipeline import run_pull_pipeline, running_hospitals
+from app.core.telemetry import TelemetryStore
 
 _scheduler: BackgroundScheduler | None = None
+_pull_hospitals: list[HospitalConfig] = []
+_drain_runs: dict[str, int] = {}
+_coordinator: LeaseCoordinator | None = None
+
+PULL_CONNECTORS = {"pull_db_view", "pull_rest_api"}
 
 
 def start_scheduler(config: AppConfig) -> BackgroundScheduler:
     """풀 커넥터용 백그라운드 스케줄러를 시작
 
+    활성화된 풀 병원마다 수집 작업을 하나씩 등록하고 `SCHEDULER_MAX_WORKERS`
+    크기의 공용 스레드 풀에서 실행한다. 같은 병원은 한 번에 하나만 실행하며,
+    텔레메트리 유지보수 작업은 별도 단일 스레드에서
+    실행해 수집 슬롯을 차지하지 않는다. 밀린 실행은 한 번으로 합쳐(coalesce)
+    늦더라도 실행하고, 실행 한도까지 가져온 병원은 간격을 기다리지 않고 바로
+    다시 실행한다. `LEASE_BACKEND`가 설정되면 lease를 가진 병원만 등록한다.
+
     Args:
         config: 병원 설정 객체
 
     Returns:
         BackgroundScheduler 인스턴스
     """
-    global _scheduler
+    global _scheduler, _pull_hospitals, _coordinator
     if _scheduler and _scheduler.running:
         _scheduler.shutdown(wait=False)
-    scheduler = BackgroundScheduler()
-    hospital = config.hospital
-    if hospital.enabled and hospital.connector_type in {
-        "pull_db_view",
-        "pull_rest_api",
-    }:
+    if _coordinator is not None:
+        _coordinator.reset()
+    settings = get_settings()
+    scheduler = BackgroundScheduler(
+        executors={
+            "default": ThreadPoolExecutor(max(1, settings.scheduler_max_workers)),
+            "maintenance": ThreadPoolExecutor(1),
+            "coordination": ThreadPoolExecutor(1),
+        }
+    )
+    pull_hospitals = [
+        hospital
+        for hospital in config.all_hospitals()
+        if hospital.enabled and hospital.connector_type in PULL_CONNECTORS
+    ]
+    backend = build_lease_backend(settings)
+    coordinator = (
+        LeaseCoordinator(
+            backend,
+            settings.replica_id or default_replica_id(),
+            settings.lease_ttl_seconds,
+        )
+        if backend is not None
+        else None
+    )
+    set_active_coordinator(coordinator)
+    if coordinator is None:
+        for hospital in pull_hospitals:
+            _add_pull_job(scheduler, hospital)
+    else:
+        _warn_replica_local_state(pull_hospitals)
         scheduler.add_job(
-            run_pull_pipeline,
+            _rebalance_leases,
             "interval",
-            minutes=hospital.schedule_minutes,
-            args=[hospital],
-            id=f"pull-{hospital.hospital_id}",
+            seconds=settings.lease_renew_seconds,
+            args=[scheduler, coordinator, pull_hospitals],
+            id="lease-rebalance",
+            executor="coordination",
+            next_run_time=datetime.now(timezone.utc),
+            coalesce=True,
             replace_existing=True,
         )
-    scheduler.start()
+    scheduler.add_job(
+        run_telemetry_maintenance,
+        "interval",
+        minutes=settings.telemetry_maintenance_minutes,
+        id="telemetry-maintenance",
+        executor="maintenance",
+        replace_existing=True,
+    )
+    scheduler.add_listener(_record_job_lag, EVENT_JOB_SUBMITTED)
+    scheduler.add_listener(partial(_continue_drain, scheduler), EVENT_JOB_EXECUTED)
     _scheduler = scheduler
+    _pull_hospitals = pull_hospitals
+    _coordinator = coordinator
+    scheduler.start()
     return scheduler
+
+
+def _add_pull_job(
+    scheduler: BackgroundScheduler, hospital: HospitalConfig, run_now: bool = False
+) -> None:
+    """병원 수집 작업을 등록
+
+    Args:
+        scheduler: 스케줄러
+        hospital: 병원 설정 객체
+        run_now: 첫 실행을 간격을 기다리지 않고 바로 시작할지 여부
+    """
+    options = {"next_run_time": datetime.now(timezone.utc)} if run_now else {}
+    scheduler.add_job(
+        run_pull_pipeline,
+        "interval",
+        minutes=hospital.schedule_minutes,
+        args=[hospital],
+        id=f"pull-{hospital.hospital_id}",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=None,
+        replace_existing=True,
+        **options,
+    )
+
+
+def _warn_replica_local_state(hospitals: list[HospitalConfig]) -> None:
+    """lease로 나누는 병원 중 복제본별 중복 제거 인덱스를 쓰는 병원을 경고
+
+    워터마크는 lease 저장소에 공유되지만 중복 제거 인덱스는 각 복제본의
+    디렉터리에 남으므로, 병원이 다른 복제본으로 넘어가면 이어지지 않는다.
+    스풀은 설정 로드 시 lease 분할과 함께 쓸 수 없도록 거부된다.
+
+    Args:
+        hospitals: lease 대상 병원 설정 목록
+    """
+    for hospital in hospitals:
+        if (hospital.dedup or {}).get("enabled"):
+            logging.getLogger("vtc-link").warning(
+                "병원 %s의 dedup 상태는 복제본마다 따로 저장되어 lease 인계 시 "
+                "이어지지 않음",
+                hospital.hospital_id,
+            )
+
+
+def _remove_pull_job(scheduler: BackgroundScheduler, job_id: str) -> None:
+    """등록된 수집 작업을 해제(없으면 무시)
+
+    Args:
+        scheduler: 스케줄러
+        job_id: 작업 식별자
+    """
+    try:
+        scheduler.remove_job(job_id)
+    except JobLookupError:
+        pass
+
+
+def _rebalance_leases(
+    scheduler: BackgroundScheduler,
+    coordinator: LeaseCoordinator,
+    hospitals: list[HospitalConfig],
+) -> None:
+    """lease를 갱신하고 소유가 바뀐 병원의 수집 작업을 등록/해제
+
+    새로 넘겨받은 병원은 이전 소유자가 남긴 백로그를 따라잡도록 바로 실행한다.
+    실행 중인 병원은 끝날 때까지 반납을 미룬다. 갱신이 실패하면(예: 저장소
+    잠김) lease가 만료된 뒤 두 복제본이 함께 수집하지 않도록 모든 수집 작업을
+    해제하고, 다음 갱신이 성공하면 다시 등록한다.
+
+    Args:
+        scheduler: 스케줄러
+        coordinator: lease 조정기
+        hospitals: lease 대상 병원 설정 목록
+    """
+    by_id = {hospital.hospital_id: hospital for hospital in hospitals}
+    try:
+        acquired, lost = coordinator.rebalance(list(by_id), running_hospitals())
+    except Exception:
+        logging.getLogger("vtc-link").exception(
+            "병원 lease 갱신 실패(%s): 모든 수집 작업 해제", coordinator.owner
+        )
+        coordinator.reset()
+        for job in scheduler.get_jobs():
+            if job.id.startswith("pull-"):
+                _remove_pull_job(scheduler, job.id)
+        return
+    for hospital_id in lost:
+        _remove_pull_job(scheduler, f"pull-{hospital_id}")
+    for hospital_id in acquired:
+        _add_pull_job(scheduler, by_id[hospital_id], run_now=True)
+    if acquired or lost:
+        logging.getLogger("vtc-link").info(
+            "병원 lease 변경(%s): 획득 %s, 반납 %s",
+            coordinator.owner,
+            sorted(acquired),
+            sorted(lost),
+        )
+
+
+def reload_scheduler() -> None:
+    """설정 파일을 다시 읽고 스케줄러가 활성화되어 있으면 재시작"""
+    config = reload_app_config()
+    if get_settings().scheduler_enabled:
+        start_scheduler(config)
+
+
+def shutdown_scheduler() -> None:
+    """스케줄러를 멈추고 소유한 lease를 반납해 다른 복제본이 바로 넘겨받게 함
+
+    진행 중인 수집은 다음 청크 전에 멈추도록 소유 상태를 먼저 비우고, 그 실행이
+    끝날 때까지(최대 lease 만료 시간) 기다린 뒤 저장소의 lease를 반납한다.
+    """
+    global _scheduler, _coordinator
+    scheduler, _scheduler = _scheduler, None
+    coordinator, _coordinator = _coordinator, None
+    if scheduler is not None and scheduler.running:
+        scheduler.shutdown(wait=False)
+    if coordinator is not None:
+        held = coordinator.held()
+        coordinator.reset()
+        deadline = time.monotonic() + coordinator.ttl_seconds
+        while running_hospitals() & held and time.monotonic() < deadline:
+            time.sleep(0.05)
+        coordinator.release_all()
+    set_active_coordinator(None)
+
+
+def scheduler_running() -> bool:
+    """백그라운드 스케줄러 실행 여부
+
+    Returns:
+        실행 중이면 True
+    """
+    return _scheduler is not None and _scheduler.running
+
+
+def scheduled_hospitals() -> list[HospitalConfig]:
+    """스케줄러에 수집 작업이 등록된 병원 목록
+
+    lease 조정이 켜져 있으면 이 복제본이 lease를 가진 병원만 반환한다.
+
+    Returns:
+        병원 설정 목록
+    """
+    if _coordinator is None:
+        return list(_pull_hospitals)
+    held = _coordinator.held()
+    return [hospital for hospital in _pull_hospitals if hospital.hospital_id in held]
+
+
+def _record_job_lag(event: JobSubmissionEvent) -> None:
+    """작업이 예정 시각보다 늦게 제출된 시간을 지표에 기록
+
+    Args:
+        event: 작업 제출 이벤트
+    """
+    if not event.scheduled_run_times:
+        return
+    scheduled = max(event.scheduled_run_times)
+    lag = (datetime.now(timezone.utc) - scheduled).total_seconds()
+    hospital_id = (
+        event.job_id[len("pull-") :] if event.job_id.startswith("pull-") else "-"
+    )
+    set_scheduler_lag(hospital_id, event.job_id, lag)
+
+
+def _continue_drain(scheduler: BackgroundScheduler, event: JobExecutionEvent) -> None:
+    """실행 한도까지 가져온 병원의 다음 실행을 즉시 예약(드레인 모드)
+
+    연속 드레인 실행은 `drain.max_consecutive`(기본 20)회로 제한하고, 한도에
+    못 미친 실행이 나오면 원래 간격으로 돌아간다.
+
+    Args:
+        scheduler: 작업을 등록한 스케줄러
+        event: 작업 실행 완료 이벤트
+    """
+    if not event.job_id.startswith("pull-"):
+        return
+    hospital_id = event.job_id[len("pull-") :]
+    hospital = next(
+        (item for item in _pull_hospitals if item.hospital_id == hospital_id), None
+    )
+    if event.retval is not True or hospital is None:
+        _drain_runs.pop(hospital_id, None)
+        return
+    runs = _drain_runs.get(hospital_id, 0) + 1
+    if runs > int((hospital.drain or {}).get("max_consecutive", 20)):
+        _drain_runs.pop(hospital_id, None)
+        return
+    _drain_runs[hospital_id] = runs
+    try:
+        scheduler.modify_job(event.job_id, next_run_time=datetime.now(timezone.utc))
+    except JobLookupError:
+        _drain_runs.pop(hospital_id, None)
+
+
+def run_telemetry_maintenance() -> None:
+    """오래된 텔레메트리 로그를 Parquet으로 압축하고 보존 기간을 적용"""
+    result = TelemetryStore().compact_logs()
+    if result["compacted_rows"] or result["deleted_partitions"]:
+        logging.getLogger("vtc-link").info(
+            "텔레메트리 압축: %s일 %s건 이동, 파티션 %s개 삭제",
+            result["compacted_days"],
+            result["compacted_rows"],
+            result["deleted_partitions"],
+        )
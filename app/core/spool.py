@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.config import get_settings
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".jsonl"
+_CURSOR_FILE = "cursor.json"
+
+
+@dataclass
+class SpoolItem:
+    """스풀에서 읽은 전송 대기 항목"""
+
+    record: dict
+    payload: bytes
+    enqueued_at: float
+    segment: int
+    end_offset: int
+
+
+class Spool:
+    """병원별 파일 기반 전송 대기열
+
+    변환된 백엔드 페이로드를 append-only 세그먼트 파일(JSON Lines)에 쌓고,
+    전송이 확인된 위치를 커서 파일에 기록한다. 커서보다 앞선 세그먼트는
+    삭제하므로 디스크 사용량은 미전송 항목 수에 비례한다.
+    """
+
+    def __init__(self, directory: Path, segment_max_records: int = 10000) -> None:
+        self._dir = directory
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segment_max_records = max(1, segment_max_records)
+        self._lock = threading.Lock()
+        self._cursor_segment, self._cursor_offset = self._load_cursor()
+        self._write_segment = max(self._segments(), default=self._cursor_segment)
+        self._repair_tail(self._write_segment)
+        self._write_count = self._count_lines(self._write_segment, 0)
+        self._depth = sum(
+            self._count_lines(
+                segment,
+                self._cursor_offset if segment == self._cursor_segment else 0,
+            )
+            for segment in self._segments()
+            if segment >= self._cursor_segment
+        )
+        self._oldest_at: float | None = None
+        if self._depth:
+            self.peek(1)
+
+    def enqueue(self, records: list[dict], payloads: list[bytes]) -> None:
+        """레코드와 직렬화된 백엔드 페이로드를 대기열에 추가
+
+        반환 시점에 디스크에 fsync되어 있다.
+
+        Args:
+            records: 캐노니컬 레코드 목록
+            payloads: 레코드별 직렬화된 백엔드 페이로드
+        """
+        if not records:
+            return
+        now = time.time()
+        with self._lock:
+            if not self._depth:
+                self._oldest_at = now
+            position = 0
+            while position < len(records):
+                if self._write_count >= self._segment_max_records:
+                    self._write_segment += 1
+                    self._write_count = 0
+                room = self._segment_max_records - self._write_count
+                lines = [
+                    json.dumps(
+                        {
+                            "enqueued_at": now,
+                            "record": record,
+                            "payload": payload.decode("utf-8"),
+                        },
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                    for record, payload in zip(
+                        records[position : position + room],
+                        payloads[position : position + room],
+                    )
+                ]
+                with open(
+                    self._segment_path(self._write_segment), "a", encoding="utf-8"
+                ) as handle:
+                    handle.writelines(lines)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                self._write_count += len(lines)
+                self._depth += len(lines)
+                position += len(lines)
+
+    def peek(self, limit: int) -> list[SpoolItem]:
+        """커서 위치부터 미전송 항목을 최대 `limit`건 읽음
+
+        Args:
+            limit: 최대 건수
+
+        Returns:
+            전송 대기 항목 목록(오래된 순)
+        """
+        items: list[SpoolItem] = []
+        with self._lock:
+            segment, offset = self._cursor_segment, self._cursor_offset
+            while len(items) < limit and segment <= self._write_segment:
+                path = self._segment_path(segment)
+                if path.exists():
+                    with open(path, "rb") as handle:
+                        handle.seek(offset)
+                        while len(items) < limit:
+                            line = handle.readline()
+                            if not line.endswith(b"\n"):
+                                break
+                            entry = json.loads(line)
+                            items.append(
+                                SpoolItem(
+                                    record=entry["record"],
+                                    payload=entry["payload"].encode("utf-8"),
+                                    enqueued_at=entry["enqueued_at"],
+                                    segment=segment,
+                                    end_offset=handle.tell(),
+                                )
+                            )
+                if len(items) >= limit:
+                    break
+                segment, offset = segment + 1, 0
+            if items:
+                self._oldest_at = items[0].enqueued_at
+        return items
+
+    def ack(self, items: list[SpoolItem]) -> None:
+        """전송이 확인된 항목까지 커서를 전진
+
+        Args:
+            items: `peek`으로 읽어 전송을 마친 항목 목록
+        """
+        if not items:
+            return
+        last = items[-1]
+        with self._lock:
+            self._cursor_segment, self._cursor_offset = last.segment, last.end_offset
+            if (
+                self._cursor_segment < self._write_segment
+                and self._cursor_offset
+                >= self._segment_path(self._cursor_segment).stat().st_size
+            ):
+                self._cursor_segment, self._cursor_offset = self._cursor_segment + 1, 0
+            self._depth = max(0, self._depth - len(items))
+            self._oldest_at = last.enqueued_at if self._depth else None
+            self._save_cursor()
+            for segment in self._segments():
+                if segment < self._cursor_segment:
+                    self._segment_path(segment).unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        """대기열 깊이와 가장 오래된 항목의 대기 시간을 반환
+
+        Returns:
+            depth, oldest_age_seconds, segments
+        """
+        oldest = self.peek(1)
+        with self._lock:
+            return {
+                "depth": self._depth,
+                "oldest_age_seconds": (
+                    round(time.time() - oldest[0].enqueued_at, 1) if oldest else None
+                ),
+                "segments": len(self._segments()),
+            }
+
+    def backlog(self) -> dict:
+        """디스크를 읽지 않고 메모리에 있는 대기열 깊이와 대기 시간을 반환
+
+        가장 오래된 항목의 시각은 마지막 `peek`/`ack` 시점 기준이므로 실제보다
+        조금 오래된 쪽으로 추정될 수 있다.
+
+        Returns:
+            depth, oldest_age_seconds
+        """
+        with self._lock:
+            oldest_at = self._oldest_at if self._depth else None
+            return {
+                "depth": self._depth,
+                "oldest_age_seconds": (
+                    round(time.time() - oldest_at, 1) if oldest_at else None
+                ),
+            }
+
+    def _segment_path(self, segment: int) -> Path:
+        """세그먼트 번호의 파일 경로"""
+        return self._dir / f"{_SEGMENT_PREFIX}{segment:08d}{_SEGMENT_SUFFIX}"
+
+    def _segments(self) -> list[int]:
+        """디스크에 남아 있는 세그먼트 번호 목록(오름차순)"""
+        return sorted(
+            int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+            for path in self._dir.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}")
+        )
+
+    def _count_lines(self, segment: int, offset: int) -> int:
+        """세그먼트의 offset 이후 완결된 줄 수"""
+        path = self._segment_path(segment)
+        if not path.exists():
+            return 0
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            return sum(1 for line in handle if line.endswith(b"\n"))
+
+    def _repair_tail(self, segment: int) -> None:
+        """기록 도중 중단되어 개행 없이 남은 마지막 줄을 잘라냄"""
+        path = self._segment_path(segment)
+        if not path.exists():
+            return
+        with open(path, "rb+") as handle:
+            data = handle.read()
+            if data and not data.endswith(b"\n"):
+                handle.truncate(data.rfind(b"\n") + 1)
+
+    def _load_cursor(self) -> tuple[int, int]:
+        """커서 파일에서 확인된 위치(세그먼트, 바이트 오프셋)를 읽음"""
+        path = self._dir / _CURSOR_FILE
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return int(data["segment"]), int(data["offset"])
+        return min(self._segments(), default=1), 0
+
+    def _save_cursor(self) -> None:
+        """커서를 임시 파일에 쓰고 원자적으로 교체"""
+        path = self._dir / _CURSOR_FILE
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"segment": self._cursor_segment, "offset": self._cursor_offset}, handle
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+
+
+_spools: dict[str, Spool] = {}
+_spools_lock = threading.Lock()
+
+
+def get_spool(hospital_id: str) -> Spool:
+    """병원별 스풀을 조회하거나 생성
+
+    Args:
+        hospital_id: 병원 식별자
+
+    Returns:
+        스풀
+    """
+    with _spools_lock:
+        spool = _spools.get(hospital_id)
+        if spool is None:
+            spool = Spool(Path(get_settings().spool_dir) / hospital_id)
+            _spools[hospital_id] = spool
+        return spool
+
+
+def spool_backlogs() -> dict[str, dict]:
+    """열려 있는 모든 병원 스풀의 메모리상 대기열 상태를 반환
+
+    Returns:
+        병원 식별자별 depth, oldest_age_seconds
+    """
+    with _spools_lock:
+        spools = dict(_spools)
+    return {hospital_id: spool.backlog() for hospital_id, spool in spools.items()}
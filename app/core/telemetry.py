@@ -1,29 +1,295 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
+from typing import Iterator
 
 import duckdb
 
 from app.core.config import get_settings
 
 
+def encode_mark(value: object) -> tuple[str, str]:
+    """워터마크 값을 문자열과 타입 태그로 직렬화
+
+    복합 워터마크(튜플)는 항목별 (문자열, 타입 태그)를 JSON 배열로 저장한다.
+
+    Args:
+        value: 워터마크 값
+
+    Returns:
+        직렬화 문자열, 타입 태그
+    """
+    if isinstance(value, tuple):
+        return json.dumps([encode_mark(item) for item in value]), "tuple"
+    if isinstance(value, bool):
+        return str(int(value)), "int"
+    if isinstance(value, int):
+        return str(value), "int"
+    if isinstance(value, float):
+        return repr(value), "float"
+    if isinstance(value, Decimal):
+        return str(value), "decimal"
+    if isinstance(value, datetime):
+        return value.isoformat(), "datetime"
+    if isinstance(value, date):
+        return value.isoformat(), "date"
+    return str(value), "str"
+
+
+def decode_mark(text: str, kind: str) -> object:
+    """직렬화된 워터마크 값을 원래 타입으로 복원
+
+    Args:
+        text: 직렬화 문자열
+        kind: 타입 태그
+
+    Returns:
+        워터마크 값
+    """
+    if kind == "tuple":
+        return tuple(
+            decode_mark(item, item_kind) for item, item_kind in json.loads(text)
+        )
+    if kind == "int":
+        return int(text)
+    if kind == "float":
+        return float(text)
+    if kind == "decimal":
+        return Decimal(text)
+    if kind == "datetime":
+        return datetime.fromisoformat(text)
+    if kind == "date":
+        return date.fromisoformat(text)
+    return text
+
+
+_LOG_COLUMNS = (
+    "timestamp",
+    "level",
+    "event",
+    "hospital_id",
+    "stage",
+    "error_code",
+    "message",
+    "duration_ms",
+    "record_count",
+)
+_LOG_FILTER_COLUMNS = ("level", "hospital_id", "event", "error_code")
+_INSERT_CHUNK_ROWS = 500
+_PAGE_SCAN_WINDOW = 10000
+_PARTITION_PREFIX = "day="
+_ROLLUP_GRANULARITIES = ("minute", "hour")
+_RUN_EVENTS = ("pipeline_complete", "pipeline_failed")
+_DURATION_BOUNDS_MS = (
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+    300000,
+    2**31 - 1,
+)
+_STOP: dict = {}
+
+
+def _archive_root() -> Path:
+    """로그 아카이브 루트 디렉터리"""
+    return Path(get_settings().telemetry_archive_dir) / "logs"
+
+
+def _partition_dirs(root: Path) -> list[tuple[date, Path]]:
+    """아카이브 루트 아래 일별 파티션 디렉터리 목록
+
+    Args:
+        root: 아카이브 루트 디렉터리
+
+    Returns:
+        (날짜, 디렉터리) 목록
+    """
+    if not root.exists():
+        return []
+    partitions = []
+    for path in root.iterdir():
+        if path.is_dir() and path.name.startswith(_PARTITION_PREFIX):
+            try:
+                day = date.fromisoformat(path.name[len(_PARTITION_PREFIX) :])
+            except ValueError:
+                continue
+            partitions.append((day, path))
+    return partitions
+
+
+def _part_min_id(path: Path) -> int:
+    """아카이브 파일명(`part-<최소 log_id>.parquet`)에서 최소 `log_id`를 읽음
+
+    Args:
+        path: Parquet 파일 경로
+
+    Returns:
+        최소 `log_id`(읽을 수 없으면 0이라 항상 조회 대상)
+    """
+    try:
+        return int(path.stem[len("part-") :])
+    except ValueError:
+        return 0
+
+
+def _log_time(value: object) -> datetime | None:
+    """로그 레코드의 시각 값을 UTC 기준 naive datetime으로 변환
+
+    Args:
+        value: ISO 8601 문자열 또는 datetime
+
+    Returns:
+        시각 또는 None
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _rollup_batch(records: list[dict]) -> tuple[dict, dict, dict]:
+    """로그 레코드 묶음을 병원/분/시간 단위 롤업 증분으로 집계
+
+    실행 수와 실패 수는 `pipeline_complete`/`pipeline_failed` 이벤트로, 처리 건수와
+    소요 시간은 `pipeline_complete` 이벤트로, 오류 수는 ERROR 레벨 이벤트로 센다.
+
+    Args:
+        records: 로그 레코드 딕셔너리 목록
+
+    Returns:
+        집계 증분, 소요 시간 히스토그램 증분, 에러 코드별 증분
+    """
+    totals: dict[tuple, list[int]] = {}
+    durations: dict[tuple, int] = {}
+    error_codes: dict[tuple, int] = {}
+    for record in records:
+        event = record.get("event")
+        is_run = event in _RUN_EVENTS
+        is_error = str(record.get("level") or "").upper() == "ERROR"
+        error_code = record.get("error_code")
+        if not (is_run or is_error or error_code):
+            continue
+        timestamp = _log_time(record.get("timestamp"))
+        if timestamp is None:
+            continue
+        duration = record.get("duration_ms")
+        complete = event == "pipeline_complete"
+        for granularity in _ROLLUP_GRANULARITIES:
+            bucket = timestamp.replace(second=0, microsecond=0)
+            if granularity == "hour":
+                bucket = bucket.replace(minute=0)
+            key = (granularity, bucket, record.get("hospital_id"))
+            row = totals.setdefault(key, [0, 0, 0, 0, 0])
+            row[0] += int(is_run)
+            row[1] += int(record.get("record_count") or 0) if complete else 0
+            row[2] += int(event == "pipeline_failed")
+            row[3] += int(is_error)
+            if complete and duration is not None:
+                row[4] = max(row[4], int(duration))
+                bound = next(
+                    (b for b in _DURATION_BOUNDS_MS if duration <= b),
+                    _DURATION_BOUNDS_MS[-1],
+                )
+                durations[(*key, bound)] = durations.get((*key, bound), 0) + 1
+            if error_code:
+                error_codes[(*key, error_code)] = (
+                    error_codes.get((*key, error_code), 0) + 1
+                )
+    return totals, durations, error_codes
+
+
+def _histogram_quantile(
+    histogram: dict[int, int], quantile: float, maximum: int | None
+) -> int | None:
+    """소요 시간 히스토그램에서 분위수를 구간 상한으로 추정
+
+    Args:
+        histogram: 구간 상한(ms)별 건수
+        quantile: 0과 1 사이 분위수
+        maximum: 관측된 최대 소요 시간(ms)
+
+    Returns:
+        분위수 추정치(ms) 또는 None
+    """
+    total = sum(histogram.values())
+    if not total:
+        return None
+    seen = 0
+    for bound in sorted(histogram):
+        seen += histogram[bound]
+        if seen >= quantile * total:
+            return min(bound, maximum) if maximum is not None else bound
+    return maximum
+
+
+def _filter_date(value: str | None) -> date | None:
+    """로그 필터의 시각 문자열에서 날짜를 추출
+
+    Args:
+        value: ISO 8601 시각 문자열
+
+    Returns:
+        날짜 또는 None
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+
+
 class TelemetryStore:
-    """로그와 상태를 저장하는 DuckDB 텔레메트리 저장소"""
+    """로그와 상태를 저장하는 DuckDB 텔레메트리 저장소
+
+    DuckDB 연결은 프로세스에 하나만 열고, 스레드마다 그 연결에서 만든 커서를
+    사용한다. 조회는 잠금 없이 각자의 커서로 실행하고, 쓰기는 쓰기 잠금을 잡은
+    트랜잭션 안에서 실행해 여러 문장으로 된 업서트가 섞이지 않게 한다.
+    """
 
     _instance: "TelemetryStore | None" = None
+    _instance_lock = threading.Lock()
+    _remote: object | None = None
 
     def __new__(cls) -> "TelemetryStore":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._init_db()
+        if cls._remote is not None:
+            return cls._remote
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._init_db()
+                cls._instance = instance
         return cls._instance
 
     def _init_db(self) -> None:
         settings = get_settings()
         Path(settings.duckdb_path).parent.mkdir(parents=True, exist_ok=True)
         self._conn = duckdb.connect(settings.duckdb_path)
-        self._conn.execute(
-            """
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._conn.execute("""
             CREATE TABLE IF NOT EXISTS logs (
                 timestamp TIMESTAMP,
                 level VARCHAR,
@@ -35,10 +301,8 @@ class TelemetryStore:
                 duration_ms INTEGER,
                 record_count INTEGER
             )
-            """
-        )
-        self._conn.execute(
-            """
+            """)
+        self._conn.execute("""
             CREATE TABLE IF NOT EXISTS hospital_status (
                 hospital_id VARCHAR,
                 last_run_at TIMESTAMP,
@@ -47,8 +311,90 @@ class TelemetryStore:
                 last_error_code VARCHAR,
                 postprocess_fail_count INTEGER
             )
-            """
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_state (
+                hospital_id VARCHAR,
+                watermark_column VARCHAR,
+                last_mark VARCHAR,
+                mark_type VARCHAR,
+                updated_at TIMESTAMP
+            )
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS log_rollup (
+                granularity VARCHAR,
+                bucket TIMESTAMP,
+                hospital_id VARCHAR,
+                runs BIGINT,
+                records BIGINT,
+                failures BIGINT,
+                errors BIGINT,
+                duration_max INTEGER,
+                PRIMARY KEY (granularity, bucket, hospital_id)
+            )
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS log_rollup_duration (
+                granularity VARCHAR,
+                bucket TIMESTAMP,
+                hospital_id VARCHAR,
+                bound_ms INTEGER,
+                count BIGINT,
+                PRIMARY KEY (granularity, bucket, hospital_id, bound_ms)
+            )
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS log_rollup_error (
+                granularity VARCHAR,
+                bucket TIMESTAMP,
+                hospital_id VARCHAR,
+                error_code VARCHAR,
+                count BIGINT,
+                PRIMARY KEY (granularity, bucket, hospital_id, error_code)
+            )
+            """)
+        self._conn.execute("ALTER TABLE logs ADD COLUMN IF NOT EXISTS log_id BIGINT")
+        self._conn.execute("UPDATE logs SET log_id = rowid + 1 WHERE log_id IS NULL")
+        # 키셋 페이지네이션(`query_log_page`)의 log_id 구간 조회용
+        self._conn.execute("CREATE INDEX IF NOT EXISTS logs_log_id ON logs (log_id)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS logs_hospital_log_id "
+            "ON logs (hospital_id, log_id)"
         )
+        self._min_log_id, max_log_id = self._conn.execute(
+            "SELECT COALESCE(MIN(log_id), 1), COALESCE(MAX(log_id), 0) FROM logs"
+        ).fetchone()
+        self._next_log_id = max_log_id + 1
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        """현재 스레드 전용 커서를 조회하거나 생성
+
+        Returns:
+            DuckDB 커서
+        """
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._conn.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    @contextmanager
+    def _write(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """쓰기 잠금을 잡고 트랜잭션 안에서 커서를 제공
+
+        Yields:
+            DuckDB 커서
+        """
+        cursor = self._cursor()
+        with self._write_lock:
+            cursor.execute("BEGIN TRANSACTION")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
 
     def insert_log(self, record: dict) -> None:
         """로그 레코드를 저장
@@ -56,23 +402,72 @@ class TelemetryStore:
         Args:
             record: 로그 레코드 딕셔너리
         """
-        self._conn.execute(
-            """
-            INSERT INTO logs (timestamp, level, event, hospital_id, stage, error_code, message, duration_ms, record_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                record.get("timestamp"),
-                record.get("level"),
-                record.get("event"),
-                record.get("hospital_id"),
-                record.get("stage"),
-                record.get("error_code"),
-                record.get("message"),
-                record.get("duration_ms"),
-                record.get("record_count"),
-            ],
+        self.insert_logs([record])
+
+    def insert_logs(self, records: list[dict]) -> None:
+        """여러 로그 레코드를 다중 행 INSERT로 저장
+
+        쓰기 잠금 안에서 증가하는 `log_id`를 부여해 키셋 페이지네이션의 키로 쓰고,
+        같은 트랜잭션에서 분/시간 단위 롤업 테이블을 갱신한다.
+
+        Args:
+            records: 로그 레코드 딕셔너리 목록
+        """
+        with self._write() as cursor:
+            for start in range(0, len(records), _INSERT_CHUNK_ROWS):
+                chunk = records[start : start + _INSERT_CHUNK_ROWS]
+                values_sql = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+                params: list = []
+                for record in chunk:
+                    params.extend(record.get(column) for column in _LOG_COLUMNS)
+                    params.append(self._next_log_id)
+                    self._next_log_id += 1
+                cursor.execute(
+                    f"INSERT INTO logs ({', '.join(_LOG_COLUMNS)}, log_id) "
+                    f"VALUES {values_sql}",
+                    params,
+                )
+            self._upsert_rollups(cursor, records)
+
+    def _upsert_rollups(
+        self, cursor: duckdb.DuckDBPyConnection, records: list[dict]
+    ) -> None:
+        """로그 레코드 묶음의 롤업 증분을 롤업 테이블에 더함
+
+        Args:
+            cursor: 쓰기 트랜잭션 커서
+            records: 로그 레코드 딕셔너리 목록
+        """
+        totals, durations, error_codes = _rollup_batch(records)
+        statements = (
+            (
+                "log_rollup",
+                [(*key, *values) for key, values in totals.items()],
+                "runs = runs + EXCLUDED.runs, records = records + EXCLUDED.records, "
+                "failures = failures + EXCLUDED.failures, "
+                "errors = errors + EXCLUDED.errors, "
+                "duration_max = greatest(duration_max, EXCLUDED.duration_max)",
+            ),
+            (
+                "log_rollup_duration",
+                [(*key, count) for key, count in durations.items()],
+                "count = count + EXCLUDED.count",
+            ),
+            (
+                "log_rollup_error",
+                [(*key, count) for key, count in error_codes.items()],
+                "count = count + EXCLUDED.count",
+            ),
         )
+        for table, rows, update_sql in statements:
+            for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                chunk = rows[start : start + _INSERT_CHUNK_ROWS]
+                placeholders = "(" + ", ".join(["?"] * len(chunk[0])) + ")"
+                cursor.execute(
+                    f"INSERT INTO {table} VALUES {', '.join([placeholders] * len(chunk))} "
+                    f"ON CONFLICT DO UPDATE SET {update_sql}",
+                    [value for row in chunk for value in row],
+                )
 
     def update_status(self, status: dict) -> None:
         """병원 상태 레코드를 업서트
@@ -80,26 +475,27 @@ class TelemetryStore:
         Args:
             status: 상태 레코드 딕셔너리
         """
-        self._conn.execute(
-            """
-            DELETE FROM hospital_status WHERE hospital_id = ?
-            """,
-            [status.get("hospital_id")],
-        )
-        self._conn.execute(
-            """
-            INSERT INTO hospital_status (hospital_id, last_run_at, last_success_at, last_status, last_error_code, postprocess_fail_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            [
-                status.get("hospital_id"),
-                status.get("last_run_at"),
-                status.get("last_success_at"),
-                status.get("last_status"),
-                status.get("last_error_code"),
-                status.get("postprocess_fail_count"),
-            ],
-        )
+        with self._write() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM hospital_status WHERE hospital_id = ?
+                """,
+                [status.get("hospital_id")],
+            )
+            cursor.execute(
+                """
+                INSERT INTO hospital_status (hospital_id, last_run_at, last_success_at, last_status, last_error_code, postprocess_fail_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    status.get("hospital_id"),
+                    status.get("last_run_at"),
+                    status.get("last_success_at"),
+                    status.get("last_status"),
+                    status.get("last_error_code"),
+                    status.get("postprocess_fail_count"),
+                ],
+            )
 
     def query_logs(self, where: str, params: list) -> list[tuple]:
         """조건절(WHERE)을 사용해 로그를 조회
@@ -114,7 +510,326 @@ class TelemetryStore:
         query = "SELECT * FROM logs"
         if where:
             query += f" WHERE {where}"
-        return self._conn.execute(query, params).fetchall()
+        return self._cursor().execute(query, params).fetchall()
+
+    def query_log_page(
+        self,
+        filters: dict | None = None,
+        before_id: int | None = None,
+        limit: int = 50,
+    ) -> list[tuple]:
+        """필터 조건에 맞는 로그를 최신순으로 한 페이지 조회
+
+        `log_id` 구간을 최신 쪽부터 점점 넓혀 가며 조회하므로 한 번의 조회가 읽는
+        범위는 전체 로그 양이 아니라 페이지를 채우는 데 필요한 구간에 비례한다.
+
+        Args:
+            filters: level, hospital_id, event, error_code, start, end
+            before_id: 이 값보다 작은 `log_id`만 조회(이전 페이지의 마지막 키)
+            limit: 최대 건수
+
+        Returns:
+            행 목록(마지막 열이 `log_id`)
+        """
+        conditions: list[str] = []
+        params: list = []
+        for column in _LOG_FILTER_COLUMNS:
+            value = (filters or {}).get(column)
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if (filters or {}).get("start"):
+            conditions.append("timestamp >= CAST(? AS TIMESTAMP)")
+            params.append(filters["start"])
+        if (filters or {}).get("end"):
+            conditions.append("timestamp < CAST(? AS TIMESTAMP)")
+            params.append(filters["end"])
+        where = "".join(f" AND {condition}" for condition in conditions)
+
+        cursor = self._cursor()
+        upper = bound = min(before_id or self._next_log_id, self._next_log_id)
+        window = max(limit * 20, _PAGE_SCAN_WINDOW)
+        rows: list[tuple] = []
+        while len(rows) < limit and upper > self._min_log_id:
+            lower = max(upper - window, self._min_log_id)
+            rows.extend(
+                cursor.execute(
+                    f"SELECT * FROM logs WHERE log_id >= ? AND log_id < ?{where} "
+                    "ORDER BY log_id DESC LIMIT ?",
+                    [lower, upper, *params, limit - len(rows)],
+                ).fetchall()
+            )
+            upper = lower
+            window *= 2
+        if len(rows) >= limit:
+            return rows
+        # 압축은 시각 기준이라 아카이브 키가 DuckDB에 남은 키보다 작다는 보장이 없다
+        archived: list[tuple] = []
+        for paths in self._archive_partitions(filters or {}, bound):
+            if len(archived) >= limit:
+                break
+            files = ", ".join(
+                "'" + str(path).replace("'", "''") + "'" for path in paths
+            )
+            archived.extend(
+                cursor.execute(
+                    f"SELECT * FROM read_parquet([{files}]) WHERE log_id < ?{where} "
+                    "ORDER BY log_id DESC LIMIT ?",
+                    [bound, *params, limit - len(archived)],
+                ).fetchall()
+            )
+        if not archived:
+            return rows
+        return sorted(rows + archived, key=lambda row: row[9], reverse=True)[:limit]
+
+    def compact_logs(self, today: date | None = None) -> dict:
+        """오래된 로그를 일별 Parquet 파티션으로 옮기고 보존 기간이 지난 파티션을 삭제
+
+        `telemetry_hot_days`일보다 오래된 로그는 날짜(UTC)별로
+        `{telemetry_archive_dir}/logs/day=YYYY-MM-DD/part-<최소 log_id>.parquet`에
+        기록한 뒤 DuckDB에서 삭제한다. `telemetry_retention_days`가 0보다 크면 그보다
+        오래된 파티션 디렉터리를 지운다.
+
+        Args:
+            today: 기준 날짜(UTC, 기본값 오늘)
+
+        Returns:
+            compacted_days, compacted_rows, deleted_partitions
+        """
+        settings = get_settings()
+        today = today or datetime.now(timezone.utc).date()
+        root = _archive_root()
+        cutoff = today - timedelta(days=settings.telemetry_hot_days)
+        days = [
+            row[0]
+            for row in self._cursor()
+            .execute(
+                "SELECT DISTINCT CAST(timestamp AS DATE) FROM logs "
+                "WHERE timestamp < CAST(? AS TIMESTAMP) ORDER BY 1",
+                [cutoff.isoformat()],
+            )
+            .fetchall()
+            if row[0] is not None
+        ]
+        compacted_rows = 0
+        for day in days:
+            compacted_rows += self._compact_day(root, day)
+
+        deleted = 0
+        if settings.telemetry_retention_days > 0:
+            expire_before = today - timedelta(days=settings.telemetry_retention_days)
+            for day, path in _partition_dirs(root):
+                if day < expire_before:
+                    shutil.rmtree(path, ignore_errors=True)
+                    deleted += 1
+
+        with self._write() as cursor:
+            self._min_log_id = cursor.execute(
+                "SELECT COALESCE(MIN(log_id), ?) FROM logs", [self._next_log_id]
+            ).fetchone()[0]
+            self._expire_rollups(cursor, "minute", cutoff)
+            if settings.telemetry_retention_days > 0:
+                self._expire_rollups(cursor, "hour", expire_before)
+        if days:
+            try:
+                self._cursor().execute("CHECKPOINT")
+            except duckdb.TransactionException:
+                # 다른 쓰기 트랜잭션이 있으면 DuckDB 자동 체크포인트에 맡긴다
+                pass
+        return {
+            "compacted_days": len(days),
+            "compacted_rows": compacted_rows,
+            "deleted_partitions": deleted,
+        }
+
+    def _expire_rollups(
+        self, cursor: duckdb.DuckDBPyConnection, granularity: str, before: date
+    ) -> None:
+        """기준 날짜 이전의 롤업 구간을 삭제
+
+        Args:
+            cursor: 쓰기 트랜잭션 커서
+            granularity: minute 또는 hour
+            before: 기준 날짜(UTC)
+        """
+        for table in ("log_rollup", "log_rollup_duration", "log_rollup_error"):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE granularity = ? "
+                "AND bucket < CAST(? AS TIMESTAMP)",
+                [granularity, before.isoformat()],
+            )
+
+    def _compact_day(self, root: Path, day: date) -> int:
+        """하루치 로그를 Parquet 파티션에 기록하고 DuckDB에서 삭제
+
+        파일명에 최소 `log_id`를 쓰므로 기록 후 삭제 전에 중단되어도 다시 실행할 때
+        같은 파일을 덮어쓰지 않고 삭제만 이어서 한다.
+
+        Args:
+            root: 아카이브 루트 디렉터리
+            day: 날짜(UTC)
+
+        Returns:
+            옮긴 행 수
+        """
+        bounds = [day.isoformat(), (day + timedelta(days=1)).isoformat()]
+        day_filter = (
+            "timestamp >= CAST(? AS TIMESTAMP) AND timestamp < CAST(? AS TIMESTAMP)"
+        )
+        with self._write() as cursor:
+            count, min_id = cursor.execute(
+                f"SELECT COUNT(*), MIN(log_id) FROM logs WHERE {day_filter}", bounds
+            ).fetchone()
+            if not count:
+                return 0
+            partition = root / f"{_PARTITION_PREFIX}{day.isoformat()}"
+            partition.mkdir(parents=True, exist_ok=True)
+            path = partition / f"part-{min_id}.parquet"
+            if not path.exists():
+                temp_path = partition / f"part-{min_id}.parquet.tmp"
+                cursor.execute(
+                    f"COPY (SELECT * FROM logs WHERE {day_filter} ORDER BY log_id) "
+                    f"TO '{str(temp_path).replace(chr(39), chr(39) * 2)}' "
+                    "(FORMAT PARQUET)",
+                    bounds,
+                )
+                os.replace(temp_path, path)
+            cursor.execute(f"DELETE FROM logs WHERE {day_filter}", bounds)
+        return count
+
+    def _archive_partitions(
+        self, filters: dict, before_id: int | None = None
+    ) -> list[list[Path]]:
+        """조회 범위에 걸칠 수 있는 아카이브 파티션의 파일 목록을 최신 날짜부터 반환
+
+        날짜가 시간 범위 밖인 파티션과, 파일명의 최소 `log_id`가 커서 이상이라
+        커서보다 작은 키를 담을 수 없는 파일은 읽지 않는다.
+
+        Args:
+            filters: 로그 필터(start, end)
+            before_id: 이 값보다 작은 `log_id`만 조회(없으면 전체)
+
+        Returns:
+            파티션별 Parquet 파일 목록
+        """
+        start = _filter_date(filters.get("start"))
+        end = _filter_date(filters.get("end"))
+        partitions = []
+        for day, path in sorted(_partition_dirs(_archive_root()), reverse=True):
+            if (start and day < start) or (end and day > end):
+                continue
+            files = [
+                file
+                for file in sorted(path.glob("part-*.parquet"))
+                if before_id is None or _part_min_id(file) < before_id
+            ]
+            if files:
+                partitions.append(files)
+        return partitions
+
+    def query_rollups(
+        self,
+        granularity: str,
+        since: datetime,
+        hospital_id: str | None = None,
+    ) -> list[dict]:
+        """롤업 테이블에서 병원/구간별 집계를 조회
+
+        Args:
+            granularity: minute 또는 hour
+            since: 이 시각(UTC) 이후 구간만 조회
+            hospital_id: 병원 식별자 필터(선택)
+
+        Returns:
+            bucket, hospital_id, runs, records, failures, errors, error_codes,
+            duration_p50_ms, duration_p95_ms, duration_max_ms 목록(구간 오름차순)
+        """
+        where = "granularity = ? AND bucket >= CAST(? AS TIMESTAMP)"
+        params: list = [granularity, _log_time(since)]
+        if hospital_id:
+            where += " AND hospital_id = ?"
+            params.append(hospital_id)
+        cursor = self._cursor()
+        histograms: dict[tuple, dict[int, int]] = {}
+        for bucket, hospital, bound, count in cursor.execute(
+            f"SELECT bucket, hospital_id, bound_ms, count FROM log_rollup_duration "
+            f"WHERE {where}",
+            params,
+        ).fetchall():
+            histograms.setdefault((bucket, hospital), {})[bound] = count
+        error_codes: dict[tuple, dict[str, int]] = {}
+        for bucket, hospital, code, count in cursor.execute(
+            f"SELECT bucket, hospital_id, error_code, count FROM log_rollup_error "
+            f"WHERE {where}",
+            params,
+        ).fetchall():
+            error_codes.setdefault((bucket, hospital), {})[code] = count
+        rollups = []
+        for row in cursor.execute(
+            "SELECT bucket, hospital_id, runs, records, failures, errors, duration_max "
+            f"FROM log_rollup WHERE {where} ORDER BY bucket, hospital_id",
+            params,
+        ).fetchall():
+            histogram = histograms.get((row[0], row[1]), {})
+            maximum = row[6] if histogram else None
+            rollups.append(
+                {
+                    "bucket": row[0],
+                    "hospital_id": row[1],
+                    "runs": row[2],
+                    "records": row[3],
+                    "failures": row[4],
+                    "errors": row[5],
+                    "error_codes": error_codes.get((row[0], row[1]), {}),
+                    "duration_p50_ms": _histogram_quantile(histogram, 0.5, maximum),
+                    "duration_p95_ms": _histogram_quantile(histogram, 0.95, maximum),
+                    "duration_max_ms": maximum,
+                }
+            )
+        return rollups
+
+    def query_rollup_summary(
+        self, since: datetime, hospital_id: str | None = None
+    ) -> dict:
+        """시간 단위 롤업을 합산해 기간 전체 집계를 조회
+
+        Args:
+            since: 이 시각(UTC) 이후 구간만 합산
+            hospital_id: 병원 식별자 필터(선택)
+
+        Returns:
+            runs, records, failures, errors, duration_p50_ms, duration_p95_ms,
+            duration_max_ms
+        """
+        where = "granularity = 'hour' AND bucket >= CAST(? AS TIMESTAMP)"
+        params: list = [_log_time(since)]
+        if hospital_id:
+            where += " AND hospital_id = ?"
+            params.append(hospital_id)
+        cursor = self._cursor()
+        runs, records, failures, errors, maximum = cursor.execute(
+            "SELECT COALESCE(SUM(runs), 0), COALESCE(SUM(records), 0), "
+            "COALESCE(SUM(failures), 0), COALESCE(SUM(errors), 0), MAX(duration_max) "
+            f"FROM log_rollup WHERE {where}",
+            params,
+        ).fetchone()
+        histogram = dict(
+            cursor.execute(
+                "SELECT bound_ms, SUM(count) FROM log_rollup_duration "
+                f"WHERE {where} GROUP BY bound_ms",
+                params,
+            ).fetchall()
+        )
+        maximum = maximum if histogram else None
+        return {
+            "runs": runs,
+            "records": records,
+            "failures": failures,
+            "errors": errors,
+            "duration_p50_ms": _histogram_quantile(histogram, 0.5, maximum),
+            "duration_p95_ms": _histogram_quantile(histogram, 0.95, maximum),
+            "duration_max_ms": maximum,
+        }
 
     def query_status(self) -> list[tuple]:
         """모든 병원 상태 항목을 조회
@@ -122,6 +837,279 @@ class TelemetryStore:
         Returns:
             행 목록
         """
-        return self._conn.execute(
-            "SELECT * FROM hospital_status ORDER BY hospital_id"
-        ).fetchall()
+        return (
+            self._cursor()
+            .execute("SELECT * FROM hospital_status ORDER BY hospital_id")
+            .fetchall()
+        )
+
+    def get_watermark(self, hospital_id: str, column: str) -> object | None:
+        """병원의 마지막 워터마크 값을 조회
+
+        저장된 컬럼과 요청 컬럼이 다르면 워터마크가 없는 것으로 본다.
+
+        Args:
+            hospital_id: 병원 식별자
+            column: 워터마크 컬럼명
+
+        Returns:
+            워터마크 값 또는 None
+        """
+        row = (
+            self._cursor()
+            .execute(
+                """
+                SELECT watermark_column, last_mark, mark_type
+                FROM fetch_state WHERE hospital_id = ?
+                """,
+                [hospital_id],
+            )
+            .fetchone()
+        )
+        if row is None or row[0] != column or row[1] is None:
+            return None
+        return decode_mark(row[1], row[2])
+
+    def set_watermark(self, hospital_id: str, column: str, value: object) -> None:
+        """병원의 워터마크 값을 업서트
+
+        Args:
+            hospital_id: 병원 식별자
+            column: 워터마크 컬럼명
+            value: 워터마크 값
+        """
+        text, kind = encode_mark(value)
+        with self._write() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM fetch_state WHERE hospital_id = ?
+                """,
+                [hospital_id],
+            )
+            cursor.execute(
+                """
+                INSERT INTO fetch_state (hospital_id, watermark_column, last_mark, mark_type, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    hospital_id,
+                    column,
+                    text,
+                    kind,
+                    datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                ],
+            )
+
+
+def use_remote_store(store: object | None) -> None:
+    """`TelemetryStore()`가 로컬 DuckDB 대신 돌려줄 대리 저장소를 지정
+
+    다중 워커 모드의 follower는 DuckDB 파일을 열지 않고 owner로 호출을 전달한다.
+
+    Args:
+        store: 대리 저장소(None이면 로컬 저장소 사용)
+    """
+    TelemetryStore._remote = store
+
+
+class TelemetryWriter:
+    """로그 레코드를 백그라운드 스레드에서 묶어 저장하는 텔레메트리 기록기
+
+    호출 스레드는 제한된 큐에 넣기만 하고, 기록 스레드가 `batch_size`건이
+    모이거나 `flush_interval`초가 지나면 한 번에 저장한다. 큐가 가득 차면
+    이벤트를 버리고 `dropped` 카운터를 올린다.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max(1, max_queue))
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._flushers = 0
+        self._dropped = 0
+        self._failed = 0
+        self._written = 0
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record: dict) -> bool:
+        """로그 레코드를 큐에 추가
+
+        Args:
+            record: 로그 레코드 딕셔너리
+
+        Returns:
+            큐에 들어갔으면 True, 가득 차서 버렸으면 False
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """큐에 쌓인 레코드가 모두 저장될 때까지 대기"""
+        if not self._thread.is_alive():
+            return
+        with self._lock:
+            self._flushers += 1
+        self._wake.set()
+        try:
+            self._queue.join()
+        finally:
+            with self._lock:
+                self._flushers -= 1
+
+    def close(self) -> None:
+        """남은 레코드를 저장하고 기록 스레드를 종료"""
+        self.flush()
+        self._stop.set()
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def stats(self) -> dict:
+        """큐 길이와 저장/버림/저장 실패 건수를 반환
+
+        Returns:
+            queued, written, dropped, failed
+        """
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+            }
+
+    def _run(self) -> None:
+        """큐를 비우며 묶음 단위로 저장하는 기록 스레드 루프"""
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            if first is _STOP:
+                self._queue.task_done()
+                break
+            batch = [first]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size and not self._flushing():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wake.clear()
+                pending = self._drain(self._batch_size - len(batch))
+                if pending:
+                    batch.extend(pending)
+                    continue
+                self._wake.wait(remaining)
+            batch.extend(self._drain(self._batch_size - len(batch)))
+            self._write(batch)
+
+    def _drain(self, limit: int) -> list[dict]:
+        """큐에서 대기 없이 최대 limit건을 꺼냄
+
+        Args:
+            limit: 최대 건수
+
+        Returns:
+            로그 레코드 목록
+        """
+        records: list[dict] = []
+        while len(records) < limit:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is _STOP:
+                self._queue.task_done()
+                break
+            records.append(record)
+        return records
+
+    def _flushing(self) -> bool:
+        """flush를 기다리는 호출자가 있는지 확인"""
+        with self._lock:
+            return self._flushers > 0
+
+    def _write(self, batch: list[dict]) -> None:
+        """묶음을 저장하고 큐 작업 완료를 표시
+
+        저장에 실패한 묶음은 버리고 건수를 실패 지표로 남긴다.
+
+        Args:
+            batch: 로그 레코드 목록
+        """
+        try:
+            TelemetryStore().insert_logs(batch)
+            with self._lock:
+                self._written += len(batch)
+        except Exception:
+            with self._lock:
+                self._failed += len(batch)
+            logging.getLogger("vtc-link").exception("텔레메트리 저장 실패")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+
+_writer: TelemetryWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_telemetry_writer() -> TelemetryWriter:
+    """프로세스 공용 텔레메트리 기록기를 조회하거나 생성
+
+    Returns:
+        텔레메트리 기록기
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            settings = get_settings()
+            _writer = TelemetryWriter(
+                max_queue=settings.telemetry_queue_size,
+                batch_size=settings.telemetry_batch_size,
+                flush_interval=settings.telemetry_flush_interval_seconds,
+            )
+        return _writer
+
+
+def flush_telemetry() -> None:
+    """대기 중인 텔레메트리 레코드를 모두 저장"""
+    writer = _writer
+    if writer is not None:
+        writer.flush()
+
+
+def close_telemetry_writer() -> None:
+    """텔레메트리 기록기를 비우고 종료"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
+def telemetry_writer_stats() -> dict:
+    """텔레메트리 기록기 상태를 반환
+
+    Returns:
+        queued, written, dropped, failed
+    """
+    writer = _writer
+    if writer is None:
+        return {"queued": 0, "written": 0, "dropped": 0, "failed": 0}
+    return writer.stats()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+STAGE_BOUNDS_MS = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+    float("inf"),
+)
+
+
+class StageStats:
+    """한 단계의 구간 수, 누적/최대 시간과 고정 구간 히스토그램"""
+
+    __slots__ = ("count", "total_ms", "max_ms", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * len(STAGE_BOUNDS_MS)
+
+    def add(self, elapsed_ms: float) -> None:
+        """구간 소요 시간을 누적
+
+        Args:
+            elapsed_ms: 소요 시간(밀리초)
+        """
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        for index, bound in enumerate(STAGE_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                break
+
+    def quantile(self, ratio: float) -> float | None:
+        """히스토그램에서 분위수를 구간 상한으로 추정
+
+        Args:
+            ratio: 0~1 사이 분위수
+
+        Returns:
+            분위수 추정치(밀리초, 최대값 이하) 또는 None
+        """
+        if not self.count:
+            return None
+        seen = 0
+        for bound, count in zip(STAGE_BOUNDS_MS, self.buckets):
+            seen += count
+            if seen >= ratio * self.count:
+                return round(min(bound, self.max_ms), 1)
+        return round(self.max_ms, 1)
+
+    def summary(self) -> dict:
+        """단계 요약을 반환
+
+        Returns:
+            count, total_ms, p50_ms, p95_ms, max_ms, buckets
+        """
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(STAGE_BOUNDS_MS, self.buckets)),
+        }
+
+
+class RunTimings:
+    """파이프라인 실행 한 번의 단계별 소요 시간을 모으는 수집기
+
+    구간이 중첩되면 바깥 구간에는 안쪽 구간을 뺀 자체 시간만 기록하므로
+    단계별 누적 시간의 합이 실행 시간을 넘지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+        self._children: list[float] = []
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """블록 실행 시간을 단계 구간으로 기록
+
+        Args:
+            stage: 단계 이름
+        """
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            self.record(stage, elapsed - nested)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """단계 구간 하나의 소요 시간을 기록
+
+        Args:
+            stage: 단계 이름
+            seconds: 소요 시간(초)
+        """
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.add(seconds * 1000)
+
+    def summary(self) -> dict[str, dict]:
+        """단계별 요약을 반환
+
+        Returns:
+            단계 이름별 요약
+        """
+        return {stage: stats.summary() for stage, stats in self.stages.items()}
+
+
+_current: ContextVar[RunTimings | None] = ContextVar("run_timings", default=None)
+
+
+@contextmanager
+def run_timings() -> Iterator[RunTimings]:
+    """현재 컨텍스트에서 단계 시간 수집을 시작
+
+    Yields:
+        단계 시간 수집기
+    """
+    timings = RunTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def current_timings() -> RunTimings | None:
+    """현재 컨텍스트의 단계 시간 수집기를 반환
+
+    Returns:
+        단계 시간 수집기 또는 None
+    """
+    return _current.get()
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """현재 수집기가 있으면 블록 실행 시간을 단계 구간으로 기록
+
+    Args:
+        stage: 단계 이름
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.span(stage):
+        yield
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.config import get_settings
+from app.core.errors import PipelineError
+from app.transforms.hospital_profiles.HOSP_A.inbound import to_canonical_batch
+from app.transforms.hospital_profiles.HOSP_A.outbound import encode_backend
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _portable_error(error: Exception | None) -> Exception | None:
+    """부모 프로세스로 전달할 수 있는 예외로 바꿈
+
+    pydantic 검증 예외처럼 피클로 전달되지 않는 예외는 메시지만 담은
+    `RuntimeError`로 바꾼다.
+
+    Args:
+        error: 행 변환 예외 또는 None
+
+    Returns:
+        전달 가능한 예외 또는 None
+    """
+    if error is None or isinstance(error, PipelineError):
+        return error
+    return RuntimeError(str(error))
+
+
+def transform_records(
+    raw_records: list[dict],
+) -> tuple[list[dict], list[bytes], list[Exception | None]]:
+    """원본 레코드를 캐노니컬 레코드와 백엔드 페이로드로 변환(풀 프로세스에서 실행)
+
+    결과는 모델 객체 대신 직렬화 비용이 작은 딕셔너리와 JSON 바이트로
+    돌려준다. 변환에 실패한 행은 결과에서 빼고 에러 마스크에 남긴다.
+
+    Args:
+        raw_records: 원본 레코드 목록
+
+    Returns:
+        (변환된 캐노니컬 레코드 목록, 레코드별 직렬화된 백엔드 페이로드,
+        입력 행별 예외 또는 None)
+    """
+    payloads, errors = to_canonical_batch(raw_records)
+    valid = [payload for payload in payloads if payload is not None]
+    return (
+        [payload.model_dump() for payload in valid],
+        [encode_backend(payload) for payload in valid],
+        [_portable_error(error) for error in errors],
+    )
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """공유 변환 프로세스 풀을 조회하거나 생성
+
+    스케줄러 스레드와 DuckDB 연결을 가진 프로세스를 fork하지 않도록 spawn
+    방식으로 워커를 띄운다. 설정 재적재 등으로 프로세스 수가 바뀌면 새 풀을
+    만들고, 이전 풀은 이미 받은 작업을 마친 뒤 종료되게 한다.
+
+    Args:
+        workers: 프로세스 수
+
+    Returns:
+        프로세스 풀
+    """
+    global _pool, _pool_workers
+    stale: ProcessPoolExecutor | None = None
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            stale, _pool = _pool, None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        pool = _pool
+    if stale is not None:
+        stale.shutdown(wait=False)
+    return pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """깨진 풀을 버려 다음 호출에서 다시 만들게 함
+
+    Args:
+        pool: 버릴 프로세스 풀
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def transform_in_pool(
+    raw_records: list[dict],
+) -> tuple[list[dict], list[bytes], list[Exception | None]] | None:
+    """원본 청크를 나눠 프로세스 풀에서 변환
+
+    `TRANSFORM_WORKERS`가 0이거나 청크가 `TRANSFORM_MIN_RECORDS`보다 작으면
+    프로세스 간 전달 비용이 더 크므로 None을 반환해 호출한 스레드에서
+    변환하게 한다. 청크는 DB 커넥터의 `arraysize`(기본 500)건 단위이므로
+    `TRANSFORM_MIN_RECORDS`가 그보다 크면 풀을 쓰지 않는다. 넘긴 청크는
+    모든 워커에 고르게 나눈다. 풀은 모든 병원이 공유한다.
+
+    Args:
+        raw_records: 원본 레코드 청크
+
+    Returns:
+        입력 순서를 유지한 (변환된 캐노니컬 레코드 목록, 직렬화된 백엔드
+        페이로드, 입력 행별 예외 또는 None) 또는 None(풀 미사용)
+    """
+    settings = get_settings()
+    workers = settings.transform_workers
+    if workers <= 0 or len(raw_records) < max(1, settings.transform_min_records):
+        return None
+    size = math.ceil(len(raw_records) / workers)
+    pool = _get_pool(workers)
+    try:
+        futures = [
+            pool.submit(transform_records, raw_records[start : start + size])
+            for start in range(0, len(raw_records), size)
+        ]
+        canonical_records: list[dict] = []
+        encoded: list[bytes] = []
+        errors: list[Exception | None] = []
+        for future in futures:
+            records, payloads, row_errors = future.result()
+            canonical_records.extend(records)
+            encoded.extend(payloads)
+            errors.extend(row_errors)
+        return canonical_records, encoded, errors
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+
+
+def close_transform_pool() -> None:
+    """변환 프로세스 풀을 종료"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import threading
+from multiprocessing import current_process
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Callable
+
+from app.core.config import Settings
+from app.core.telemetry import TelemetryStore, use_remote_store
+
+ROLE_SINGLE = "single"
+ROLE_OWNER = "owner"
+ROLE_FOLLOWER = "follower"
+
+_role = ROLE_SINGLE
+_lock_handle: Any = None
+_server: "OwnerServer | None" = None
+_client: "OwnerClient | None" = None
+_settings: Settings | None = None
+_handlers: dict[str, Callable[..., Any]] = {}
+_on_promote: Callable[[], None] | None = None
+_on_heartbeat: Callable[[], None] | None = None
+_heartbeat_stop: threading.Event | None = None
+_promote_lock = threading.Lock()
+
+
+def claim_owner(lock_path: str | Path) -> Any:
+    """소유 잠금 파일에 배타적 잠금을 시도
+
+    잠금은 반환된 파일 객체가 열려 있는 동안(프로세스가 살아 있는 동안) 유지되며,
+    프로세스가 죽으면 운영체제가 풀어 준다.
+
+    Args:
+        lock_path: 잠금 파일 경로
+
+    Returns:
+        잠금을 잡은 파일 객체 또는 None(다른 프로세스가 소유)
+    """
+    path = Path(lock_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(path, "a+")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    handle.seek(0)
+    handle.truncate()
+    handle.write(str(os.getpid()))
+    handle.flush()
+    return handle
+
+
+class OwnerServer:
+    """소유 워커에서 다른 워커의 요청을 받아 처리하는 로컬 IPC 서버
+
+    요청은 `(작업 이름, args, kwargs)` 튜플이고 응답은 `(성공 여부, 결과)`이다.
+    연결마다 스레드 하나가 요청을 순서대로 처리한다. 소켓은 소유자만 접근할 수
+    있고, 같은 부모에서 띄운 워커끼리 공유하는 프로세스 인증 키로 연결을 확인한
+    뒤에만 메시지를 역직렬화한다.
+    """
+
+    def __init__(
+        self, address: str | Path, handlers: dict[str, Callable[..., Any]]
+    ) -> None:
+        self._address = str(address)
+        Path(self._address).parent.mkdir(parents=True, exist_ok=True)
+        if os.path.exists(self._address):
+            os.unlink(self._address)
+        self._handlers = dict(handlers)
+        self._listener = Listener(
+            self._address, family="AF_UNIX", authkey=current_process().authkey
+        )
+        os.chmod(self._address, 0o600)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._accept_loop, name="owner-ipc", daemon=True
+        )
+        self._thread.start()
+
+    def _accept_loop(self) -> None:
+        """연결을 받아 연결별 처리 스레드를 시작"""
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._closed.is_set():
+                    return
+                logging.getLogger("vtc-link").exception("워커 IPC 연결 수락 실패")
+                continue
+            threading.Thread(
+                target=self._serve, args=(conn,), name="owner-ipc-conn", daemon=True
+            ).start()
+
+    def _serve(self, conn: Connection) -> None:
+        """한 연결의 요청을 끊길 때까지 처리
+
+        Args:
+            conn: 워커 연결
+        """
+        with conn:
+            while True:
+                try:
+                    operation, args, kwargs = conn.recv()
+                except (EOFError, OSError):
+                    return
+                handler = self._handlers.get(operation)
+                try:
+                    if handler is None:
+                        raise ValueError(f"알 수 없는 작업: {operation}")
+                    conn.send((True, handler(*args, **kwargs)))
+                except Exception as exc:
+                    conn.send((False, f"{type(exc).__name__}: {exc}"))
+
+    def close(self) -> None:
+        """서버를 닫고 소켓 파일을 삭제"""
+        self._closed.set()
+        self._listener.close()
+        if os.path.exists(self._address):
+            os.unlink(self._address)
+
+
+class OwnerClient:
+    """소유 워커에 요청을 보내는 IPC 클라이언트
+
+    연결 하나를 잠금으로 보호해 여러 스레드가 공유하고, 연결이 끊기면 다음
+    요청에서 다시 연결한다. 연결에 실패하면 잠금 밖에서 `on_failure`를 호출한다.
+    """
+
+    def __init__(
+        self, address: str | Path, on_failure: Callable[[], None] | None = None
+    ) -> None:
+        self._address = str(address)
+        self._on_failure = on_failure
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+
+    def call(self, operation: str, *args: Any, **kwargs: Any) -> Any:
+        """소유 워커에서 작업을 실행하고 결과를 반환
+
+        Args:
+            operation: 작업 이름
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            작업 결과
+
+        Raises:
+            RuntimeError: 소유 워커에서 작업이 실패한 경우
+            OSError: 소유 워커에 연결할 수 없는 경우
+            EOFError: 응답 전에 소유 워커와의 연결이 끊긴 경우
+        """
+        try:
+            with self._lock:
+                try:
+                    if self._conn is None:
+                        self._conn = Client(
+                            self._address,
+                            family="AF_UNIX",
+                            authkey=current_process().authkey,
+                        )
+                    self._conn.send((operation, args, kwargs))
+                    ok, result = self._conn.recv()
+                except (EOFError, OSError):
+                    self._reset()
+                    raise
+        except (EOFError, OSError):
+            if self._on_failure is not None:
+                self._on_failure()
+            raise
+        if not ok:
+            raise RuntimeError(result)
+        return result
+
+    def _reset(self) -> None:
+        """끊긴 연결을 정리(잠금 안에서 호출)"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+        self._conn = None
+
+    def close(self) -> None:
+        """연결을 닫음"""
+        with self._lock:
+            self._reset()
+
+
+class RemoteTelemetryStore:
+    """`TelemetryStore`의 공개 메서드 호출을 소유 워커로 전달하는 대리 객체"""
+
+    def __init__(self, client: OwnerClient) -> None:
+        self._client = client
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(TelemetryStore, name, None)):
+            raise AttributeError(name)
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            return self._client.call("telemetry", name, *args, **kwargs)
+
+        return _call
+
+
+def _call_store(method: str, *args: Any, **kwargs: Any) -> Any:
+    """소유 워커의 텔레메트리 저장소 메서드를 실행
+
+    Args:
+        method: 공개 메서드 이름
+        *args: 위치 인자
+        **kwargs: 키워드 인자
+
+    Returns:
+        메서드 결과
+    """
+    if method.startswith("_"):
+        raise ValueError(f"허용되지 않은 메서드: {method}")
+    return getattr(TelemetryStore(), method)(*args, **kwargs)
+
+
+def start_worker_role(
+    settings: Settings,
+    handlers: dict[str, Callable[..., Any]] | None = None,
+    on_promote: Callable[[], None] | None = None,
+    on_heartbeat: Callable[[], None] | None = None,
+) -> str:
+    """다중 워커 모드에서 이 프로세스의 역할을 정함
+
+    `MULTI_WORKER`가 꺼져 있으면 모든 일을 직접 하는 single 역할이다. 켜져
+    있으면 소유 잠금을 잡은 프로세스 하나가 owner가 되어 스케줄링과 DuckDB
+    쓰기를 맡고 IPC 서버를 연다. 나머지 follower는 텔레메트리 저장소 호출을
+    owner로 전달하고, owner 연결에 실패하면 소유 잠금을 다시 시도해 owner가
+    종료된 경우 그 역할을 넘겨받는다. 요청이 없어도 owner 종료를 알아채도록
+    follower는 `WORKER_HEARTBEAT_SECONDS`마다 owner를 호출한다.
+
+    Args:
+        settings: 애플리케이션 설정
+        handlers: owner가 follower 요청에 응답할 추가 작업
+        on_promote: follower가 owner로 승격된 뒤 호출할 함수(스케줄러 시작 등)
+        on_heartbeat: follower가 주기적으로 owner를 호출할 함수(없으면 ping)
+
+    Returns:
+        single, owner, follower 중 하나
+    """
+    global _role, _lock_handle, _client, _settings, _handlers, _on_promote
+    global _on_heartbeat, _heartbeat_stop
+    stop_worker_role()
+    if not settings.multi_worker:
+        _role = ROLE_SINGLE
+        return _role
+    _settings = settings
+    _handlers = dict(handlers or {})
+    _on_promote = on_promote
+    _on_heartbeat = on_heartbeat
+    handle = claim_owner(settings.worker_lock_path)
+    if handle is not None:
+        _become_owner(handle)
+    else:
+        _client = OwnerClient(settings.worker_socket_path, on_failure=_try_promote)
+        use_remote_store(RemoteTelemetryStore(_client))
+        _role = ROLE_FOLLOWER
+        _heartbeat_stop = threading.Event()
+        threading.Thread(
+            target=_heartbeat_loop,
+            args=(_heartbeat_stop, settings.worker_heartbeat_seconds),
+            name="follower-heartbeat",
+            daemon=True,
+        ).start()
+    _log_role()
+    return _role
+
+
+def _heartbeat_loop(stop: threading.Event, interval: float) -> None:
+    """follower에서 주기적으로 owner를 호출
+
+    호출이 실패하면 `OwnerClient`가 소유 잠금을 다시 시도하므로, 요청이 없는
+    동안 owner가 종료되어도 follower 하나가 승격되어 스케줄링을 이어 간다.
+    승격되거나 역할이 정리되면 멈춘다.
+
+    Args:
+        stop: 멈춤 신호
+        interval: 호출 간격(초)
+    """
+    while not stop.wait(max(0.01, interval)):
+        if _role != ROLE_FOLLOWER:
+            return
+        try:
+            if _on_heartbeat is not None:
+                _on_heartbeat()
+            else:
+                call_owner("ping")
+        except (OSError, EOFError, RuntimeError):
+            continue
+        except Exception:
+            logging.getLogger("vtc-link").exception("follower heartbeat 실패")
+
+
+def _become_owner(handle: Any) -> None:
+    """소유 잠금을 보관하고 IPC 서버를 열어 owner가 됨
+
+    Args:
+        handle: 소유 잠금을 잡은 파일 객체
+    """
+    global _role, _lock_handle, _server
+    _lock_handle = handle
+    _server = OwnerServer(
+        _settings.worker_socket_path,
+        {"telemetry": _call_store, "ping": lambda: True, **_handlers},
+    )
+    _role = ROLE_OWNER
+
+
+def _log_role() -> None:
+    """현재 워커 역할을 기록"""
+    logging.getLogger("vtc-link").info(
+        "워커 역할: %s (pid=%s)", _role, os.getpid(), extra={"event": "worker_role"}
+    )
+
+
+def _try_promote() -> None:
+    """owner 연결 실패 후 소유 잠금을 다시 시도해 잡으면 owner로 승격
+
+    owner가 재시작 중이면 잠금을 잡지 못해 follower로 남는다.
+    """
+    global _client
+    with _promote_lock:
+        if _role != ROLE_FOLLOWER or _settings is None:
+            return
+        handle = claim_owner(_settings.worker_lock_path)
+        if handle is None:
+            return
+        client, _client = _client, None
+        use_remote_store(None)
+        if client is not None:
+            client.close()
+        _become_owner(handle)
+    _log_role()
+    if _on_promote is not None:
+        _on_promote()
+
+
+def worker_role() -> str:
+    """현재 프로세스의 워커 역할
+
+    Returns:
+        single, owner, follower 중 하나
+    """
+    return _role
+
+
+def call_owner(operation: str, *args: Any, **kwargs: Any) -> Any:
+    """follower에서 owner의 작업을 실행
+
+    Args:
+        operation: 작업 이름
+        *args: 위치 인자
+        **kwargs: 키워드 인자
+
+    Returns:
+        작업 결과
+    """
+    if _client is None:
+        raise RuntimeError("follower 워커가 아님")
+    return _client.call(operation, *args, **kwargs)
+
+
+def stop_worker_role() -> None:
+    """IPC 서버/클라이언트, follower heartbeat와 소유 잠금을 정리"""
+    global _role, _lock_handle, _server, _client, _heartbeat_stop
+    server, _server = _server, None
+    client, _client = _client, None
+    handle, _lock_handle = _lock_handle, None
+    stop, _heartbeat_stop = _heartbeat_stop, None
+    if stop is not None:
+        stop.set()
+    if server is not None:
+        server.close()
+    if client is not None:
+        use_remote_store(None)
+        client.close()
+    if handle is not None:
+        handle.close()
+    _role = ROLE_SINGLE
@@ -1,10 +1,44 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes import router as api_router
+from app.clients.backend_api import close_client, get_client
+from app.api.health import readiness_report
+from app.api.metrics import push_follower_metrics
 from app.core.config import get_settings, load_app_config
+from app.core.db import close_pools
 from app.core.logging import configure_logging
-from app.core.scheduler import start_scheduler
+from app.core.metrics import merge_metric_deltas, render_metrics
+from app.core.scheduler import reload_scheduler, shutdown_scheduler, start_scheduler
+from app.core.telemetry import close_telemetry_writer
+from app.core.transform_pool import close_transform_pool
+from app.core.workers import ROLE_FOLLOWER, start_worker_role, stop_worker_role
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """애플리케이션 시작/종료 시 공유 자원을 관리
+
+    Args:
+        app: FastAPI 애플리케이션
+    """
+    get_client()
+    yield
+    shutdown_scheduler()
+    close_client()
+    close_pools()
+    close_transform_pool()
+    close_telemetry_writer()
+    stop_worker_role()
+
+
+def _start_owner_scheduler() -> None:
+    """스케줄러가 켜져 있으면 설정을 읽어 시작(single/owner 워커)"""
+    if get_settings().scheduler_enabled:
+        start_scheduler(load_app_config())
 
 
 def create_app() -> FastAPI:
@@ -12,13 +46,23 @@ def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(settings.log_level)
 
-    app = FastAPI(title="VTC Link", version=settings.version)
+    app = FastAPI(title="VTC Link", version=settings.version, lifespan=lifespan)
     app.mount("/static", StaticFiles(directory="static"), name="static")
     app.include_router(api_router)
 
-    if settings.scheduler_enabled:
-        config = load_app_config()
-        start_scheduler(config)
+    role = start_worker_role(
+        settings,
+        {
+            "readiness": readiness_report,
+            "metrics": render_metrics,
+            "merge_metrics": merge_metric_deltas,
+            "reload_scheduler": reload_scheduler,
+        },
+        on_promote=_start_owner_scheduler,
+        on_heartbeat=push_follower_metrics,
+    )
+    if role != ROLE_FOLLOWER:
+        _start_owner_scheduler()
 
     return app
 
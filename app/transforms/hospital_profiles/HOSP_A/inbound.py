@@ -1,8 +1,14 @@
+from functools import partial
+from typing import Callable
+
+from pydantic import TypeAdapter, ValidationError
+
 from app.core.errors import ParseError
-from app.models.canonical import CanonicalPayload, Patient, Timestamps, Vitals
+from app.models.canonical import CanonicalPayload
 from app.transforms.hospital_profiles.HOSP_A.mapping import SEX_MAPPING
 from app.utils.parsing import (
     parse_birthdate,
+    parse_column,
     parse_float,
     parse_int,
     parse_int_optional,
@@ -11,6 +17,10 @@ from app.utils.parsing import (
 
 BIRTHDATE_FORMATS = ["%Y%m%d", "%Y-%m-%d"]
 TIMESTAMP_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]
+INT_VITALS = ("SBP", "DBP", "PR", "RR")
+FLOAT_VITALS = ("BT", "SpO2")
+
+_PAYLOADS = TypeAdapter(list[CanonicalPayload])
 
 
 def _trim_text(value: object, max_length: int) -> str | None:
@@ -51,6 +61,59 @@ def _map_sex(value: str | None) -> str:
     return mapped
 
 
+def _parse_birthdate(value: object) -> str:
+    """프로필 포맷으로 생년월일을 파싱"""
+    return parse_birthdate(value, BIRTHDATE_FORMATS)
+
+
+def _parse_timestamp(value: object) -> str:
+    """프로필 포맷으로 타임스탬프를 파싱"""
+    return parse_timestamp(value, TIMESTAMP_FORMATS)
+
+
+# 원본 컬럼별 (파서, 메모 그룹). 행 단위 변환에서 에러가 나는 순서와 같도록
+# 필드 순서대로 둔다. 메모 그룹이 같은 컬럼은 같은 파서를 쓰므로 캐시를 공유한다.
+_PARSERS: dict[str, tuple[Callable[[object], object], str | None]] = {
+    "birthdate": (_parse_birthdate, "birthdate"),
+    "age": (parse_int_optional, None),
+    "sex": (_map_sex, "sex"),
+    **{field: (partial(parse_int, field=field), None) for field in INT_VITALS},
+    **{field: (partial(parse_float, field=field), None) for field in FLOAT_VITALS},
+    "created_at": (_parse_timestamp, "timestamp"),
+    "updated_at": (_parse_timestamp, "timestamp"),
+}
+
+
+def _row(raw: dict, parsed: dict[str, object]) -> dict:
+    """원본 행과 파싱된 값으로 캐노니컬 모델 입력을 만듦
+
+    행 단위 변환과 열 단위 변환이 같은 필드 매핑을 쓰도록 한 곳에 둔다.
+
+    Args:
+        raw: 병원 원본 페이로드
+        parsed: `_PARSERS` 컬럼별 파싱 결과
+
+    Returns:
+        `CanonicalPayload` 검증용 딕셔너리
+    """
+    return {
+        "patient": {
+            "patient_id": str(raw.get("patient_id", "")).strip(),
+            "patient_name": raw.get("patient_name"),
+            "birthdate": parsed["birthdate"],
+            "age": parsed["age"],
+            "sex": parsed["sex"],
+            "ward": _trim_text(raw.get("ward"), 30),
+            "department": _trim_text(raw.get("department"), 30),
+        },
+        "vitals": {field: parsed[field] for field in INT_VITALS + FLOAT_VITALS},
+        "timestamps": {
+            "created_at": parsed["created_at"],
+            "updated_at": parsed["updated_at"],
+        },
+    }
+
+
 def to_canonical(raw: dict) -> CanonicalPayload:
     """병원 페이로드를 캐노니컬 모델로 변환
 
@@ -60,25 +123,56 @@ def to_canonical(raw: dict) -> CanonicalPayload:
     Returns:
         캐노니컬 페이로드 모델
     """
-    patient = Patient(
-        patient_id=str(raw.get("patient_id", "")).strip(),
-        patient_name=raw.get("patient_name"),
-        birthdate=parse_birthdate(raw.get("birthdate"), BIRTHDATE_FORMATS),
-        age=parse_int_optional(raw.get("age")),
-        sex=_map_sex(raw.get("sex")),
-        ward=_trim_text(raw.get("ward"), 30),
-        department=_trim_text(raw.get("department"), 30),
-    )
-    vitals = Vitals(
-        SBP=parse_int(raw.get("SBP"), "SBP"),
-        DBP=parse_int(raw.get("DBP"), "DBP"),
-        PR=parse_int(raw.get("PR"), "PR"),
-        RR=parse_int(raw.get("RR"), "RR"),
-        BT=parse_float(raw.get("BT"), "BT"),
-        SpO2=parse_float(raw.get("SpO2"), "SpO2"),
-    )
-    timestamps = Timestamps(
-        created_at=parse_timestamp(raw.get("created_at"), TIMESTAMP_FORMATS),
-        updated_at=parse_timestamp(raw.get("updated_at"), TIMESTAMP_FORMATS),
-    )
-    return CanonicalPayload(patient=patient, vitals=vitals, timestamps=timestamps)
+    parsed = {column: parse(raw.get(column)) for column, (parse, _) in _PARSERS.items()}
+    return CanonicalPayload.model_validate(_row(raw, parsed))
+
+
+def to_canonical_batch(
+    raw_records: list[dict],
+) -> tuple[list[CanonicalPayload | None], list[Exception | None]]:
+    """여러 병원 페이로드를 열 단위로 캐노니컬 모델로 변환
+
+    필드마다 열 전체를 한 번에 파싱하고(같은 날짜/코드 값은 한 번만 파싱),
+    파싱이 끝난 행을 한 번의 모델 검증으로 만든다. 실패한 행은 예외 대신
+    에러 마스크에 남기며, 그 값은 같은 행을 `to_canonical`로 변환할 때 발생하는
+    예외와 같다. 한 행이 실패해도 나머지 행은 변환된다.
+
+    Args:
+        raw_records: 병원 원본 페이로드 목록
+
+    Returns:
+        (행별 캐노니컬 모델 또는 None, 행별 예외 또는 None)
+    """
+    errors: list[Exception | None] = [None] * len(raw_records)
+    memos: dict[str, dict] = {}
+    columns = {
+        column: parse_column(
+            [raw.get(column) for raw in raw_records],
+            parse,
+            errors,
+            memos.setdefault(group, {}) if group else None,
+        )
+        for column, (parse, group) in _PARSERS.items()
+    }
+    rows = [
+        _row(raw, {column: values[index] for column, values in columns.items()})
+        for index, raw in enumerate(raw_records)
+    ]
+    payloads: list[CanonicalPayload | None] = [None] * len(raw_records)
+    pending = [index for index, error in enumerate(errors) if error is None]
+    try:
+        validated = _PAYLOADS.validate_python([rows[index] for index in pending])
+    except ValidationError as exc:
+        failed = {pending[error["loc"][0]] for error in exc.errors()}
+        # 실패한 행은 한 건씩 다시 검증해 `to_canonical`과 같은 예외를 남기고,
+        # 나머지 행만 다시 한 번에 검증한다
+        for index in sorted(failed):
+            try:
+                payloads[index] = CanonicalPayload.model_validate(rows[index])
+            except ValidationError as row_error:
+                errors[index] = row_error
+        pending = [index for index in pending if index not in failed]
+        validated = _PAYLOADS.validate_python([rows[index] for index in pending])
+    for index, payload in zip(pending, validated):
+        payloads[index] = payload
+    return payloads, errors
@@ -1,3 +1,5 @@
+from pydantic import BaseModel
+
 from app.models.canonical import CanonicalPayload
 from app.models.client import ClientResponse
 from app.utils.parsing import coerce_int, format_screened_date
@@ -36,6 +38,21 @@ def from_backend(response: dict) -> dict:
     return mapped.model_dump()
 
 
+def _backend_model(payload: CanonicalPayload) -> BaseModel:
+    """캐노니컬 페이로드를 백엔드로 보낼 모델로 매핑
+
+    백엔드 매핑은 이 함수 하나에만 둔다. `to_backend`와 `encode_backend`는
+    이 모델을 각각 딕셔너리와 JSON 바이트로 직렬화할 뿐이다.
+
+    Args:
+        payload: 캐노니컬 페이로드
+
+    Returns:
+        백엔드 페이로드 모델
+    """
+    return payload
+
+
 def to_backend(payload: CanonicalPayload) -> dict:
     """캐노니컬 페이로드를 백엔드 페이로드로 변환
 
@@ -45,4 +62,18 @@ def to_backend(payload: CanonicalPayload) -> dict:
     Returns:
         백엔드 페이로드 딕셔너리
     """
-    return payload.model_dump()
+    return _backend_model(payload).model_dump()
+
+
+def encode_backend(payload: CanonicalPayload) -> bytes:
+    """캐노니컬 페이로드를 백엔드 JSON 바이트로 직렬화
+
+    `to_backend`와 같은 모델을 중간 딕셔너리 없이 바로 직렬화한다.
+
+    Args:
+        payload: 캐노니컬 페이로드
+
+    Returns:
+        JSON 바이트
+    """
+    return _backend_model(payload).model_dump_json().encode("utf-8")
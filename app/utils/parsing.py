@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
-from typing import Iterable
+from functools import lru_cache
+from typing import Callable, Iterable
 
 
 def coerce_int(value: object, default: int = 0) -> int:
@@ -56,6 +58,69 @@ def format_screened_date(value: object, formats: Iterable[str]) -> str:
 
 from app.core.errors import ParseError
 
+_FIXED_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+_DATETIME_SLOTS = {"Y": 0, "m": 1, "d": 2, "H": 3, "M": 4, "S": 5}
+_DATETIME_DEFAULTS = (1900, 1, 1, 0, 0, 0)
+
+
+@lru_cache(maxsize=64)
+def _fixed_pattern(fmt: str) -> tuple[re.Pattern, tuple[int, ...]] | None:
+    """숫자 고정 폭 지시자만으로 된 포맷을 정규식으로 변환
+
+    Args:
+        fmt: strptime 포맷
+
+    Returns:
+        (정규식, 그룹별 datetime 인자 위치) 또는 None(지원하지 않는 포맷)
+    """
+    pattern = []
+    slots: list[int] = []
+    index = 0
+    while index < len(fmt):
+        if fmt[index] != "%":
+            pattern.append(re.escape(fmt[index]))
+            index += 1
+            continue
+        directive = fmt[index + 1 : index + 2]
+        slot = _DATETIME_SLOTS.get(directive)
+        if slot is None or slot in slots:
+            return None
+        pattern.append(f"([0-9]{{{_FIXED_WIDTHS[directive]}}})")
+        slots.append(slot)
+        index += 2
+    return re.compile("".join(pattern)), tuple(slots)
+
+
+def _strptime(text: str, fmt: str) -> datetime:
+    """`datetime.strptime`과 같은 결과를 내되 고정 폭 숫자 형식은 직접 파싱
+
+    자리수와 구분자가 포맷과 정확히 맞는 경우만 직접 파싱하고, 그 밖의 입력
+    (한 자리 월, 공백 여러 개, 소문자 구분자, 범위 밖 값 등)은 strptime에 맡겨
+    결과와 예외가 기존과 같게 한다.
+
+    Args:
+        text: 정리된 원본 문자열
+        fmt: strptime 포맷
+
+    Returns:
+        파싱된 datetime
+
+    Raises:
+        ValueError: 포맷과 맞지 않는 경우
+    """
+    fixed = _fixed_pattern(fmt)
+    if fixed is not None:
+        match = fixed[0].fullmatch(text)
+        if match is not None:
+            values = list(_DATETIME_DEFAULTS)
+            for slot, part in zip(fixed[1], match.groups()):
+                values[slot] = int(part)
+            try:
+                return datetime(*values)
+            except ValueError:
+                pass
+    return datetime.strptime(text, fmt)
+
 
 def parse_int(value: str | int | float | None, field: str) -> int:
     """값을 정수로 파싱
@@ -136,7 +201,7 @@ def parse_birthdate(value: str | None, formats: Iterable[str]) -> str:
         raise ParseError("birthdate", "값이 필요함")
     for fmt in formats:
         try:
-            return datetime.strptime(str(value).strip(), fmt).strftime("%Y%m%d")
+            return _strptime(str(value).strip(), fmt).strftime("%Y%m%d")
         except ValueError:
             continue
     raise ParseError("birthdate", f"지원하지 않는 생년월일 형식: {value}")
@@ -159,9 +224,66 @@ def parse_timestamp(value: str | None, formats: Iterable[str]) -> str:
         raise ParseError("timestamp", "값이 필요함")
     for fmt in formats:
         try:
-            parsed = datetime.strptime(str(value).strip(), fmt)
+            parsed = _strptime(str(value).strip(), fmt)
             parsed = parsed.replace(tzinfo=timezone.utc)
             return parsed.isoformat().replace("+00:00", "Z")
         except ValueError:
             continue
     raise ParseError("timestamp", f"지원하지 않는 타임스탬프 형식: {value}")
+
+
+def parse_column(
+    values: list,
+    parse: Callable[[object], object],
+    errors: list[Exception | None],
+    memo: dict | None = None,
+) -> list:
+    """열의 값을 한 번에 파싱하고 실패한 행은 예외 대신 에러 마스크에 기록
+
+    행마다 첫 번째 에러만 남기므로 필드 순서대로 호출하면 행 단위 변환에서
+    먼저 발생하는 에러가 남는다. `memo`를 주면 같은 값은 한 번만 파싱하며,
+    같은 파서를 쓰는 열끼리 공유할 수 있다.
+
+    Args:
+        values: 열 값 목록
+        parse: 값 하나를 파싱하는 함수(실패 시 ParseError)
+        errors: 행별 에러 마스크(None이면 정상)
+        memo: (값 타입, 값)별 파싱 결과 캐시
+
+    Returns:
+        행별 파싱 결과(실패한 행은 None)
+    """
+    parsed: list = [None] * len(values)
+    for index, value in enumerate(values):
+        if memo is None:
+            result = _parse_cell(parse, value)
+        else:
+            key = (type(value), value)
+            try:
+                result = memo[key]
+            except KeyError:
+                result = memo[key] = _parse_cell(parse, value)
+            except TypeError:
+                result = _parse_cell(parse, value)
+        if isinstance(result, ParseError):
+            if errors[index] is None:
+                errors[index] = result
+        else:
+            parsed[index] = result
+    return parsed
+
+
+def _parse_cell(parse: Callable[[object], object], value: object) -> object:
+    """값 하나를 파싱하고 ParseError는 반환값으로 돌려줌
+
+    Args:
+        parse: 파싱 함수
+        value: 원본 값
+
+    Returns:
+        파싱 결과 또는 ParseError
+    """
+    try:
+        return parse(value)
+    except ParseError as exc:
+        return exc
@@ -0,0 +1,86 @@
+import json
+
+import httpx
+
+from app.core import dispatch
+from app.core.adaptive import AdaptiveLimiter, is_overload_error
+from app.core.config import get_settings
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://backend.test/")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def test_limiter_grows_on_fast_responses_up_to_max():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=4, max_batch_size=10)
+
+    for _ in range(100):
+        limiter.on_success(latency_ms=10)
+
+    assert limiter.limit == 4
+    assert limiter.batch_size == 10
+
+
+def test_limiter_backs_off_on_overload_once_per_window():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8, initial_limit=8)
+
+    limiter.on_overload(latency_ms=50)
+    limiter.on_overload(latency_ms=50)
+
+    assert limiter.limit == 4
+    snapshot = limiter.snapshot()
+    assert snapshot["overloads"] == 2
+    assert snapshot["latency_p50_ms"] == 50
+
+
+def test_limiter_backs_off_when_latency_exceeds_target():
+    limiter = AdaptiveLimiter(
+        min_limit=1, max_limit=8, initial_limit=8, latency_target_ms=100
+    )
+
+    limiter.on_success(latency_ms=400)
+
+    assert limiter.limit == 4
+
+
+def test_overload_classification():
+    assert is_overload_error(_status_error(429)) is True
+    assert is_overload_error(_status_error(503)) is True
+    assert is_overload_error(_status_error(400)) is False
+    assert is_overload_error(httpx.ReadTimeout("timeout")) is True
+    assert is_overload_error(ValueError("x")) is False
+
+
+def test_dispatch_retries_overloaded_requests(monkeypatch):
+    calls = {"count": 0}
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(429)
+        return httpx.Response(200, json={"vital_id": "V1"})
+
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://backend.test/")
+    get_settings.cache_clear()
+    monkeypatch.setattr(
+        dispatch,
+        "build_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=2, initial_limit=2)
+
+    results = dispatch.dispatch_records(
+        [json.dumps({"a": 1}).encode()],
+        ["P1"],
+        concurrency=2,
+        limiter=limiter,
+        retry_backoff=0.0,
+    )
+
+    assert results == [{"vital_id": "V1"}]
+    assert calls["count"] == 2
+    assert limiter.snapshot()["overloads"] == 1
+    get_settings.cache_clear()
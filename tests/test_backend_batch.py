@@ -0,0 +1,113 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.clients import backend_api
+from app.core import pipeline
+from app.core.config import HospitalConfig, get_settings
+from app.core.errors import PipelineError
+from app.models.canonical import CanonicalPayload
+from app.transforms.hospital_profiles.HOSP_A.outbound import encode_backend, to_backend
+from tools.stub_backend import app as stub_app
+
+
+def _canonical(patient_id: str) -> dict:
+    return {
+        "patient": {"patient_id": patient_id, "birthdate": "19900101", "sex": "M"},
+        "vitals": {"SBP": 120, "DBP": 80, "PR": 70, "RR": 16, "BT": 36.5, "SpO2": 98},
+        "timestamps": {
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.fixture
+def stub_backend(monkeypatch):
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://testserver/")
+    get_settings.cache_clear()
+    client = TestClient(stub_app)
+    monkeypatch.setattr(backend_api, "_client", client)
+    yield client
+    get_settings.cache_clear()
+
+
+def test_iter_batches_splits_by_count_and_bytes():
+    items = [b"x" * 10 for _ in range(5)]
+
+    assert [len(batch) for batch in backend_api.iter_batches(items, 2, 0)] == [2, 2, 1]
+    assert [len(batch) for batch in backend_api.iter_batches(items, 10, 25)] == [
+        2,
+        2,
+        1,
+    ]
+
+
+def test_iter_batches_keeps_oversized_item_alone():
+    items = [b"x" * 50, b"y"]
+
+    assert list(backend_api.iter_batches(items, 10, 20)) == [[b"x" * 50], [b"y"]]
+
+
+def test_send_batch_returns_results_in_order(stub_backend):
+    items = [backend_api.encode_payload(_canonical(f"P{i}")) for i in range(3)]
+
+    results = backend_api.send_batch(items)
+
+    assert [result["patient_id"] for result in results] == ["P0", "P1", "P2"]
+
+
+def test_pipeline_batches_and_postprocesses_each_record(stub_backend, monkeypatch):
+    postprocessed: list[str] = []
+
+    def _fake_postprocess(hospital, records):
+        postprocessed.extend(record["patient"]["patient_id"] for record in records)
+        return [None] * len(records)
+
+    monkeypatch.setattr(pipeline, "run_postprocess_batch", _fake_postprocess)
+    hospital = HospitalConfig(
+        hospital_id="H1",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        dispatch={"batch_size": 2},
+    )
+
+    records = [_canonical(f"P{i}") for i in range(3)]
+    ok, code = pipeline._send_records(
+        hospital, records, [backend_api.encode_payload(record) for record in records]
+    )
+
+    assert (ok, code) == (True, None)
+    assert postprocessed == ["P0", "P1", "P2"]
+
+
+def test_pipeline_skips_rejected_batch_items(stub_backend, monkeypatch):
+    postprocessed: list[str] = []
+
+    def _fake_postprocess(hospital, records):
+        postprocessed.extend(record["patient"]["patient_id"] for record in records)
+        return [None] * len(records)
+
+    monkeypatch.setattr(pipeline, "run_postprocess_batch", _fake_postprocess)
+    hospital = HospitalConfig(
+        hospital_id="H1",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        dispatch={"batch_size": 5},
+    )
+
+    with pytest.raises(PipelineError) as exc_info:
+        records = [_canonical("P0"), _canonical("")]
+        pipeline._send_records(
+            hospital,
+            records,
+            [backend_api.encode_payload(record) for record in records],
+        )
+
+    assert exc_info.value.code == "API_RESP_002"
+    assert postprocessed == ["P0"]
+
+
+def test_encode_backend_matches_to_backend_json():
+    payload = CanonicalPayload(**_canonical("P1"))
+    payload.patient.patient_name = "홍길동"
+    assert encode_backend(payload) == backend_api.encode_payload(to_backend(payload))
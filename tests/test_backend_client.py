@@ -0,0 +1,50 @@
+import httpx
+
+from app.clients import backend_api
+from app.core.config import get_settings
+
+
+def test_get_client_returns_shared_instance(monkeypatch):
+    monkeypatch.setenv("BACKEND_MAX_CONNECTIONS", "5")
+    get_settings.cache_clear()
+    backend_api.close_client()
+
+    first = backend_api.get_client()
+    second = backend_api.get_client()
+
+    assert first is second
+    backend_api.close_client()
+    assert first.is_closed
+    assert backend_api.get_client() is not first
+    backend_api.close_client()
+    get_settings.cache_clear()
+
+
+def test_send_encoded_reuses_client(monkeypatch):
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://backend.test/vitals")
+    monkeypatch.setenv("BACKEND_API_KEY", "secret")
+    get_settings.cache_clear()
+    backend_api.close_client()
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"vital_id": str(len(seen))})
+
+    real_build = backend_api._build_client
+
+    def _build_with_mock() -> httpx.Client:
+        client = real_build()
+        client._transport = httpx.MockTransport(_handler)
+        return client
+
+    monkeypatch.setattr(backend_api, "_build_client", _build_with_mock)
+
+    assert backend_api.send_encoded(b'{"a":1}') == {"vital_id": "1"}
+    assert backend_api.send_encoded(b'{"a":2}') == {"vital_id": "2"}
+    assert seen[0].headers["Authorization"] == "Bearer secret"
+    assert seen[0].headers["Content-Type"] == "application/json"
+    assert seen[1].content == b'{"a":2}'
+    assert str(seen[1].url) == "http://backend.test/vitals"
+    backend_api.close_client()
+    get_settings.cache_clear()
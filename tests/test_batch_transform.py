@@ -0,0 +1,83 @@
+import pytest
+
+from app.core.errors import ParseError
+from app.transforms.hospital_profiles.HOSP_A.inbound import (
+    to_canonical,
+    to_canonical_batch,
+)
+
+RAW = {
+    "patient_id": " P1 ",
+    "patient_name": "홍길동",
+    "birthdate": "1980-01-01",
+    "age": "44",
+    "sex": "1",
+    "ward": " 7A ",
+    "department": "",
+    "SBP": "120",
+    "DBP": 80,
+    "PR": "70",
+    "RR": "16",
+    "BT": "36.5",
+    "SpO2": 98,
+    "created_at": "2024-01-01 10:00:00",
+    "updated_at": "2024-01-01T10:05:00",
+}
+
+
+def _raised(transform, arg) -> tuple[type, str]:
+    with pytest.raises(Exception) as info:
+        transform(arg)
+    return type(info.value), str(info.value)
+
+
+def _described(error: Exception) -> tuple[type, str]:
+    return type(error), str(error)
+
+
+def test_batch_matches_per_row_transform():
+    raws = [
+        dict(RAW, patient_id=f"P{index}", created_at=f"2024-01-01 10:00:{index:02d}")
+        for index in range(20)
+    ]
+    raws[11]["age"] = None
+
+    payloads, errors = to_canonical_batch(raws)
+
+    assert payloads == [to_canonical(raw) for raw in raws]
+    assert errors == [None] * len(raws)
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        {"SBP": "high"},
+        {"sex": "X", "SBP": "high"},
+        {"patient_name": 123},
+        {"created_at": "2024/01/01"},
+        {"birthdate": None},
+    ],
+)
+def test_batch_masks_per_row_error_of_failing_row(bad):
+    raw = dict(RAW, **bad)
+
+    payloads, errors = to_canonical_batch([RAW, raw, RAW])
+
+    assert payloads[0] == payloads[2] == to_canonical(RAW)
+    assert payloads[1] is None
+    assert errors[0] is None and errors[2] is None
+    assert _described(errors[1]) == _raised(to_canonical, raw)
+
+
+def test_batch_keeps_other_rows_when_rows_fail():
+    raws = [RAW, dict(RAW, patient_name=123), dict(RAW, sex="X"), RAW]
+
+    payloads, errors = to_canonical_batch(raws)
+
+    assert [payload is not None for payload in payloads] == [True, False, False, True]
+    assert _described(errors[1]) == _raised(to_canonical, raws[1])
+    assert _described(errors[2]) == (ParseError, "sex: 지원하지 않는 값: X")
+
+
+def test_batch_of_empty_chunk():
+    assert to_canonical_batch([]) == ([], [])
@@ -0,0 +1,198 @@
+import threading
+
+import oracledb
+import pytest
+
+from app.core import db as db_module
+from app.core.config import AppConfig, HospitalConfig
+from app.core.db import ConnectionPool, PoolTimeoutError
+
+
+class _FakeConnection:
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.closed = False
+        self.healthy = True
+
+    def cursor(self) -> "_FakeConnection":
+        return self
+
+    def execute(self, query: str) -> None:
+        if not self.healthy:
+            raise RuntimeError("connection lost")
+
+    def fetchall(self) -> list:
+        return [(1,)]
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _make_pool(**options) -> tuple[ConnectionPool, list[_FakeConnection]]:
+    created: list[_FakeConnection] = []
+
+    def _connect() -> _FakeConnection:
+        conn = _FakeConnection(len(created))
+        created.append(conn)
+        return conn
+
+    return ConnectionPool("test", _connect, **options), created
+
+
+def test_pool_reuses_released_connection():
+    pool, created = _make_pool(max_size=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    pool.release(second)
+
+    assert first is second
+    assert len(created) == 1
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["created"] == 1
+    assert stats["in_use"] == 0
+
+
+def test_pool_discards_connection_on_error():
+    pool, created = _make_pool(max_size=1)
+
+    conn = pool.acquire()
+    pool.release(conn, discard=True)
+    replacement = pool.acquire()
+
+    assert conn.closed is True
+    assert replacement is not conn
+    assert pool.stats()["discarded"] == 1
+
+
+class _SignallingCondition(threading.Condition):
+    def __init__(self) -> None:
+        super().__init__()
+        self.waiting = threading.Event()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waiting.set()
+        return super().wait(timeout)
+
+
+def test_pool_waits_for_release_when_exhausted():
+    pool, _ = _make_pool(max_size=1, acquire_timeout=5.0)
+    pool._cond = _SignallingCondition()
+    conn = pool.acquire()
+    acquired: list[_FakeConnection] = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    assert pool._cond.waiting.wait(timeout=5.0)
+    pool.release(conn)
+    waiter.join(timeout=5.0)
+
+    assert acquired == [conn]
+    assert pool.stats()["waits"] == 1
+
+
+def test_pool_lookup_does_not_hold_registry_lock_while_connecting(monkeypatch):
+    connecting = threading.Event()
+    finish = threading.Event()
+
+    def _slow_create(db: dict, options: dict) -> ConnectionPool:
+        connecting.set()
+        finish.wait(timeout=5.0)
+        return _make_pool()[0]
+
+    monkeypatch.setattr(db_module, "_create_pool", _slow_create)
+    monkeypatch.setattr(db_module, "_pools", {})
+    db = {"type": "mssql", "host": "slow-db"}
+    creator = threading.Thread(target=lambda: db_module._get_pool(db, {}))
+    creator.start()
+    try:
+        assert connecting.wait(timeout=5.0)
+        assert db_module.pool_stats() == []
+    finally:
+        finish.set()
+        creator.join(timeout=5.0)
+    assert len(db_module.pool_stats()) == 1
+
+
+def test_oracle_pool_only_maps_wait_timeouts(monkeypatch):
+    class _Error:
+        def __init__(self, full_code: str) -> None:
+            self.full_code = full_code
+
+    assert db_module._is_pool_timeout(oracledb.Error(_Error("DPY-4005")))
+    assert not db_module._is_pool_timeout(oracledb.Error(_Error("ORA-01017")))
+
+
+def test_config_requires_two_connections_per_run_with_postprocess():
+    base = {
+        "hospital_id": "POOL_H",
+        "connector_type": "pull_db_view",
+        "transform_profile": "H1",
+        "postprocess": {"mode": "update_flag"},
+    }
+    with pytest.raises(ValueError, match="max_size"):
+        HospitalConfig(**base, db={"type": "oracle", "pool": {"max_size": 1}})
+    HospitalConfig(**base, db={"type": "oracle", "pool": {"max_size": 2}})
+
+
+def _shared_pool_hospital(hospital_id: str, pool: dict) -> dict:
+    return {
+        "hospital_id": hospital_id,
+        "connector_type": "pull_db_view",
+        "transform_profile": "H1",
+        "postprocess": {"mode": "update_flag"},
+        "db": {"type": "oracle", "dsn": "shared", "username": "u", "pool": pool},
+    }
+
+
+def test_config_sums_demand_of_hospitals_sharing_a_pool():
+    with pytest.raises(ValueError, match="max_size"):
+        AppConfig(
+            hospitals=[
+                _shared_pool_hospital("P1", {"max_size": 2}),
+                _shared_pool_hospital("P2", {"max_size": 2}),
+            ]
+        )
+    AppConfig(
+        hospitals=[
+            _shared_pool_hospital("P1", {"max_size": 4}),
+            _shared_pool_hospital("P2", {"max_size": 4}),
+        ]
+    )
+
+
+def test_config_rejects_conflicting_options_for_shared_pool():
+    with pytest.raises(ValueError, match="db.pool"):
+        AppConfig(
+            hospitals=[
+                _shared_pool_hospital("P1", {"max_size": 4}),
+                _shared_pool_hospital("P2", {"max_size": 8}),
+            ]
+        )
+
+
+def test_pool_times_out_when_exhausted():
+    pool, _ = _make_pool(max_size=1, acquire_timeout=0.05)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_pool_replaces_connection_failing_health_ping():
+    pool, created = _make_pool(max_size=1, ping_interval=0.0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.healthy = False
+
+    replacement = pool.acquire()
+
+    assert replacement is not conn
+    assert conn.closed is True
+    assert pool.stats()["ping_failures"] == 1
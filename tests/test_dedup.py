@@ -0,0 +1,169 @@
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.clients import backend_api
+from app.core import dedup as dedup_module, pipeline
+from app.core.config import HospitalConfig, get_settings
+from app.core.dedup import DedupCache, content_hash
+from tools.stub_backend import app as stub_app
+
+
+def _canonical(patient_id: str, sbp: int = 120) -> dict:
+    return {
+        "patient": {"patient_id": patient_id, "birthdate": "19900101", "sex": "M"},
+        "vitals": {"SBP": sbp, "DBP": 80, "PR": 70, "RR": 16, "BT": 36.5, "SpO2": 98},
+        "timestamps": {
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+def test_dedup_cache_evicts_least_recently_used(tmp_path):
+    cache = DedupCache(tmp_path / "H1.jsonl", max_entries=2)
+    cache.add("a")
+    cache.add("b")
+    assert cache.contains("a")
+
+    cache.add("c")
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+
+
+def test_dedup_cache_expires_after_ttl(tmp_path, monkeypatch):
+    cache = DedupCache(tmp_path / "H1.jsonl", ttl_seconds=60)
+    cache.add("a")
+
+    now = time.time()
+    monkeypatch.setattr(dedup_module.time, "time", lambda: now + 61)
+
+    assert not cache.contains("a")
+    assert len(cache) == 0
+
+
+def test_dedup_cache_persists_across_restart(tmp_path):
+    cache = DedupCache(tmp_path / "H1.jsonl")
+    cache.add(content_hash(b"payload"))
+    cache.save()
+
+    reopened = DedupCache(tmp_path / "H1.jsonl")
+
+    assert reopened.contains(content_hash(b"payload"))
+    assert not reopened.contains(content_hash(b"other"))
+
+
+def test_dedup_cache_save_appends_only_new_entries(tmp_path):
+    path = tmp_path / "H1.jsonl"
+    cache = DedupCache(path)
+    cache.add("a")
+    cache.add("b")
+    cache.save()
+    cache.add("c")
+    cache.save()
+    cache.save()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)[0] for line in lines] == ["a", "b", "c"]
+    assert DedupCache(path).contains("c")
+
+
+def test_dedup_cache_compacts_log_of_superseded_entries(tmp_path):
+    path = tmp_path / "H1.jsonl"
+    cache = DedupCache(path, max_entries=2)
+    for index in range(2049):
+        cache.add(str(index % 2))
+        cache.save()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= 2048
+    reopened = DedupCache(path, max_entries=2)
+    assert reopened.contains("0") and reopened.contains("1")
+
+
+def test_pipeline_flags_duplicate_rows_for_update_flag(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    monkeypatch.setenv("DEDUP_DIR", str(tmp_path / "dedup"))
+    get_settings.cache_clear()
+    monkeypatch.setattr(dedup_module, "_caches", {})
+    postprocessed: list[str] = []
+
+    def _fake_postprocess(hospital, records):
+        postprocessed.extend(record["patient"]["patient_id"] for record in records)
+        return [None] * len(records)
+
+    rows = [_canonical("P1"), _canonical("P2")]
+    monkeypatch.setattr(pipeline, "iter_oracle", lambda hospital, last_mark: [rows])
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(pipeline, "send_encoded", lambda item: {})
+    monkeypatch.setattr(pipeline, "from_backend", lambda response: response)
+    monkeypatch.setattr(pipeline, "run_postprocess_batch", _fake_postprocess)
+    hospital = HospitalConfig(
+        hospital_id="DEDUP_FLAG",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V"},
+        dedup={"enabled": True},
+        postprocess={"mode": "update_flag"},
+    )
+    dedup_module.get_dedup("DEDUP_FLAG").add(
+        content_hash(_FakeCanonical(rows[0]).model_dump_json().encode())
+    )
+
+    pipeline.run_pull_pipeline(hospital)
+
+    assert sorted(postprocessed) == ["P1", "P2"]
+    get_settings.cache_clear()
+
+
+def test_pipeline_skips_unchanged_records(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    monkeypatch.setenv("DEDUP_DIR", str(tmp_path / "dedup"))
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://testserver/")
+    get_settings.cache_clear()
+    monkeypatch.setattr(dedup_module, "_caches", {})
+    monkeypatch.setattr(backend_api, "_client", TestClient(stub_app))
+    sent: list[bytes] = []
+    original_send = pipeline.send_encoded
+
+    def _counting_send(item):
+        sent.append(item)
+        return original_send(item)
+
+    rows = [_canonical("P1"), _canonical("P2")]
+    monkeypatch.setattr(pipeline, "iter_oracle", lambda hospital, last_mark: [rows])
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(pipeline, "send_encoded", _counting_send)
+    hospital = HospitalConfig(
+        hospital_id="DEDUP_H",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V"},
+        dedup={"enabled": True},
+    )
+
+    pipeline.run_pull_pipeline(hospital)
+    assert len(sent) == 2
+
+    rows[1] = _canonical("P2", sbp=130)
+    pipeline.run_pull_pipeline(hospital)
+    assert len(sent) == 3
+    assert (tmp_path / "dedup" / "DEDUP_H.jsonl").exists()
+    get_settings.cache_clear()
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import httpx
+
+from app.core import dispatch
+from app.core.config import get_settings
+
+
+class _Backend:
+    def __init__(self, fail_patient: str | None = None) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.order: list[tuple[str, int]] = []
+        self.fail_patient = fail_patient
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        body = json.loads(request.content)
+        records = body["records"] if "records" in body else [body]
+        results = []
+        for record in records:
+            self.order.append((record["patient_id"], record["seq"]))
+            results.append({"vital_id": f"{record['patient_id']}-{record['seq']}"})
+        if self.fail_patient and records[0]["patient_id"] == self.fail_patient:
+            return httpx.Response(503)
+        if "records" in body:
+            return httpx.Response(200, json={"results": results})
+        return httpx.Response(200, json=results[0])
+
+
+def _install(monkeypatch, backend: _Backend) -> None:
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://backend.test/")
+    get_settings.cache_clear()
+    monkeypatch.setattr(
+        dispatch,
+        "build_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(backend.handle)),
+    )
+
+
+def _items(patients: list[str], per_patient: int) -> tuple[list[bytes], list[str]]:
+    items, keys = [], []
+    for seq in range(per_patient):
+        for patient in patients:
+            items.append(json.dumps({"patient_id": patient, "seq": seq}).encode())
+            keys.append(patient)
+    return items, keys
+
+
+def test_dispatch_bounds_in_flight_and_keeps_input_order(monkeypatch):
+    backend = _Backend()
+    _install(monkeypatch, backend)
+    items, keys = _items([f"P{i}" for i in range(8)], 3)
+
+    results = dispatch.dispatch_records(items, keys, concurrency=3)
+
+    assert backend.max_in_flight <= 3
+    assert [result["vital_id"] for result in results] == [
+        f"{json.loads(item)['patient_id']}-{json.loads(item)['seq']}" for item in items
+    ]
+    get_settings.cache_clear()
+
+
+def test_dispatch_preserves_per_patient_order(monkeypatch):
+    backend = _Backend()
+    _install(monkeypatch, backend)
+    items, keys = _items(["A", "B", "C", "D"], 5)
+
+    dispatch.dispatch_records(items, keys, concurrency=4, batch_size=2)
+
+    for patient in "ABCD":
+        sent = [seq for pid, seq in backend.order if pid == patient]
+        assert sent == sorted(sent)
+    get_settings.cache_clear()
+
+
+def test_dispatch_stops_lane_after_failure(monkeypatch):
+    backend = _Backend(fail_patient="A")
+    _install(monkeypatch, backend)
+    items, keys = _items(["A"], 3)
+
+    results = dispatch.dispatch_records(items, keys, concurrency=2)
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+    assert backend.order == [("A", 0)]
+    get_settings.cache_clear()
+
+
+def test_dispatch_session_reuses_one_client_across_chunks(monkeypatch):
+    backend = _Backend()
+    monkeypatch.setenv("BACKEND_BASE_URL", "http://backend.test/")
+    get_settings.cache_clear()
+    clients: list[httpx.AsyncClient] = []
+
+    def _build() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(backend.handle))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(dispatch, "build_async_client", _build)
+    items, keys = _items(["P1", "P2"], 2)
+
+    with dispatch.dispatch_session():
+        dispatch.dispatch_records(items, keys, concurrency=2)
+        dispatch.dispatch_records(items, keys, concurrency=2)
+        assert len(clients) == 1
+        assert not clients[0].is_closed
+
+    assert clients[0].is_closed
+    dispatch.dispatch_records(items, keys, concurrency=2)
+    assert len(clients) == 2
+    assert clients[1].is_closed
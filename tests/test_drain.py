@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+from app.core import pipeline, scheduler as scheduler_module
+from app.core.config import AppConfig, HospitalConfig, get_settings
+from app.core.telemetry import TelemetryStore, flush_telemetry
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
+
+
+def _use_store(tmp_path, monkeypatch) -> TelemetryStore:
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    return TelemetryStore()
+
+
+def _stub_send(monkeypatch) -> None:
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(pipeline, "_send_records", lambda *args: (True, None))
+
+
+def test_run_stops_at_drain_limit_and_reports_full(tmp_path, monkeypatch):
+    _use_store(tmp_path, monkeypatch)
+    hospital = HospitalConfig(
+        hospital_id="DRAIN_H",
+        connector_type="pull_rest_api",
+        transform_profile="DRAIN_H",
+        drain={"max_records": 3},
+    )
+    fetched: list[int] = []
+
+    def _chunks(hospital, last_mark=None):
+        for index in range(4):
+            fetched.append(index)
+            yield [{"i": index}, {"i": index}]
+
+    monkeypatch.setattr(pipeline, "_iter_raw_chunks", _chunks)
+    _stub_send(monkeypatch)
+
+    assert pipeline.run_pull_pipeline(hospital) is True
+    assert fetched == [0, 1]
+
+    monkeypatch.setattr(pipeline, "_iter_raw_chunks", lambda h, m=None: iter([]))
+    assert pipeline.run_pull_pipeline(hospital) is False
+
+
+def test_overlapping_run_is_skipped(tmp_path, monkeypatch):
+    store = _use_store(tmp_path, monkeypatch)
+    hospital = HospitalConfig(
+        hospital_id="LOCK_H",
+        connector_type="pull_rest_api",
+        transform_profile="LOCK_H",
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def _chunks(hospital, last_mark=None):
+        started.set()
+        release.wait(5)
+        yield [{"i": 0}]
+
+    monkeypatch.setattr(pipeline, "_iter_raw_chunks", _chunks)
+    _stub_send(monkeypatch)
+    worker = threading.Thread(target=pipeline.run_pull_pipeline, args=[hospital])
+    worker.start()
+    started.wait(5)
+
+    assert pipeline.run_pull_pipeline(hospital) is False
+    release.set()
+    worker.join(5)
+    flush_telemetry()
+
+    assert store.query_logs(
+        "event = ? AND hospital_id = ?", ["pipeline_skipped", "LOCK_H"]
+    )
+
+
+def test_overlapping_runs_send_each_row_once(tmp_path, monkeypatch):
+    _use_store(tmp_path, monkeypatch)
+    hospital = HospitalConfig(
+        hospital_id="ONCE_H",
+        connector_type="pull_db_view",
+        transform_profile="ONCE_H",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "ID"},
+    )
+    rows = [{"ID": index} for index in range(1, 5)]
+    entered = threading.Barrier(2, timeout=5)
+    sent: list[int] = []
+
+    def _fake_iter(hospital, last_mark=None):
+        try:
+            entered.wait(0.5)
+        except threading.BrokenBarrierError:
+            pass
+        yield [row for row in rows if last_mark is None or row["ID"] > last_mark]
+
+    def _fake_send(hospital, records, encoded=None):
+        sent.extend(record["ID"] for record in records)
+        return True, None
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(pipeline, "_send_records", _fake_send)
+    workers = [
+        threading.Thread(target=pipeline.run_pull_pipeline, args=[hospital])
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(5)
+    pipeline.run_pull_pipeline(hospital)
+
+    assert sorted(sent) == [1, 2, 3, 4]
+
+
+def test_malformed_row_is_skipped_and_other_rows_are_sent(tmp_path, monkeypatch):
+    store = _use_store(tmp_path, monkeypatch)
+    hospital = HospitalConfig(
+        hospital_id="BAD_ROW_H",
+        connector_type="pull_rest_api",
+        transform_profile="BAD_ROW_H",
+    )
+    good = {
+        "patient_id": "P1",
+        "birthdate": "19800101",
+        "sex": "M",
+        "SBP": "120",
+        "DBP": "80",
+        "PR": "70",
+        "RR": "16",
+        "BT": "36.5",
+        "SpO2": "98",
+        "created_at": "2024-01-01 10:00:00",
+        "updated_at": "2024-01-01 10:00:00",
+    }
+    chunk = [good, dict(good, patient_id="P2", SBP="high"), dict(good, patient_id="P3")]
+    sent: list[str] = []
+
+    def _fake_send(hospital, records, encoded=None):
+        sent.extend(record["patient"]["patient_id"] for record in records)
+        return True, None
+
+    def _chunks(hospital, last_mark=None):
+        yield chunk
+
+    monkeypatch.setattr(pipeline, "_iter_raw_chunks", _chunks)
+    monkeypatch.setattr(pipeline, "_send_records", _fake_send)
+
+    pipeline.run_pull_pipeline(hospital)
+    flush_telemetry()
+
+    assert sent == ["P1", "P3"]
+    assert store.query_logs(
+        "event = ? AND hospital_id = ? AND record_count = ?",
+        ["transform_failed", "BAD_ROW_H", 1],
+    )
+    assert store.query_logs(
+        "event = ? AND hospital_id = ?", ["pipeline_complete", "BAD_ROW_H"]
+    )
+
+
+def test_scheduler_reruns_immediately_while_draining(monkeypatch):
+    results = [True, True, False]
+    calls: list[float] = []
+    done = threading.Event()
+
+    def _fake_run(hospital):
+        time.sleep(0.05)
+        calls.append(time.monotonic())
+        if len(calls) == len(results):
+            done.set()
+        return results[len(calls) - 1] if len(calls) <= len(results) else False
+
+    monkeypatch.setattr(scheduler_module, "run_pull_pipeline", _fake_run)
+    config = AppConfig(
+        hospital=HospitalConfig(
+            hospital_id="DRAIN_S",
+            connector_type="pull_rest_api",
+            transform_profile="DRAIN_S",
+            schedule_minutes=60,
+            drain={"max_records": 10},
+        )
+    )
+    scheduler = scheduler_module.start_scheduler(config)
+    try:
+        scheduler.modify_job("pull-DRAIN_S", next_run_time=datetime.now(timezone.utc))
+        assert done.wait(5)
+        time.sleep(0.2)
+        assert len(calls) == 3
+        next_run = scheduler.get_job("pull-DRAIN_S").next_run_time
+        assert (next_run - datetime.now(timezone.utc)).total_seconds() > 3000
+    finally:
+        scheduler.shutdown(wait=False)
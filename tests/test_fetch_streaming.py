@@ -0,0 +1,117 @@
+import json
+from contextlib import contextmanager
+
+from app.connectors import mssql_view_fetch, oracle_view_fetch
+from app.core import pipeline
+from app.core.config import HospitalConfig
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[tuple], events: list[str]) -> None:
+        self._rows = list(rows)
+        self._events = events
+        self.description = [("ID",), ("VALUE",)]
+        self.arraysize = 0
+        self.prefetchrows = 0
+        self.fetch_sizes: list[int] = []
+
+    def execute(self, query: str, params: list | dict | None = None) -> None:
+        self.query = query
+        self.params = params
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        self.fetch_sizes.append(size)
+        self._events.append("fetch")
+        chunk, self._rows = self._rows[:size], self._rows[size:]
+        return chunk
+
+
+class _FakeConnection:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _FakeCursor:
+        return self._cursor
+
+
+def _fake_connection_factory(cursor: _FakeCursor):
+    @contextmanager
+    def _connection(db: dict):
+        yield _FakeConnection(cursor)
+
+    return _connection
+
+
+def _hospital(db_type: str, **db_options) -> HospitalConfig:
+    return HospitalConfig(
+        hospital_id="H1",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": db_type, "view_name": "V", **db_options},
+    )
+
+
+def test_oracle_iter_records_yields_chunks(monkeypatch):
+    cursor = _FakeCursor([(i, f"v{i}") for i in range(5)], [])
+    monkeypatch.setattr(
+        oracle_view_fetch, "oracle_connection", _fake_connection_factory(cursor)
+    )
+    hospital = _hospital("oracle", arraysize=2, prefetchrows=3)
+
+    chunks = list(oracle_view_fetch.iter_records(hospital))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0] == {"ID": 0, "VALUE": "v0"}
+    assert cursor.arraysize == 2
+    assert cursor.prefetchrows == 3
+    assert set(cursor.fetch_sizes) == {2}
+
+
+def test_mssql_fetch_records_flattens_chunks(monkeypatch):
+    cursor = _FakeCursor([(i, f"v{i}") for i in range(3)], [])
+    monkeypatch.setattr(
+        mssql_view_fetch, "mssql_connection", _fake_connection_factory(cursor)
+    )
+    hospital = _hospital("mssql", arraysize=2)
+
+    records = mssql_view_fetch.fetch_records(hospital)
+
+    assert [record["ID"] for record in records] == [0, 1, 2]
+
+
+def test_pipeline_sends_before_next_chunk_is_fetched(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    from app.core.config import get_settings
+
+    get_settings.cache_clear()
+    events: list[str] = []
+    cursor = _FakeCursor([(i, f"v{i}") for i in range(4)], events)
+    monkeypatch.setattr(
+        oracle_view_fetch, "oracle_connection", _fake_connection_factory(cursor)
+    )
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+
+    def _fake_send(hospital, records, encoded=None):
+        events.append(f"send:{len(records)}")
+        return True, None
+
+    monkeypatch.setattr(pipeline, "_send_records", _fake_send)
+
+    pipeline.run_pull_pipeline(_hospital("oracle", arraysize=2))
+
+    assert events == ["fetch", "send:2", "fetch", "send:2", "fetch"]
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
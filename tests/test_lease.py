@@ -0,0 +1,261 @@
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.core import pipeline, scheduler as scheduler_module
+from app.core.config import AppConfig, HospitalConfig, get_settings
+from app.core.lease import (
+    HOSPITAL_PREFIX,
+    LeaseCoordinator,
+    SqliteLeaseBackend,
+    set_active_coordinator,
+)
+
+HOSPITALS = ["L1", "L2", "L3", "L4"]
+
+
+def test_replicas_split_hospitals_without_overlap(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    first = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    second = LeaseCoordinator(backend, "replica-b", ttl_seconds=30)
+
+    first.rebalance(HOSPITALS)
+    assert first.held() == set(HOSPITALS)
+
+    second.rebalance(HOSPITALS)
+    assert second.held() == set()
+    _, released = first.rebalance(HOSPITALS)
+    assert len(released) == 2
+    acquired, _ = second.rebalance(HOSPITALS)
+    assert acquired == released
+    assert first.held() | second.held() == set(HOSPITALS)
+    assert not first.held() & second.held()
+
+
+def test_dead_replica_hospitals_are_taken_over(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    first = LeaseCoordinator(backend, "replica-a", ttl_seconds=0.3)
+    second = LeaseCoordinator(backend, "replica-b", ttl_seconds=0.3)
+    second.rebalance(HOSPITALS)
+    first.rebalance(HOSPITALS)
+    second.rebalance(HOSPITALS)
+    first.rebalance(HOSPITALS)
+    assert len(first.held()) == 2
+
+    time.sleep(0.2)
+    first.rebalance(HOSPITALS)
+    time.sleep(0.2)
+    first.rebalance(HOSPITALS)
+
+    assert first.held() == set(HOSPITALS)
+    owners = set(backend.holders(HOSPITAL_PREFIX).values())
+    assert owners == {"replica-a"}
+
+
+def test_release_all_frees_leases(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    coordinator = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    coordinator.rebalance(HOSPITALS)
+
+    coordinator.release_all()
+
+    assert backend.holders("") == {}
+    assert coordinator.held() == set()
+
+
+def test_scheduler_only_runs_leased_hospitals(tmp_path, monkeypatch):
+    monkeypatch.setenv("LEASE_BACKEND", "sqlite")
+    monkeypatch.setenv("LEASE_PATH", str(tmp_path / "leases.sqlite"))
+    monkeypatch.setenv("REPLICA_ID", "replica-s")
+    get_settings.cache_clear()
+    other = LeaseCoordinator(
+        SqliteLeaseBackend(tmp_path / "leases.sqlite"), "replica-t", ttl_seconds=30
+    )
+    other.rebalance(["S1", "S2"])
+    assert other.held() == {"S1", "S2"}
+    ran: list[str] = []
+    monkeypatch.setattr(
+        scheduler_module,
+        "run_pull_pipeline",
+        lambda hospital: ran.append(hospital.hospital_id),
+    )
+    config = AppConfig(
+        hospitals=[
+            {
+                "hospital_id": hospital_id,
+                "connector_type": "pull_rest_api",
+                "transform_profile": hospital_id,
+                "schedule_minutes": 60,
+            }
+            for hospital_id in ("S1", "S2")
+        ]
+    )
+
+    scheduler = scheduler_module.start_scheduler(config)
+    try:
+        time.sleep(0.3)
+        assert scheduler.get_job("pull-S1") is None
+        assert scheduler_module.scheduled_hospitals() == []
+
+        other.release_all()
+        scheduler.modify_job(
+            "lease-rebalance", next_run_time=datetime.now(timezone.utc)
+        )
+        deadline = time.monotonic() + 5
+        while len(ran) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert sorted(ran) == ["S1", "S2"]
+        assert {
+            hospital.hospital_id for hospital in scheduler_module.scheduled_hospitals()
+        } == {"S1", "S2"}
+    finally:
+        scheduler_module.shutdown_scheduler()
+        get_settings.cache_clear()
+    assert SqliteLeaseBackend(tmp_path / "leases.sqlite").holders("") == {}
+
+
+def test_busy_hospitals_are_released_after_their_run(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    first = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    second = LeaseCoordinator(backend, "replica-b", ttl_seconds=30)
+    first.rebalance(HOSPITALS)
+    second.rebalance(HOSPITALS)
+
+    _, released = first.rebalance(HOSPITALS, busy=set(HOSPITALS))
+    assert released == set()
+    assert first.held() == set(HOSPITALS)
+
+    _, released = first.rebalance(HOSPITALS)
+    assert len(released) == 2
+    assert not any(first.holds(hospital_id) for hospital_id in released)
+
+
+def test_holds_expires_without_renewal(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    coordinator = LeaseCoordinator(backend, "replica-a", ttl_seconds=0.2)
+    coordinator.rebalance(["L1"])
+    assert coordinator.holds("L1")
+
+    time.sleep(0.25)
+
+    assert not coordinator.holds("L1")
+    assert coordinator.held() == {"L1"}
+
+
+def test_shared_mark_requires_lease(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    first = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    second = LeaseCoordinator(backend, "replica-b", ttl_seconds=30)
+    first.rebalance(["L1"])
+
+    assert first.save_mark("L1", "TS,ID", (5, "K"))
+    assert not second.save_mark("L1", "TS,ID", (9, "Z"))
+    assert second.load_mark("L1", "TS,ID") == (5, "K")
+    assert second.load_mark("L1", "TS") is None
+
+
+def test_rebalance_failure_removes_pull_jobs(tmp_path):
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    coordinator = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    hospitals = [
+        HospitalConfig(
+            hospital_id=hospital_id,
+            connector_type="pull_rest_api",
+            transform_profile=hospital_id,
+        )
+        for hospital_id in ("F1", "F2")
+    ]
+    scheduler = BackgroundScheduler()
+    scheduler.start(paused=True)
+    try:
+        scheduler_module._rebalance_leases(scheduler, coordinator, hospitals)
+        assert {job.id for job in scheduler.get_jobs()} == {"pull-F1", "pull-F2"}
+
+        def _locked(*args):
+            raise OSError("database is locked")
+
+        backend.acquire = _locked
+        scheduler_module._rebalance_leases(scheduler, coordinator, hospitals)
+
+        assert scheduler.get_jobs() == []
+        assert not coordinator.holds("F1")
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_pipeline_stops_sending_when_lease_is_lost(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    backend = SqliteLeaseBackend(tmp_path / "leases.sqlite")
+    first = LeaseCoordinator(backend, "replica-a", ttl_seconds=30)
+    first.rebalance(["LP"])
+    first.save_mark("LP", "ID", 10)
+    seen_marks: list[object] = []
+    sent: list[int] = []
+
+    def _fake_iter(hospital, last_mark=None):
+        seen_marks.append(last_mark)
+        yield [{"ID": 11}, {"ID": 12}]
+        first.reset()
+        yield [{"ID": 13}]
+
+    def _fake_send(hospital, records, encoded=None):
+        sent.extend(record["ID"] for record in records)
+        return True, None
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(pipeline, "_send_records", _fake_send)
+    hospital = HospitalConfig(
+        hospital_id="LP",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "ID"},
+    )
+    set_active_coordinator(first)
+    try:
+        pipeline.run_pull_pipeline(hospital)
+    finally:
+        set_active_coordinator(None)
+        get_settings.cache_clear()
+
+    assert seen_marks == [10]
+    assert sent == [11, 12]
+    assert first.load_mark("LP", "ID") == 11
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
+
+
+def test_config_rejects_spool_with_lease_backend(monkeypatch):
+    hospital = {
+        "hospital_id": "SP1",
+        "connector_type": "pull_db_view",
+        "transform_profile": "SP1",
+        "db": {"type": "oracle", "view_name": "V", "watermark_column": "ID"},
+        "spool": {"enabled": True},
+    }
+    AppConfig(hospitals=[hospital])
+    monkeypatch.setenv("LEASE_BACKEND", "sqlite")
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="spool"):
+            AppConfig(hospitals=[hospital])
+    finally:
+        monkeypatch.delenv("LEASE_BACKEND")
+        get_settings.cache_clear()
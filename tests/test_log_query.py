@@ -0,0 +1,138 @@
+import base64
+
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings, load_app_config
+from app.core.telemetry import TelemetryStore
+from app.main import create_app
+
+
+def _log(index: int, hospital_id: str) -> dict:
+    return {
+        "timestamp": f"2024-01-01T00:{index // 60:02d}:{index % 60:02d}Z",
+        "level": "ERROR" if index % 3 == 0 else "INFO",
+        "event": "page_test",
+        "hospital_id": hospital_id,
+        "stage": "send",
+        "error_code": "E1" if index % 3 == 0 else None,
+        "message": f"m{index}",
+        "record_count": index,
+    }
+
+
+def _store(tmp_path, monkeypatch) -> TelemetryStore:
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    return TelemetryStore()
+
+
+def test_log_page_walks_newest_first_with_keyset(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    store.insert_logs([_log(index, "PAGE_A") for index in range(90)])
+    store.insert_logs([_log(index, "PAGE_B") for index in range(30)])
+
+    seen: list[int] = []
+    before = None
+    while True:
+        rows = store.query_log_page({"hospital_id": "PAGE_A"}, before, 25)
+        if not rows:
+            break
+        seen.extend(row[8] for row in rows)
+        before = rows[-1][9]
+
+    assert seen == list(range(89, -1, -1))
+
+
+def test_log_page_applies_filters(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    store.insert_logs([_log(index, "PAGE_F") for index in range(60)])
+
+    errors = store.query_log_page(
+        {"hospital_id": "PAGE_F", "level": "ERROR", "error_code": "E1"}, None, 100
+    )
+    ranged = store.query_log_page(
+        {
+            "hospital_id": "PAGE_F",
+            "start": "2024-01-01T00:00:10",
+            "end": "2024-01-01T00:00:20",
+        },
+        None,
+        100,
+    )
+
+    assert [row[8] for row in errors] == list(range(57, -1, -3))
+    assert [row[8] for row in ranged] == list(range(19, 9, -1))
+
+
+def test_admin_api_logs_returns_page_and_cursor(tmp_path, monkeypatch):
+    config_path = tmp_path / "hospitals.yaml"
+    config_path.write_text(
+        "hospital:\n  hospital_id: HOSP_A\n  connector_type: pull_db_view\n"
+        "  transform_profile: HOSP_A\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("SCHEDULER_ENABLED", "false")
+    store = _store(tmp_path, monkeypatch)
+    load_app_config.cache_clear()
+    store.insert_logs([_log(index, "PAGE_API") for index in range(7)])
+    client = TestClient(create_app())
+    token = base64.b64encode(b"admin:admin").decode("utf-8")
+    headers = {"Authorization": f"Basic {token}"}
+
+    first = client.get(
+        "/admin/api/logs",
+        params={"hospital_id": "PAGE_API", "limit": 5},
+        headers=headers,
+    ).json()
+    second = client.get(
+        "/admin/api/logs",
+        params={"hospital_id": "PAGE_API", "limit": 5, "before": first["next_cursor"]},
+        headers=headers,
+    ).json()
+    page = client.get(
+        "/admin/logs", params={"hospital_id": "PAGE_API"}, headers=headers
+    )
+
+    assert [item["record_count"] for item in first["items"]] == [6, 5, 4, 3, 2]
+    assert [item["record_count"] for item in second["items"]] == [1, 0]
+    assert second["next_cursor"] is None
+    assert page.status_code == 200
+    load_app_config.cache_clear()
+
+
+def test_admin_log_time_filters_are_validated(tmp_path, monkeypatch):
+    config_path = tmp_path / "hospitals.yaml"
+    config_path.write_text(
+        "hospital:\n  hospital_id: HOSP_A\n  connector_type: pull_db_view\n"
+        "  transform_profile: HOSP_A\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("SCHEDULER_ENABLED", "false")
+    store = _store(tmp_path, monkeypatch)
+    load_app_config.cache_clear()
+    store.insert_logs([_log(index, "PAGE_TIME") for index in range(5)])
+    client = TestClient(create_app())
+    token = base64.b64encode(b"admin:admin").decode("utf-8")
+    headers = {"Authorization": f"Basic {token}"}
+
+    for params in ({"start": "garbage"}, {"end": "2024-13-01"}):
+        assert (
+            client.get("/admin/api/logs", params=params, headers=headers).status_code
+            == 422
+        )
+        assert (
+            client.get("/admin/logs", params=params, headers=headers).status_code == 422
+        )
+
+    ranged = client.get(
+        "/admin/api/logs",
+        params={
+            "hospital_id": "PAGE_TIME",
+            "start": "2024-01-01T09:00:01+09:00",
+            "end": "2024-01-01T00:00:03Z",
+        },
+        headers=headers,
+    ).json()
+    assert [item["record_count"] for item in ranged["items"]] == [2, 1]
@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.adaptive import get_limiter
+from app.core.config import get_settings, load_app_config
+from app.core.timing import RunTimings
+from app.main import create_app
+
+
+def test_counters_and_histograms_render_prometheus_text():
+    metrics.count_records("MET_H", "fetched", 5)
+    metrics.count_records("MET_H", "fetched", 2)
+    with metrics.bind_hospital("MET_H"):
+        metrics.observe_backend_status(503)
+    timings = RunTimings()
+    timings.record("send", 0.004)
+    timings.record("send", 0.2)
+    metrics.observe_stage_timings("MET_H", timings)
+
+    text = metrics.render_metrics()
+
+    assert 'vtc_records_total{hospital_id="MET_H",stage="fetched"} 7' in text
+    assert 'vtc_backend_responses_total{hospital_id="MET_H",status="503"} 1' in text
+    assert (
+        'vtc_stage_duration_seconds_bucket{hospital_id="MET_H",stage="send",le="0.005"} 1'
+        in text
+    )
+    assert (
+        'vtc_stage_duration_seconds_bucket{hospital_id="MET_H",stage="send",le="+Inf"} 2'
+        in text
+    )
+    assert (
+        'vtc_stage_duration_seconds_count{hospital_id="MET_H",stage="send"} 2' in text
+    )
+    assert "# TYPE vtc_telemetry_queue_depth gauge" in text
+
+
+def test_adaptive_limiter_state_is_exported():
+    limiter = get_limiter(
+        "MET_AIMD", {"concurrency": 8, "batch_size": 4, "adaptive": {"enabled": True}}
+    )
+    limiter.on_success(20.0)
+    limiter.on_overload(40.0)
+
+    text = metrics.render_metrics()
+
+    snapshot = limiter.snapshot()
+    assert f'vtc_dispatch_limit{{hospital_id="MET_AIMD"}} {snapshot["limit"]}' in text
+    assert 'vtc_dispatch_overloads_total{hospital_id="MET_AIMD"} 1' in text
+    assert 'vtc_dispatch_latency_p95_seconds{hospital_id="MET_AIMD"}' in text
+
+
+def test_label_values_are_escaped():
+    metrics.count_records('MET_"Q"\n', "sent", 1)
+
+    assert 'hospital_id="MET_\\"Q\\"\\n"' in metrics.render_metrics()
+
+
+def test_metrics_endpoint(tmp_path, monkeypatch):
+    config_path = tmp_path / "hospitals.yaml"
+    config_path.write_text(
+        "hospital:\n  hospital_id: HOSP_A\n  connector_type: pull_db_view\n"
+        "  transform_profile: HOSP_A\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("SCHEDULER_ENABLED", "false")
+    get_settings.cache_clear()
+    load_app_config.cache_clear()
+    client = TestClient(create_app())
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE vtc_records_total counter" in response.text
+    load_app_config.cache_clear()
@@ -1,10 +1,14 @@
+from datetime import datetime
+
 import pytest
 
 from app.core.errors import ParseError
 from app.utils.parsing import (
+    _strptime,
     coerce_int,
     format_screened_date,
     parse_birthdate,
+    parse_column,
     parse_float,
     parse_int,
     parse_timestamp,
@@ -43,3 +47,43 @@ def test_format_screened_date():
     value = "2024-01-01 10:00:00"
     result = format_screened_date(value, ["%Y-%m-%d %H:%M:%S"])
     assert result == "20240101 10:00:00"
+
+
+@pytest.mark.parametrize(
+    "text, fmt",
+    [
+        ("2024-01-01 10:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-01-01T23:59:59", "%Y-%m-%dT%H:%M:%S"),
+        ("2024-01-01t10:00:00", "%Y-%m-%dT%H:%M:%S"),
+        ("2024-1-1 1:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-01-01  10:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-02-30 10:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-01-01 10:00:60", "%Y-%m-%d %H:%M:%S"),
+        ("19801310", "%Y%m%d"),
+        ("0000-01-01", "%Y-%m-%d"),
+        ("0999-01-01", "%Y-%m-%d"),
+        ("２０２４0101", "%Y%m%d"),
+    ],
+)
+def test_fixed_width_parsing_matches_strptime(text, fmt):
+    try:
+        expected = datetime.strptime(text, fmt)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _strptime(text, fmt)
+    else:
+        assert _strptime(text, fmt) == expected
+
+
+def test_parse_column_keeps_first_error_per_row():
+    errors = [None, None, None]
+    values = parse_column(["1", "x", True], lambda v: parse_int(v, "SBP"), errors, {})
+    assert values == [1, None, None]
+    assert errors[0] is None
+    assert str(errors[1]) == "SBP: 정수가 아님: x"
+    assert str(errors[2]) == "SBP: 정수가 아님: True"
+
+    values = parse_column(["1", "2", "y"], lambda v: parse_int(v, "DBP"), errors, {})
+    assert values == [1, 2, None]
+    assert str(errors[1]) == "SBP: 정수가 아님: x"
+    assert str(errors[2]) == "SBP: 정수가 아님: True"
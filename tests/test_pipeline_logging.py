@@ -1,6 +1,6 @@
 from app.core.config import HospitalConfig
 from app.core.pipeline import run_pull_pipeline
-from app.core.telemetry import TelemetryStore
+from app.core.telemetry import TelemetryStore, flush_telemetry
 
 
 def test_postprocess_failure_logs(tmp_path, monkeypatch):
@@ -27,6 +27,7 @@ def test_postprocess_failure_logs(tmp_path, monkeypatch):
     )
 
     run_pull_pipeline(hospital)
+    flush_telemetry()
     rows = store.query_logs("event = ?", ["postprocess_failed"])
     assert rows is not None
     if rows:
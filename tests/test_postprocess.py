@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from app.core import postprocess
 from app.core.config import HospitalConfig
-from app.core.postprocess import run_postprocess
+from app.core.postprocess import run_postprocess, run_postprocess_batch
 
 
 def test_postprocess_no_config_returns_true():
@@ -95,3 +99,113 @@ def test_postprocess_retry_exhaustion_returns_last_code():
     ok, code = run_postprocess(hospital, {"vital_id": "VID"})
     assert ok is False
     assert code == "POSTPROCESS_KEY_MISSING"
+
+
+class _BatchCursor:
+    def __init__(self, failing_keys: set) -> None:
+        self.failing_keys = failing_keys
+        self.executemany_calls: list[tuple[str, list]] = []
+        self.executed: list[list] = []
+        self.fast_executemany = False
+        self._batch_errors: list = []
+
+    def executemany(self, query: str, rows: list, batcherrors: bool = False) -> None:
+        self.executemany_calls.append((query, rows))
+        failed = [i for i, row in enumerate(rows) if row[-1] in self.failing_keys]
+        if batcherrors:
+            self._batch_errors = [SimpleNamespace(offset=i) for i in failed]
+        elif failed:
+            raise RuntimeError("constraint violated")
+
+    def getbatcherrors(self) -> list:
+        return self._batch_errors
+
+    def execute(self, query: str, values: list) -> None:
+        if values[-1] in self.failing_keys:
+            raise RuntimeError("constraint violated")
+        self.executed.append(values)
+
+
+class _BatchConnection:
+    def __init__(self, cursor: _BatchCursor) -> None:
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self) -> _BatchCursor:
+        return self._cursor
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _batch_connection_factory(conn: _BatchConnection):
+    @contextmanager
+    def _connection(db: dict):
+        yield conn
+
+    return _connection
+
+
+def _flag_hospital(db_type: str, retry: int = 1) -> HospitalConfig:
+    return HospitalConfig(
+        hospital_id="H1",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        postprocess={
+            "mode": "update_flag",
+            "table": "T",
+            "key_column": "ID",
+            "key_value_source": "vital_id",
+            "flag_column": "F",
+            "flag_value": "Y",
+            "retry": retry,
+        },
+        db={"type": db_type},
+    )
+
+
+def test_postprocess_batch_uses_array_dml_with_batcherrors(monkeypatch):
+    cursor = _BatchCursor({"V2"})
+    conn = _BatchConnection(cursor)
+    monkeypatch.setattr(
+        postprocess, "oracle_connection", _batch_connection_factory(conn)
+    )
+    records = [{"vital_id": "V1"}, {"vital_id": "V2"}, {}, {"vital_id": "V3"}]
+
+    codes = run_postprocess_batch(_flag_hospital("oracle", retry=2), records)
+
+    assert codes == [None, "POSTPROCESS_FAILED", "POSTPROCESS_KEY_MISSING", None]
+    query, rows = cursor.executemany_calls[0]
+    assert query == "UPDATE T SET F = :1 WHERE ID = :2"
+    assert rows == [["Y", "V1"], ["Y", "V2"], ["Y", "V3"]]
+    assert cursor.executemany_calls[1][1] == [["Y", "V2"]]
+    assert conn.commits == 2
+
+
+def test_postprocess_batch_mssql_falls_back_to_rows_on_error(monkeypatch):
+    cursor = _BatchCursor({"V2"})
+    conn = _BatchConnection(cursor)
+    monkeypatch.setattr(
+        postprocess, "mssql_connection", _batch_connection_factory(conn)
+    )
+    records = [{"vital_id": "V1"}, {"vital_id": "V2"}, {"vital_id": "V3"}]
+
+    codes = run_postprocess_batch(_flag_hospital("mssql"), records)
+
+    assert codes == [None, "POSTPROCESS_FAILED", None]
+    assert cursor.fast_executemany is True
+    assert cursor.executemany_calls[0][0] == "UPDATE T SET F = ? WHERE ID = ?"
+    assert cursor.executed == [["Y", "V1"], ["Y", "V3"]]
+    assert (conn.rollbacks, conn.commits) == (1, 1)
+
+
+def test_postprocess_batch_without_config_succeeds():
+    hospital = HospitalConfig(
+        hospital_id="H1", connector_type="pull_db_view", transform_profile="H1"
+    )
+
+    assert run_postprocess_batch(hospital, [{}, {}]) == [None, None]
@@ -0,0 +1,110 @@
+import json
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.api import health
+from app.clients import backend_api
+from app.core import metrics, readiness
+from app.core.config import HospitalConfig, get_settings, load_app_config
+from app.core.spool import Spool
+from app.main import create_app
+
+
+def test_run_state_and_staleness():
+    readiness.mark_run_started("READY_H")
+    state = readiness.hospital_readiness("READY_H", stale_after_seconds=3600)
+    assert state["in_progress"] is True
+    assert state["run_elapsed_seconds"] is not None
+    assert state["seconds_since_success"] is None
+
+    readiness.mark_run_finished("READY_H", success=False)
+    state = readiness.hospital_readiness("READY_H", stale_after_seconds=3600)
+    assert state["in_progress"] is False
+    assert state["last_run_failed"] is True
+    assert state["stale"] is False
+
+    readiness.mark_run_finished("READY_H", success=True)
+    time.sleep(0.01)
+    assert readiness.hospital_readiness("READY_H", 3600)["seconds_since_success"] < 5
+    assert readiness.hospital_readiness("READY_H", 0)["stale"] is True
+
+
+def test_spool_backlog_tracks_oldest_pending(tmp_path):
+    spool = Spool(tmp_path)
+    assert spool.backlog() == {"depth": 0, "oldest_age_seconds": None}
+
+    records = [{"id": value} for value in range(3)]
+    spool.enqueue(records, [json.dumps(record).encode() for record in records])
+    backlog = spool.backlog()
+    assert backlog["depth"] == 3
+    assert backlog["oldest_age_seconds"] >= 0
+
+    assert Spool(tmp_path).backlog()["depth"] == 3
+    spool.ack(spool.peek(3))
+    assert spool.backlog() == {"depth": 0, "oldest_age_seconds": None}
+
+
+def test_backend_latency_recorded_for_bound_hospital():
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        event_hooks={
+            "request": [backend_api._mark_sent],
+            "response": [backend_api._record_status],
+        },
+    )
+    with metrics.bind_hospital("READY_LAT"):
+        client.get("http://backend.test/")
+    client.close()
+
+    state = readiness.hospital_readiness("READY_LAT", 3600)
+    assert state["backend_latency_ms"] is not None
+    assert state["backend_latency_age_seconds"] is not None
+
+
+def test_ready_endpoint_reports_stale_hospital(tmp_path, monkeypatch):
+    config_path = tmp_path / "hospitals.yaml"
+    config_path.write_text(
+        "hospital:\n  hospital_id: READY_EP\n  connector_type: pull_db_view\n"
+        "  transform_profile: HOSP_A\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("SCHEDULER_ENABLED", "false")
+    monkeypatch.setenv("READINESS_STALE_FACTOR", "0")
+    get_settings.cache_clear()
+    load_app_config.cache_clear()
+    hospital = HospitalConfig(
+        hospital_id="READY_EP",
+        connector_type="pull_db_view",
+        transform_profile="HOSP_A",
+    )
+    monkeypatch.setattr(health, "scheduled_hospitals", lambda: [hospital])
+    monkeypatch.setattr(health, "scheduler_running", lambda: False)
+    client = TestClient(create_app())
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    body = response.json()
+    assert body["scheduler_running"] is False
+    assert body["hospitals"][0]["hospital_id"] == "READY_EP"
+    assert body["hospitals"][0]["backlog"] is None
+    assert body["hospitals"][0]["oldest_pending_age_seconds"] is None
+
+    spooled = hospital.model_copy(update={"spool": {"enabled": True}})
+    monkeypatch.setattr(health, "scheduled_hospitals", lambda: [spooled])
+    monkeypatch.setattr(
+        health,
+        "spool_backlogs",
+        lambda: {"READY_EP": {"depth": 0, "oldest_age_seconds": None}},
+    )
+    assert client.get("/health/ready").json()["hospitals"][0]["backlog"] == 0
+
+    monkeypatch.setenv("READINESS_STALE_FACTOR", "3")
+    get_settings.cache_clear()
+    readiness.mark_run_finished("READY_EP", success=True)
+    assert client.get("/health/ready").status_code == 200
+    assert client.get("/health").json() == {"status": "정상"}
+    get_settings.cache_clear()
+    load_app_config.cache_clear()
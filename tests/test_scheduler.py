@@ -1,5 +1,8 @@
-from app.core.config import AppConfig, HospitalConfig
-from app.core.scheduler import start_scheduler
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import AppConfig, HospitalConfig, get_settings
+from app.core.scheduler import scheduled_hospitals, start_scheduler
 
 
 def test_scheduler_start_without_pull_connector():
@@ -40,3 +43,47 @@ def test_scheduler_restart_with_pull_connector():
     scheduler_b = start_scheduler(config_b)
     assert scheduler_b is not None
     scheduler_b.shutdown(wait=False)
+
+
+def _pull_hospital(hospital_id: str, **kwargs) -> dict:
+    return {
+        "hospital_id": hospital_id,
+        "connector_type": "pull_rest_api",
+        "transform_profile": hospital_id,
+        **kwargs,
+    }
+
+
+def test_scheduler_registers_each_hospital_on_sized_pool(monkeypatch):
+    monkeypatch.setenv("SCHEDULER_MAX_WORKERS", "4")
+    get_settings.cache_clear()
+    config = AppConfig(
+        hospital=_pull_hospital("M1"),
+        hospitals=[
+            _pull_hospital("M2"),
+            _pull_hospital("M3", enabled=False),
+            _pull_hospital("M4", connector_type="push_rest_api"),
+        ],
+    )
+
+    scheduler = start_scheduler(config)
+    try:
+        jobs = {job.id: job for job in scheduler.get_jobs()}
+        assert set(jobs) == {"pull-M1", "pull-M2", "telemetry-maintenance"}
+        assert jobs["pull-M1"].max_instances == 1
+        assert jobs["pull-M2"].max_instances == 1
+        assert jobs["telemetry-maintenance"].executor == "maintenance"
+        assert scheduler._lookup_executor("default")._pool._max_workers == 4
+        assert [h.hospital_id for h in scheduled_hospitals()] == ["M1", "M2"]
+    finally:
+        scheduler.shutdown(wait=False)
+        get_settings.cache_clear()
+
+
+def test_app_config_rejects_duplicate_hospital_ids():
+    with pytest.raises(ValidationError):
+        AppConfig(hospital=_pull_hospital("D1"), hospitals=[_pull_hospital("D1")])
+
+    config = AppConfig(hospitals=[_pull_hospital("D1"), _pull_hospital("D2")])
+    assert config.find_hospital("D2").hospital_id == "D2"
+    assert config.find_hospital("D3") is None
@@ -0,0 +1,125 @@
+import json
+
+import httpx
+import pytest
+
+from app.core import pipeline, spool as spool_module
+from app.core.config import HospitalConfig, get_settings
+from app.core.spool import Spool
+
+
+def _enqueue(spool: Spool, ids: list[int]) -> None:
+    records = [{"id": value} for value in ids]
+    spool.enqueue(records, [json.dumps(record).encode() for record in records])
+
+
+def test_spool_survives_restart_until_acked(tmp_path):
+    spool = Spool(tmp_path)
+    _enqueue(spool, [1, 2, 3])
+
+    items = spool.peek(2)
+    assert [item.record["id"] for item in items] == [1, 2]
+    assert items[0].payload == b'{"id": 1}'
+    spool.ack(items)
+
+    reopened = Spool(tmp_path)
+    assert [item.record["id"] for item in reopened.peek(10)] == [3]
+    assert reopened.stats()["depth"] == 1
+
+
+def test_spool_rolls_segments_and_deletes_consumed(tmp_path):
+    spool = Spool(tmp_path, segment_max_records=2)
+    _enqueue(spool, [1, 2, 3, 4, 5])
+    assert spool.stats()["segments"] == 3
+
+    spool.ack(spool.peek(4))
+
+    stats = spool.stats()
+    assert stats["depth"] == 1
+    assert stats["segments"] == 1
+    assert [item.record["id"] for item in spool.peek(10)] == [5]
+
+
+def test_spool_drops_torn_tail_on_open(tmp_path):
+    spool = Spool(tmp_path)
+    _enqueue(spool, [1])
+    segment = next(tmp_path.glob("segment-*.jsonl"))
+    with open(segment, "ab") as handle:
+        handle.write(b'{"enqueued_at": 1, "rec')
+
+    reopened = Spool(tmp_path)
+    _enqueue(reopened, [2])
+
+    assert [item.record["id"] for item in reopened.peek(10)] == [1, 2]
+
+
+def test_pipeline_keeps_spooled_records_until_backend_recovers(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    monkeypatch.setenv("SPOOL_DIR", str(tmp_path / "spool"))
+    get_settings.cache_clear()
+    monkeypatch.setattr(spool_module, "_spools", {})
+    fetched = [[{"ID": 1}, {"ID": 2}], [{"ID": 3}]]
+    sent: list[int] = []
+    backend_up = False
+
+    def _fake_iter(hospital, last_mark=None):
+        while fetched:
+            yield fetched.pop(0)
+
+    def _fake_send(hospital, records, encoded=None):
+        if not backend_up:
+            raise httpx.ConnectError("backend down")
+        sent.extend(record["ID"] for record in records)
+        return True, None
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(
+        pipeline, "_encode_records", lambda records: [b"{}" for _ in records]
+    )
+    monkeypatch.setattr(pipeline, "_send_records", _fake_send)
+    hospital = HospitalConfig(
+        hospital_id="SPOOL_H",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "ID"},
+        spool={"enabled": True},
+    )
+
+    pipeline.run_pull_pipeline(hospital)
+    assert sent == []
+    assert spool_module.get_spool("SPOOL_H").stats()["depth"] == 3
+
+    backend_up = True
+    pipeline.run_pull_pipeline(hospital)
+    assert sent == [1, 2, 3]
+    assert spool_module.get_spool("SPOOL_H").stats()["depth"] == 0
+    get_settings.cache_clear()
+
+
+def test_spool_requires_watermark_or_dedup():
+    base = {
+        "hospital_id": "SPOOL_CFG",
+        "connector_type": "pull_db_view",
+        "transform_profile": "H1",
+        "spool": {"enabled": True},
+    }
+    with pytest.raises(ValueError, match="spool"):
+        HospitalConfig(**base, db={"type": "oracle", "view_name": "V"})
+    HospitalConfig(**base, db={"type": "oracle", "watermark_column": "ID"})
+    HospitalConfig(**base, db={"type": "oracle"}, dedup={"enabled": True})
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
@@ -0,0 +1,80 @@
+import json
+import time
+
+from app.core import pipeline
+from app.core.config import HospitalConfig
+from app.core.telemetry import TelemetryStore, flush_telemetry
+from app.core.timing import RunTimings, span
+
+
+def test_nested_spans_record_self_time():
+    timings = RunTimings()
+
+    with timings.span("send"):
+        time.sleep(0.02)
+        with timings.span("postprocess"):
+            time.sleep(0.03)
+
+    summary = timings.summary()
+    assert summary["send"]["count"] == 1
+    assert 15 <= summary["send"]["total_ms"] < 30
+    assert summary["postprocess"]["total_ms"] >= 25
+    assert summary["send"]["p95_ms"] == summary["send"]["max_ms"]
+
+
+def test_span_without_active_run_is_noop():
+    with span("fetch"):
+        pass
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def test_pipeline_logs_stage_timings(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    from app.core.config import get_settings
+
+    get_settings.cache_clear()
+    store = TelemetryStore()
+    hospital = HospitalConfig(
+        hospital_id="TIMING_H",
+        connector_type="pull_rest_api",
+        transform_profile="TIMING_H",
+        timing={"per_record": True},
+    )
+
+    def _chunks(hospital, last_mark=None):
+        yield [{"i": 0}, {"i": 1}]
+        yield [{"i": 2}]
+
+    monkeypatch.setattr(pipeline, "_iter_raw_chunks", _chunks)
+    monkeypatch.setattr(pipeline, "to_canonical", lambda raw: _FakeCanonical(raw))
+    monkeypatch.setattr(
+        pipeline, "_encode_records", lambda records: [b"{}"] * len(records)
+    )
+    monkeypatch.setattr(pipeline, "send_encoded", lambda item: {})
+    monkeypatch.setattr(pipeline, "from_backend", lambda response: response)
+    monkeypatch.setattr(pipeline, "run_postprocess_batch", lambda hospital, records: [])
+
+    pipeline.run_pull_pipeline(hospital)
+    flush_telemetry()
+
+    rows = store.query_logs(
+        "event = ? AND hospital_id = ?", ["stage_timing", "TIMING_H"]
+    )
+    counts = {row[4]: row[8] for row in rows}
+    assert not store.query_logs(
+        "event = ? AND hospital_id = ?", ["pipeline_failed", "TIMING_H"]
+    )
+    assert counts["fetch"] == 3
+    assert counts["transform"] == 3
+    assert counts["send"] == 2
+    assert counts["postprocess"] == 2
@@ -0,0 +1,64 @@
+import threading
+
+from app.core.config import get_settings
+from app.core.telemetry import TelemetryStore
+
+THREADS = 8
+ITERATIONS = 15
+
+
+def _log(thread_index: int, iteration: int) -> dict:
+    return {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "level": "INFO",
+        "event": "stress",
+        "hospital_id": f"STRESS{thread_index}",
+        "stage": "send",
+        "message": f"{thread_index}-{iteration}",
+        "record_count": iteration,
+    }
+
+
+def test_store_survives_concurrent_reads_and_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    store = TelemetryStore()
+    errors: list[BaseException] = []
+    start = threading.Barrier(THREADS)
+
+    def _hammer(thread_index: int) -> None:
+        try:
+            start.wait()
+            for iteration in range(ITERATIONS):
+                store.insert_log(_log(thread_index, iteration))
+                store.insert_logs(
+                    [_log(thread_index, iteration), _log(thread_index, iteration)]
+                )
+                store.update_status(
+                    {
+                        "hospital_id": f"STRESS{thread_index}",
+                        "last_status": "성공",
+                        "postprocess_fail_count": iteration,
+                    }
+                )
+                store.set_watermark(f"STRESS{thread_index}", "ID", iteration)
+                store.query_logs("event = ?", ["stress"])
+                store.query_status()
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=_hammer, args=(index,)) for index in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store.query_logs("event = ?", ["stress"])) == THREADS * ITERATIONS * 3
+    statuses = [row for row in store.query_status() if str(row[0]).startswith("STRESS")]
+    assert len(statuses) == THREADS
+    assert {row[5] for row in statuses} == {ITERATIONS - 1}
+    for index in range(THREADS):
+        assert store.get_watermark(f"STRESS{index}", "ID") == ITERATIONS - 1
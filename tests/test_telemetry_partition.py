@@ -0,0 +1,99 @@
+from datetime import date
+
+from app.core.config import get_settings
+from app.core.telemetry import TelemetryStore
+
+
+def _log(day: str, index: int) -> dict:
+    return {
+        "timestamp": f"{day}T12:00:{index:02d}Z",
+        "level": "INFO",
+        "event": "partition_test",
+        "hospital_id": "PART_H",
+        "stage": "send",
+        "message": f"{day}-{index}",
+        "record_count": index,
+    }
+
+
+def _store(tmp_path, monkeypatch, retention_days: int = 0) -> TelemetryStore:
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    monkeypatch.setenv("TELEMETRY_ARCHIVE_DIR", str(tmp_path / "archive"))
+    monkeypatch.setenv("TELEMETRY_HOT_DAYS", "2")
+    monkeypatch.setenv("TELEMETRY_RETENTION_DAYS", str(retention_days))
+    get_settings.cache_clear()
+    return TelemetryStore()
+
+
+def test_compaction_moves_old_days_to_parquet(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    for day in ["2030-01-01", "2030-01-02", "2030-01-09"]:
+        store.insert_logs([_log(day, index) for index in range(3)])
+
+    result = store.compact_logs(today=date(2030, 1, 10))
+
+    assert result["compacted_rows"] >= 6
+    partitions = tmp_path / "archive" / "logs"
+    assert (partitions / "day=2030-01-01").is_dir()
+    assert (partitions / "day=2030-01-02").is_dir()
+    hot = store.query_logs("event = ?", ["partition_test"])
+    assert [row[6] for row in hot] == ["2030-01-09-0", "2030-01-09-1", "2030-01-09-2"]
+
+    rows = store.query_log_page({"hospital_id": "PART_H"}, None, 100)
+    assert [row[6] for row in rows][:4] == [
+        "2030-01-09-2",
+        "2030-01-09-1",
+        "2030-01-09-0",
+        "2030-01-02-2",
+    ]
+    assert len(rows) == 9
+
+    pruned = store.query_log_page(
+        {"hospital_id": "PART_H", "start": "2030-01-02T00:00:00"}, None, 100
+    )
+    assert {row[6][:10] for row in pruned} == {"2030-01-02", "2030-01-09"}
+
+    page = store.query_log_page({"hospital_id": "PART_H"}, rows[3][9], 2)
+    assert [row[6] for row in page] == ["2030-01-02-1", "2030-01-02-0"]
+
+
+def test_retention_deletes_expired_partitions(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch, retention_days=5)
+    store.insert_logs([_log("2031-03-01", 0), _log("2031-03-07", 0)])
+
+    store.compact_logs(today=date(2031, 3, 10))
+    result = store.compact_logs(today=date(2031, 3, 10))
+
+    partitions = tmp_path / "archive" / "logs"
+    assert not (partitions / "day=2031-03-01").exists()
+    assert (partitions / "day=2031-03-07").is_dir()
+    assert result["compacted_rows"] == 0
+
+
+def test_log_page_reads_only_partitions_below_cursor(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    for day in ["2030-02-01", "2030-02-02", "2030-02-03"]:
+        store.insert_logs([_log(day, index) for index in range(3)])
+    store.compact_logs(today=date(2030, 2, 10))
+    first_of_second_day = store.query_log_page(
+        {"hospital_id": "PART_H", "start": "2030-02-02T00:00:00"}, None, 100
+    )[-1][9]
+
+    partitions = store._archive_partitions({}, first_of_second_day)
+
+    assert [[path.parent.name for path in files] for files in partitions] == [
+        ["day=2030-02-01"]
+    ]
+    page = store.query_log_page({"hospital_id": "PART_H"}, first_of_second_day, 10)
+    assert [row[6] for row in page] == ["2030-02-01-2", "2030-02-01-1", "2030-02-01-0"]
+
+
+def test_logs_are_indexed_by_log_id(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    indexes = {
+        row[0]
+        for row in store._cursor()
+        .execute("SELECT index_name FROM duckdb_indexes() WHERE table_name = 'logs'")
+        .fetchall()
+    }
+    assert {"logs_log_id", "logs_hospital_log_id"} <= indexes
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from app.core.config import get_settings
+from app.core.telemetry import TelemetryStore
+
+
+def _run(minute: int, hospital_id: str, duration_ms: int, records: int) -> dict:
+    return {
+        "timestamp": f"2032-05-01T10:{minute:02d}:30Z",
+        "level": "INFO",
+        "event": "pipeline_complete",
+        "hospital_id": hospital_id,
+        "stage": "postprocess",
+        "message": "done",
+        "duration_ms": duration_ms,
+        "record_count": records,
+    }
+
+
+def _failure(minute: int, hospital_id: str) -> dict:
+    return {
+        "timestamp": f"2032-05-01T10:{minute:02d}:45Z",
+        "level": "ERROR",
+        "event": "pipeline_failed",
+        "hospital_id": hospital_id,
+        "stage": "pipeline",
+        "error_code": "API_RESP_002",
+        "message": "failed",
+    }
+
+
+def _store(tmp_path, monkeypatch) -> TelemetryStore:
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    return TelemetryStore()
+
+
+def test_rollups_accumulate_across_batches(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    store.insert_logs([_run(minute, "ROLL_A", 40 + minute, 10) for minute in range(10)])
+    store.insert_logs([_run(1, "ROLL_A", 4000, 5), _failure(1, "ROLL_A")])
+    store.insert_logs([_run(2, "ROLL_B", 20, 3)])
+
+    since = datetime(2032, 5, 1, 10, 0)
+    hourly = store.query_rollups("hour", since, "ROLL_A")
+    minutes = store.query_rollups("minute", since, "ROLL_A")
+
+    assert len(hourly) == 1
+    assert hourly[0]["runs"] == 12
+    assert hourly[0]["records"] == 105
+    assert hourly[0]["failures"] == 1
+    assert hourly[0]["errors"] == 1
+    assert hourly[0]["error_codes"] == {"API_RESP_002": 1}
+    assert hourly[0]["duration_p50_ms"] == 50
+    assert hourly[0]["duration_p95_ms"] == 4000
+    assert hourly[0]["duration_max_ms"] == 4000
+    assert len(minutes) == 10
+    assert minutes[1]["runs"] == 3
+    assert minutes[1]["records"] == 15
+
+
+def test_rollup_summary_sums_hospitals(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    store.insert_logs([_run(5, "ROLL_S1", 100, 7), _run(6, "ROLL_S2", 200, 8)])
+    store.insert_logs([_failure(7, "ROLL_S2")])
+
+    summary = store.query_rollup_summary(datetime(2032, 5, 1, 10, 0), "ROLL_S2")
+
+    assert summary["runs"] == 2
+    assert summary["records"] == 8
+    assert summary["failures"] == 1
+    assert summary["duration_max_ms"] == 200
@@ -0,0 +1,109 @@
+import threading
+import time
+
+from app.core import telemetry
+from app.core.config import get_settings
+from app.core.logger import log_event
+from app.core.telemetry import TelemetryStore, TelemetryWriter
+
+
+def _record(index: int) -> dict:
+    return {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "level": "INFO",
+        "event": "writer_test",
+        "hospital_id": "TW",
+        "stage": "send",
+        "message": f"m{index}",
+        "record_count": index,
+    }
+
+
+def test_writer_flushes_in_bulk(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    store = TelemetryStore()
+    batches: list[int] = []
+    original = TelemetryStore.insert_logs
+
+    def _counting_insert(self, records):
+        batches.append(sum(record["event"] == "writer_test" for record in records))
+        original(self, records)
+
+    monkeypatch.setattr(TelemetryStore, "insert_logs", _counting_insert)
+    writer = TelemetryWriter(batch_size=50, flush_interval=5.0)
+
+    for index in range(120):
+        assert writer.submit(_record(index))
+    writer.close()
+
+    assert sum(batches) == 120
+    assert max(batches) <= 50
+    assert writer.stats()["written"] == 120
+    rows = store.query_logs("event = ? AND hospital_id = ?", ["writer_test", "TW"])
+    assert len(rows) == 120
+
+
+def test_writer_counts_dropped_events_when_full(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(
+        TelemetryStore, "insert_logs", lambda self, records: release.wait(5)
+    )
+    writer = TelemetryWriter(max_queue=2, batch_size=1, flush_interval=0.01)
+
+    results = [writer.submit(_record(index)) for index in range(10)]
+    release.set()
+    writer.close()
+
+    assert not all(results)
+    assert writer.stats()["dropped"] == results.count(False)
+
+
+def test_writer_counts_failed_batches(monkeypatch):
+    def _fail(self, records):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(TelemetryStore, "insert_logs", _fail)
+    writer = TelemetryWriter(max_queue=10, batch_size=5, flush_interval=0.01)
+
+    for index in range(3):
+        writer.submit(_record(index))
+    writer.close()
+
+    assert writer.stats()["failed"] == 3
+    assert writer.stats()["written"] == 0
+
+
+def test_reads_do_not_wait_for_pending_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    store = TelemetryStore()
+    release = threading.Event()
+    original = TelemetryStore.insert_logs
+
+    def _slow_insert(self, records):
+        release.wait(5)
+        original(self, records)
+
+    monkeypatch.setattr(TelemetryStore, "insert_logs", _slow_insert)
+    writer = TelemetryWriter(max_queue=10, batch_size=1, flush_interval=0.01)
+    monkeypatch.setattr(telemetry, "_writer", writer)
+    try:
+        writer.submit(_record(0))
+        started = time.monotonic()
+        store.query_log_page({"hospital_id": "TW"}, None, 10)
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        writer.close()
+
+
+def test_log_event_is_visible_after_flush(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    store = TelemetryStore()
+
+    log_event("writer_visible", "INFO", "TW2", "fetch", "queued")
+    telemetry.flush_telemetry()
+
+    assert store.query_logs("event = ?", ["writer_visible"])
@@ -0,0 +1,114 @@
+import json
+import pickle
+from concurrent.futures import Future
+
+import pytest
+
+from app.connectors.oracle_view_fetch import DEFAULT_ARRAYSIZE
+from app.core import pipeline, transform_pool
+from app.core.config import get_settings
+from app.core.errors import ParseError
+
+RAW = {
+    "patient_id": "P1",
+    "patient_name": "홍길동",
+    "birthdate": "19800101",
+    "sex": "M",
+    "SBP": "120",
+    "DBP": "80",
+    "PR": "70",
+    "RR": "16",
+    "BT": "36.5",
+    "SpO2": "98",
+    "created_at": "2024-01-01 10:00:00",
+    "updated_at": "2024-01-01 10:00:00",
+}
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    monkeypatch.setenv("TRANSFORM_WORKERS", "2")
+    monkeypatch.setenv("TRANSFORM_MIN_RECORDS", "2")
+    get_settings.cache_clear()
+    yield
+    transform_pool.close_transform_pool()
+    get_settings.cache_clear()
+
+
+def test_parse_error_survives_pickle():
+    error = pickle.loads(pickle.dumps(ParseError("sex", "값이 필요함")))
+    assert isinstance(error, ParseError)
+    assert error.code == "TX_PARSE_001"
+    assert str(error) == "sex: 값이 필요함"
+
+
+def test_pool_disabled_or_small_chunk_runs_inline(pool_settings, monkeypatch):
+    assert transform_pool.transform_in_pool([RAW]) is None
+    monkeypatch.setenv("TRANSFORM_WORKERS", "0")
+    get_settings.cache_clear()
+    assert transform_pool.transform_in_pool([RAW] * 5) is None
+
+
+def test_pool_matches_inline_transform_in_order(pool_settings):
+    raws = [dict(RAW, patient_id=f"P{index}") for index in range(5)]
+    expected = transform_pool.transform_records(raws)
+    assert pipeline._transform_chunk(raws, per_record=False) == expected
+    records, encoded, errors = expected
+    assert errors == [None] * 5
+    assert [record["patient"]["patient_id"] for record in records] == [
+        f"P{index}" for index in range(5)
+    ]
+    assert [json.loads(item) for item in encoded] == records
+
+
+def test_pool_returns_per_row_errors(pool_settings):
+    raws = [RAW, dict(RAW, sex="X"), RAW, dict(RAW, patient_name=123)]
+    records, encoded, errors = transform_pool.transform_in_pool(raws)
+
+    assert len(records) == len(encoded) == 2
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], ParseError)
+    assert errors[1].code == "TX_PARSE_001"
+    assert isinstance(errors[3], RuntimeError)
+
+
+def test_pool_splits_chunk_across_all_workers(monkeypatch):
+    monkeypatch.setenv("TRANSFORM_WORKERS", "4")
+    monkeypatch.setenv("TRANSFORM_MIN_RECORDS", "8")
+    get_settings.cache_clear()
+    slices: list[int] = []
+
+    class _InlinePool:
+        def submit(self, fn, records):
+            slices.append(len(records))
+            future = Future()
+            future.set_result(
+                ([{}] * len(records), [b""] * len(records), [None] * len(records))
+            )
+            return future
+
+    monkeypatch.setattr(transform_pool, "_get_pool", lambda workers: _InlinePool())
+    try:
+        records, _, _ = transform_pool.transform_in_pool([RAW] * 10)
+    finally:
+        get_settings.cache_clear()
+
+    assert slices == [3, 3, 3, 1]
+    assert len(records) == 10
+
+
+def test_pool_is_rebuilt_when_worker_count_changes():
+    try:
+        first = transform_pool._get_pool(1)
+        assert transform_pool._get_pool(1) is first
+        second = transform_pool._get_pool(2)
+        assert second is not first
+        assert second._max_workers == 2
+        with pytest.raises(RuntimeError):
+            first.submit(len, [])
+    finally:
+        transform_pool.close_transform_pool()
+
+
+def test_default_threshold_fits_default_arraysize():
+    assert get_settings().transform_min_records <= DEFAULT_ARRAYSIZE
@@ -0,0 +1,204 @@
+import json
+from datetime import datetime
+
+from app.core import pipeline
+from app.core.config import HospitalConfig, get_settings
+from app.core.db import incremental_query
+from app.core.telemetry import TelemetryStore
+
+
+def _store(tmp_path, monkeypatch) -> TelemetryStore:
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    return TelemetryStore()
+
+
+def test_incremental_query_binds_last_mark():
+    query, params = incremental_query("SELECT * FROM V", "ID", "oracle", 10)
+    assert "src.ID > :last_mark" in query
+    assert query.endswith("ORDER BY src.ID")
+    assert params == {"last_mark": 10}
+
+    query, params = incremental_query("SELECT * FROM V", "ID", "mssql", 10)
+    assert "src.ID > ?" in query
+    assert params == [10]
+
+
+def test_incremental_query_without_mark_only_orders():
+    query, params = incremental_query("SELECT * FROM V", "ID", "oracle", None)
+    assert "WHERE" not in query
+    assert params == []
+
+
+def test_incremental_query_uses_composite_mark():
+    query, params = incremental_query(
+        "SELECT * FROM V", "UPDATED_AT", "oracle", (5, 10), "ID"
+    )
+    assert (
+        "src.UPDATED_AT > :last_mark OR "
+        "(src.UPDATED_AT = :last_mark AND src.ID > :last_key)"
+    ) in query
+    assert query.endswith("ORDER BY src.UPDATED_AT, src.ID")
+    assert params == {"last_mark": 5, "last_key": 10}
+
+    query, params = incremental_query(
+        "SELECT * FROM V", "UPDATED_AT", "mssql", (5, 10), "ID"
+    )
+    assert "src.UPDATED_AT > ? OR (src.UPDATED_AT = ? AND src.ID > ?)" in query
+    assert params == [5, 5, 10]
+
+
+def test_incremental_query_moves_order_by_to_outer_query():
+    query, _ = incremental_query(
+        "SELECT A, ROW_NUMBER() OVER (ORDER BY B) RN FROM V ORDER BY A DESC",
+        "ID",
+        "mssql",
+        None,
+    )
+    assert query == (
+        "SELECT * FROM (SELECT A, ROW_NUMBER() OVER (ORDER BY B) RN FROM V) src "
+        "ORDER BY src.ID"
+    )
+
+
+def test_watermark_round_trip_preserves_type(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    marked_at = datetime(2024, 1, 2, 3, 4, 5)
+
+    store.set_watermark("WM_DT", "UPDATED_AT", marked_at)
+    store.set_watermark("WM_INT", "ID", 42)
+
+    assert store.get_watermark("WM_DT", "UPDATED_AT") == marked_at
+    assert store.get_watermark("WM_INT", "ID") == 42
+    assert store.get_watermark("WM_INT", "OTHER_COLUMN") is None
+
+    store.set_watermark("WM_PAIR", "UPDATED_AT,ID", (marked_at, 7))
+    assert store.get_watermark("WM_PAIR", "UPDATED_AT,ID") == (marked_at, 7)
+
+
+def test_pipeline_advances_watermark_per_chunk(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    seen_marks: list[object] = []
+
+    def _fake_iter(hospital, last_mark=None):
+        seen_marks.append(last_mark)
+        yield [{"ID": 4}, {"ID": 5}]
+        yield [{"ID": 6}]
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(
+        pipeline, "_send_records", lambda hospital, records, encoded=None: (True, None)
+    )
+    hospital = HospitalConfig(
+        hospital_id="WM_PIPE",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "id"},
+    )
+    store.set_watermark("WM_PIPE", "id", 3)
+
+    pipeline.run_pull_pipeline(hospital)
+
+    assert seen_marks == [3]
+    assert store.get_watermark("WM_PIPE", "id") == 6
+
+
+def test_pipeline_does_not_skip_ties_when_run_stops_mid_value(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+
+    def _fake_iter(hospital, last_mark=None):
+        yield [{"ID": 1, "TS": 1}, {"ID": 2, "TS": 2}]
+        yield [{"ID": 3, "TS": 2}]
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(
+        pipeline, "_send_records", lambda hospital, records, encoded=None: (True, None)
+    )
+    hospital = HospitalConfig(
+        hospital_id="WM_TIE",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "TS"},
+        drain={"max_records": 2},
+    )
+
+    pipeline.run_pull_pipeline(hospital)
+
+    # TS=2 행이 다음 청크에 더 남아 있을 수 있으므로 1까지만 저장
+    assert store.get_watermark("WM_TIE", "TS") == 1
+
+
+def test_pipeline_stores_composite_mark_per_chunk(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    seen_marks: list[object] = []
+
+    def _fake_iter(hospital, last_mark=None):
+        seen_marks.append(last_mark)
+        yield [{"ID": 1, "TS": 2}, {"ID": 2, "TS": 2}]
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(
+        pipeline, "_send_records", lambda hospital, records, encoded=None: (True, None)
+    )
+    hospital = HospitalConfig(
+        hospital_id="WM_KEY",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={
+            "type": "oracle",
+            "view_name": "V",
+            "watermark_column": "TS",
+            "watermark_key_column": "ID",
+            "arraysize": 2,
+        },
+        drain={"max_records": 2},
+    )
+    store.set_watermark("WM_KEY", "TS,ID", (1, 9))
+
+    pipeline.run_pull_pipeline(hospital)
+
+    assert seen_marks == [(1, 9)]
+    assert store.get_watermark("WM_KEY", "TS,ID") == (2, 2)
+
+
+def test_pipeline_keeps_watermark_when_postprocess_fails(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+
+    def _fake_iter(hospital, last_mark=None):
+        yield [{"ID": 1}]
+
+    monkeypatch.setattr(pipeline, "iter_oracle", _fake_iter)
+    monkeypatch.setattr(pipeline, "to_canonical_batch", _fake_batch)
+    monkeypatch.setattr(
+        pipeline,
+        "_send_records",
+        lambda hospital, records, encoded=None: (False, "POSTPROCESS_FAILED"),
+    )
+    hospital = HospitalConfig(
+        hospital_id="WM_FAIL",
+        connector_type="pull_db_view",
+        transform_profile="H1",
+        db={"type": "oracle", "view_name": "V", "watermark_column": "ID"},
+    )
+
+    pipeline.run_pull_pipeline(hospital)
+
+    assert store.get_watermark("WM_FAIL", "ID") is None
+
+
+class _FakeCanonical:
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    def model_dump(self) -> dict:
+        return dict(self._raw)
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self._raw)
+
+
+def _fake_batch(raws: list[dict]) -> tuple[list, list]:
+    return [_FakeCanonical(raw) for raw in raws], [None] * len(raws)
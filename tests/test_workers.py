@@ -0,0 +1,227 @@
+import tempfile
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import health, metrics as metrics_api
+from app.core import metrics as metrics_module, workers
+from app.core.config import get_settings
+from app.core.telemetry import TelemetryStore
+from app.core.workers import (
+    ROLE_FOLLOWER,
+    ROLE_OWNER,
+    ROLE_SINGLE,
+    OwnerClient,
+    OwnerServer,
+    RemoteTelemetryStore,
+    claim_owner,
+)
+from app.main import create_app
+
+
+@pytest.fixture
+def socket_dir():
+    # AF_UNIX 경로 길이 제한 때문에 짧은 임시 디렉터리를 사용
+    with tempfile.TemporaryDirectory(dir="/tmp") as path:
+        yield path
+
+
+def test_only_one_process_claims_owner(tmp_path):
+    first = claim_owner(tmp_path / "worker.lock")
+    assert first is not None
+    assert claim_owner(tmp_path / "worker.lock") is None
+    first.close()
+    second = claim_owner(tmp_path / "worker.lock")
+    assert second is not None
+    second.close()
+
+
+def test_owner_server_round_trip(socket_dir):
+    server = OwnerServer(f"{socket_dir}/owner.sock", {"add": lambda a, b=0: a + b})
+    client = OwnerClient(f"{socket_dir}/owner.sock")
+    try:
+        assert client.call("add", 1, b=2) == 3
+        with pytest.raises(RuntimeError, match="알 수 없는 작업"):
+            client.call("missing")
+        assert client.call("add", 5) == 5
+    finally:
+        client.close()
+        server.close()
+
+
+def test_remote_store_forwards_to_owner_store(socket_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "telemetry.duckdb"))
+    get_settings.cache_clear()
+    server = OwnerServer(f"{socket_dir}/owner.sock", {"telemetry": workers._call_store})
+    client = OwnerClient(f"{socket_dir}/owner.sock")
+    try:
+        remote = RemoteTelemetryStore(client)
+        remote.set_watermark("IPC_H", "ID", 42)
+        assert remote.get_watermark("IPC_H", "ID") == 42
+        assert TelemetryStore().get_watermark("IPC_H", "ID") == 42
+        with pytest.raises(AttributeError):
+            remote._write
+        with pytest.raises(RuntimeError):
+            client.call("telemetry", "_init_db")
+    finally:
+        client.close()
+        server.close()
+
+
+def test_worker_roles_and_follower_proxying(socket_dir, monkeypatch):
+    monkeypatch.setenv("MULTI_WORKER", "true")
+    monkeypatch.setenv("WORKER_LOCK_PATH", f"{socket_dir}/worker.lock")
+    monkeypatch.setenv("WORKER_SOCKET_PATH", f"{socket_dir}/worker.sock")
+    monkeypatch.setenv("SCHEDULER_ENABLED", "false")
+    get_settings.cache_clear()
+    owner_handle = claim_owner(f"{socket_dir}/worker.lock")
+    server = OwnerServer(
+        f"{socket_dir}/worker.sock",
+        {
+            "readiness": lambda: (False, {"status": "지연", "hospitals": []}),
+            "metrics": lambda: "vtc_owner_metric 1\n",
+            "merge_metrics": lambda deltas: None,
+        },
+    )
+    try:
+        assert workers.start_worker_role(get_settings()) == ROLE_FOLLOWER
+        assert isinstance(TelemetryStore(), RemoteTelemetryStore)
+
+        client = TestClient(create_app())
+        assert workers.worker_role() == ROLE_FOLLOWER
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "지연"
+        assert client.get("/metrics").text == "vtc_owner_metric 1\n"
+    finally:
+        workers.stop_worker_role()
+        owner_handle.close()
+        get_settings.cache_clear()
+    assert workers.worker_role() == ROLE_SINGLE
+    assert isinstance(TelemetryStore(), TelemetryStore)
+
+
+def test_follower_readiness_without_owner(socket_dir, monkeypatch):
+    monkeypatch.setattr(workers, "_role", ROLE_FOLLOWER)
+    monkeypatch.setattr(workers, "_client", OwnerClient(f"{socket_dir}/missing.sock"))
+    app = FastAPI()
+    app.include_router(health.router)
+    response = TestClient(app).get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["owner_reachable"] is False
+
+
+def test_single_process_claims_owner_role(socket_dir, monkeypatch):
+    monkeypatch.setenv("MULTI_WORKER", "true")
+    monkeypatch.setenv("WORKER_LOCK_PATH", f"{socket_dir}/worker.lock")
+    monkeypatch.setenv("WORKER_SOCKET_PATH", f"{socket_dir}/worker.sock")
+    get_settings.cache_clear()
+    try:
+        assert workers.start_worker_role(get_settings()) == ROLE_OWNER
+        client = OwnerClient(f"{socket_dir}/worker.sock")
+        assert client.call("telemetry", "query_status") is not None
+        client.close()
+    finally:
+        workers.stop_worker_role()
+        get_settings.cache_clear()
+    assert workers.worker_role() == ROLE_SINGLE
+
+
+def test_follower_takes_over_when_owner_exits(socket_dir, monkeypatch):
+    monkeypatch.setenv("MULTI_WORKER", "true")
+    monkeypatch.setenv("WORKER_LOCK_PATH", f"{socket_dir}/worker.lock")
+    monkeypatch.setenv("WORKER_SOCKET_PATH", f"{socket_dir}/worker.sock")
+    get_settings.cache_clear()
+    owner_handle = claim_owner(f"{socket_dir}/worker.lock")
+    promoted: list[bool] = []
+    try:
+        role = workers.start_worker_role(
+            get_settings(),
+            {"metrics": lambda: "vtc_promoted_metric 1\n"},
+            on_promote=lambda: promoted.append(True),
+        )
+        assert role == ROLE_FOLLOWER
+        app = FastAPI()
+        app.include_router(metrics_api.router)
+        client = TestClient(app)
+
+        response = client.get("/metrics")
+        assert response.status_code == 503
+        assert workers.worker_role() == ROLE_FOLLOWER
+
+        owner_handle.close()
+        assert client.get("/metrics").status_code == 503
+        assert workers.worker_role() == ROLE_OWNER
+        assert promoted == [True]
+        assert isinstance(TelemetryStore(), TelemetryStore)
+
+        remote = OwnerClient(f"{socket_dir}/worker.sock")
+        assert remote.call("metrics") == "vtc_promoted_metric 1\n"
+        remote.close()
+    finally:
+        workers.stop_worker_role()
+        owner_handle.close()
+        get_settings.cache_clear()
+
+
+def test_follower_metrics_are_added_to_owner_registry(socket_dir, monkeypatch):
+    monkeypatch.setattr(workers, "_role", ROLE_FOLLOWER)
+    client = OwnerClient(f"{socket_dir}/owner.sock")
+    monkeypatch.setattr(workers, "_client", client)
+    received: list[dict] = []
+    server = OwnerServer(
+        f"{socket_dir}/owner.sock",
+        {
+            "merge_metrics": received.append,
+            "metrics": lambda: "vtc_owner_metric 1\n",
+        },
+    )
+    app = FastAPI()
+    app.include_router(metrics_api.router)
+    try:
+        with metrics_module.bind_hospital("FOLLOWER_H"):
+            metrics_module.observe_backend_status(200)
+
+        assert TestClient(app).get("/metrics").text == "vtc_owner_metric 1\n"
+    finally:
+        client.close()
+        server.close()
+
+    [deltas] = received
+    assert (("FOLLOWER_H", "200"), 1) in [
+        (tuple(labels), value)
+        for labels, value in deltas[metrics_module.BACKEND_RESPONSES.name]
+    ]
+    assert "FOLLOWER_H" not in metrics_module.render_metrics()
+    metrics_module.merge_metric_deltas(deltas)
+    assert (
+        'vtc_backend_responses_total{hospital_id="FOLLOWER_H",status="200"} 1'
+        in metrics_module.render_metrics()
+    )
+
+
+def test_idle_follower_takes_over_when_owner_exits(socket_dir, monkeypatch):
+    monkeypatch.setenv("MULTI_WORKER", "true")
+    monkeypatch.setenv("WORKER_LOCK_PATH", f"{socket_dir}/worker.lock")
+    monkeypatch.setenv("WORKER_SOCKET_PATH", f"{socket_dir}/worker.sock")
+    monkeypatch.setenv("WORKER_HEARTBEAT_SECONDS", "0.05")
+    get_settings.cache_clear()
+    owner_handle = claim_owner(f"{socket_dir}/worker.lock")
+    promoted = threading.Event()
+    try:
+        role = workers.start_worker_role(get_settings(), on_promote=promoted.set)
+        assert role == ROLE_FOLLOWER
+        time.sleep(0.2)
+        assert workers.worker_role() == ROLE_FOLLOWER
+
+        owner_handle.close()
+
+        assert promoted.wait(5)
+        assert workers.worker_role() == ROLE_OWNER
+    finally:
+        workers.stop_worker_role()
+        owner_handle.close()
+        get_settings.cache_clear()
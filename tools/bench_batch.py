@@ -0,0 +1,79 @@
+"""배치 크기별 백엔드 전송 처리량 측정
+
+대역 백엔드(`tools.stub_backend`)를 로컬에서 띄우고 배치 크기마다
+같은 레코드 수를 전송해 초당 처리 건수를 출력한다.
+
+    python -m tools.bench_batch --records 2000 --latency-ms 80 --sizes 1,10,50,200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+
+import uvicorn
+
+from app.clients import backend_api
+from app.core.config import get_settings
+from tools.stub_backend import app as stub_app
+
+
+def _sample_payload(index: int) -> dict:
+    return {
+        "patient": {"patient_id": f"P{index:06d}", "birthdate": "19900101", "sex": "M"},
+        "vitals": {"SBP": 120, "DBP": 80, "PR": 70, "RR": 16, "BT": 36.5, "SpO2": 98.0},
+        "timestamps": {
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+def _start_stub(port: int) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--sizes", default="1,10,50,100,500")
+    parser.add_argument("--port", type=int, default=9765)
+    args = parser.parse_args()
+
+    os.environ["STUB_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["BACKEND_BASE_URL"] = f"http://127.0.0.1:{args.port}/"
+    get_settings.cache_clear()
+    server = _start_stub(args.port)
+
+    payloads = [_sample_payload(i) for i in range(args.records)]
+    encoded = [backend_api.encode_payload(payload) for payload in payloads]
+    print(f"records={args.records} latency_ms={args.latency_ms}")
+    for size in [int(value) for value in args.sizes.split(",")]:
+        started = time.perf_counter()
+        if size <= 1:
+            for item in encoded:
+                backend_api.send_encoded(item)
+        else:
+            for batch in backend_api.iter_batches(encoded, size, 0):
+                backend_api.send_batch(batch)
+        elapsed = time.perf_counter() - started
+        print(
+            f"batch_size={size:>5} elapsed={elapsed:8.2f}s "
+            f"throughput={args.records / elapsed:10.1f} rec/s"
+        )
+
+    backend_api.close_client()
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""레코드당 변환/직렬화 CPU 시간 측정
+
+원본 레코드를 캐노니컬 레코드와 백엔드 JSON 바이트로 바꾸는 데 드는 CPU 시간을
+세 방식으로 비교한다.
+
+- previous: 행 단위 검증 -> dict -> 재검증 -> dict -> json.dumps
+- per-row: 행 단위 검증 한 번 -> dict + model_dump_json
+- batch: 현재 파이프라인(열 단위 파싱 + 일괄 검증 -> dict + model_dump_json)
+
+    python -m tools.bench_transform --records 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from app.clients.backend_api import encode_payload
+from app.core.pipeline import _transform_chunk
+from app.models.canonical import CanonicalPayload
+from app.transforms.hospital_profiles.HOSP_A.inbound import to_canonical
+from app.transforms.hospital_profiles.HOSP_A.outbound import encode_backend, to_backend
+
+_BASE_TIME = datetime(2024, 1, 1)
+
+
+def _sample_raw(index: int) -> dict:
+    measured = (_BASE_TIME + timedelta(seconds=index * 7)).strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "patient_id": f"P{index:06d}",
+        "patient_name": "홍길동",
+        "birthdate": f"19{50 + index % 50}{1 + index % 12:02d}{1 + index % 28:02d}",
+        "age": str(20 + index % 70),
+        "sex": "M" if index % 2 else "F",
+        "ward": " 7A ",
+        "department": "IM",
+        "SBP": str(100 + index % 60),
+        "DBP": str(60 + index % 30),
+        "PR": str(60 + index % 40),
+        "RR": str(12 + index % 10),
+        "BT": f"{36 + index % 20 / 10:.1f}",
+        "SpO2": str(90 + index % 10),
+        "created_at": measured,
+        "updated_at": measured,
+    }
+
+
+def _previous(raw_chunk: list[dict]) -> tuple[list[dict], list[bytes]]:
+    canonical_records = [to_canonical(raw).model_dump() for raw in raw_chunk]
+    encoded = [
+        encode_payload(to_backend(CanonicalPayload(**record)))
+        for record in canonical_records
+    ]
+    return canonical_records, encoded
+
+
+def _per_row(raw_chunk: list[dict]) -> tuple[list[dict], list[bytes]]:
+    payloads = [to_canonical(raw) for raw in raw_chunk]
+    return [payload.model_dump() for payload in payloads], [
+        encode_backend(payload) for payload in payloads
+    ]
+
+
+def _batch(raw_chunk: list[dict]) -> tuple[list[dict], list[bytes]]:
+    return _transform_chunk(raw_chunk, per_record=False)
+
+
+def _per_record_us(
+    func: Callable[[list[dict]], tuple[list[dict], list[bytes]]],
+    raw_chunk: list[dict],
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        # timeit과 같이 측정 중에는 GC를 꺼 결과 객체 수에 따른 편차를 줄임
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.process_time()
+            func(raw_chunk)
+            best = min(best, time.process_time() - started)
+        finally:
+            gc.enable()
+    return best / len(raw_chunk) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw_chunk = [_sample_raw(i) for i in range(args.records)]
+    expected = _previous(raw_chunk)
+    if _per_row(raw_chunk) != expected or _batch(raw_chunk) != expected:
+        raise SystemExit("방식별 결과가 다름")
+    previous = _per_record_us(_previous, raw_chunk, args.repeat)
+    print(f"records={args.records} repeat={args.repeat} (best CPU time)")
+    print(f"previous {previous:8.2f} us/record")
+    for name, func in (("per-row ", _per_row), ("batch   ", _batch)):
+        elapsed = _per_record_us(func, raw_chunk, args.repeat)
+        print(f"{name} {elapsed:8.2f} us/record  speedup={previous / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""로컬 부하 측정용 백엔드 대역 서버
+
+실제 분석 백엔드 대신 단건(`POST /`)과 일괄(`POST /batch`) 엔드포인트를 제공한다.
+`STUB_LATENCY_MS` 환경 변수로 요청당 지연을 흉내 낸다.
+
+    uv run uvicorn tools.stub_backend:app --port 9000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+
+from fastapi import FastAPI, Request
+
+app = FastAPI(title="VTC Link Stub Backend")
+
+_vital_ids = itertools.count(1)
+
+
+def _latency_seconds() -> float:
+    return float(os.environ.get("STUB_LATENCY_MS", "0")) / 1000
+
+
+def _result(payload: dict) -> dict:
+    """페이로드에 대한 가짜 분석 결과를 생성
+
+    Args:
+        payload: 캐노니컬 페이로드
+
+    Returns:
+        백엔드 응답 형식의 결과
+    """
+    patient = payload.get("patient") or {}
+    timestamps = payload.get("timestamps") or {}
+    if not patient.get("patient_id"):
+        return {"error": "patient_id 필요"}
+    return {
+        "vital_id": f"V{next(_vital_ids):08d}",
+        "patient_id": patient.get("patient_id"),
+        "screened_type": "STUB",
+        "screened_date": timestamps.get("created_at", "").replace("Z", ""),
+        "SEPS": 0,
+        "MAES": 0,
+        "MORS": 0,
+        "NEWS": 0,
+        "MEWS": 0,
+        "created_at": timestamps.get("created_at", ""),
+        "updated_at": timestamps.get("updated_at", ""),
+    }
+
+
+@app.post("/")
+async def receive_one(request: Request) -> dict:
+    """단건 페이로드 수신"""
+    payload = await request.json()
+    await asyncio.sleep(_latency_seconds())
+    return _result(payload)
+
+
+@app.post("/batch")
+async def receive_batch(request: Request) -> dict:
+    """일괄 페이로드 수신"""
+    body = await request.json()
+    await asyncio.sleep(_latency_seconds())
+    return {"results": [_result(record) for record in body.get("records", [])]}